@@ -0,0 +1,210 @@
+// Columnar store for benchmark_summary.csv, shared by script.js and csv-worker.js.
+// Numeric columns live in Float64Arrays (NaN = missing), timestamps are epoch
+// milliseconds, and string columns are dictionary-encoded into Int32Array codes
+// (-1 = missing), so filters are integer comparisons instead of string scans.
+
+const NUMERIC_COLUMNS = ['count', 'sum', 'mean', 'min', 'max', 'std', 'variance', 'p25', 'p50', 'p75', 'p90', 'p95', 'p99'];
+const TIME_COLUMNS = ['run_timestamp', 'run_date'];
+const DICTIONARY_COLUMNS = ['model', 'scenario_class', 'metric_name', 'split', 'run', 'run_name', 'name', 'run_kind'];
+
+// Columns that identify a single stat row (mirrors ROW_KEY_COLUMNS in serve.py)
+const ROW_KEY_COLUMNS = ['run', 'run_name', 'name', 'split'];
+
+class ColumnarStore {
+    constructor(capacity = 1024) {
+        this.length = 0;
+        this.capacity = Math.max(capacity, 1);
+        this.numeric = {};
+        this.times = {};
+        this.codes = {};
+        this.dictionaries = {};
+        this.lookups = {};
+        this._rowKeys = null;
+
+        NUMERIC_COLUMNS.forEach(col => { this.numeric[col] = new Float64Array(this.capacity); });
+        TIME_COLUMNS.forEach(col => { this.times[col] = new Float64Array(this.capacity); });
+        DICTIONARY_COLUMNS.forEach(col => {
+            this.codes[col] = new Int32Array(this.capacity);
+            this.dictionaries[col] = [];
+            this.lookups[col] = new Map();
+        });
+    }
+
+    static fromCSV(csvText) {
+        const store = new ColumnarStore();
+        let header = null;
+
+        // csvParseRows with a callback never materializes per-row objects
+        d3.csvParseRows(csvText, (values, i) => {
+            if (i === 0) {
+                header = new Map(values.map((name, j) => [name, j]));
+            } else {
+                store.appendRecord(col => {
+                    const j = header.get(col);
+                    return j === undefined ? undefined : values[j];
+                });
+            }
+            return null;
+        });
+        return store;
+    }
+
+    // Rebuild a store from the message posted by csv-worker.js
+    static fromTransferable(message) {
+        const store = new ColumnarStore(1);
+        store.length = message.length;
+        store.capacity = message.length;
+        store.numeric = message.numeric;
+        store.times = message.times;
+        store.codes = message.codes;
+        store.dictionaries = message.dictionaries;
+        DICTIONARY_COLUMNS.forEach(col => {
+            store.lookups[col] = new Map(store.dictionaries[col].map((value, code) => [value, code]));
+        });
+        return store;
+    }
+
+    // Trimmed copies of every column plus the buffers to transfer with them
+    toTransferable() {
+        const message = { length: this.length, numeric: {}, times: {}, codes: {}, dictionaries: this.dictionaries };
+        const transfer = [];
+        const trim = (target, source) => {
+            Object.entries(source).forEach(([col, array]) => {
+                target[col] = array.slice(0, this.length);
+                transfer.push(target[col].buffer);
+            });
+        };
+        trim(message.numeric, this.numeric);
+        trim(message.times, this.times);
+        trim(message.codes, this.codes);
+        return { message, transfer };
+    }
+
+    encode(col, value) {
+        if (value === undefined || value === null || value === '') return -1;
+        let code = this.lookups[col].get(value);
+        if (code === undefined) {
+            code = this.dictionaries[col].length;
+            this.dictionaries[col].push(value);
+            this.lookups[col].set(value, code);
+        }
+        return code;
+    }
+
+    grow() {
+        this.capacity = Math.max(this.capacity * 2, 1024);
+        const resize = (columns, ArrayType) => {
+            Object.keys(columns).forEach(col => {
+                const array = new ArrayType(this.capacity);
+                array.set(columns[col].subarray(0, this.length));
+                columns[col] = array;
+            });
+        };
+        resize(this.numeric, Float64Array);
+        resize(this.times, Float64Array);
+        resize(this.codes, Int32Array);
+    }
+
+    // Append one row; get(column) returns the raw CSV string (or undefined)
+    appendRecord(get) {
+        if (this.length === this.capacity) this.grow();
+        const i = this.length++;
+
+        NUMERIC_COLUMNS.forEach(col => {
+            const value = get(col);
+            this.numeric[col][i] = value === undefined || value === null || value === '' ? NaN : +value;
+        });
+        TIME_COLUMNS.forEach(col => {
+            const value = get(col);
+            this.times[col][i] = value ? new Date(value).getTime() : NaN;
+        });
+        DICTIONARY_COLUMNS.forEach(col => {
+            let value = get(col);
+            // metric_name might be 'name' in the CSV, and run might be 'run_id'
+            if (col === 'metric_name') value = value || get('name');
+            if (col === 'run') value = get('run_id') || value;
+            // Summaries written before canary probes only have full runs
+            if (col === 'run_kind') value = value || 'full';
+            this.codes[col][i] = this.encode(col, value);
+        });
+
+        if (this._rowKeys) this._rowKeys.add(this.rowKey(i));
+    }
+
+    appendRows(rows) {
+        rows.forEach(row => this.appendRecord(col => row[col]));
+    }
+
+    value(col, i) {
+        const code = this.codes[col][i];
+        return code < 0 ? '' : this.dictionaries[col][code];
+    }
+
+    // Distinct non-empty values of a dictionary column
+    values(col) {
+        return [...this.dictionaries[col]];
+    }
+
+    rowKey(i) {
+        return ROW_KEY_COLUMNS.map(col => this.value(col, i)).join('|');
+    }
+
+    hasRow(row) {
+        if (!this._rowKeys) {
+            this._rowKeys = new Set();
+            for (let i = 0; i < this.length; i++) this._rowKeys.add(this.rowKey(i));
+        }
+        const runValue = row.run_id || row.run;
+        const key = ROW_KEY_COLUMNS.map(col => (col === 'run' ? runValue : row[col]) || '').join('|');
+        return this._rowKeys.has(key);
+    }
+
+    // Indices of rows matching every filter. filters maps a dictionary column to
+    // a value or an array of allowed values; '' / undefined means "no filter".
+    filterIndices(filters) {
+        const checks = [];
+        Object.entries(filters).forEach(([col, wanted]) => {
+            if (wanted === undefined || wanted === null || wanted === '') return;
+            const mask = new Uint8Array(this.dictionaries[col].length);
+            (Array.isArray(wanted) ? wanted : [wanted]).forEach(value => {
+                const code = this.lookups[col].get(value);
+                if (code !== undefined) mask[code] = 1;
+            });
+            checks.push([this.codes[col], mask]);
+        });
+
+        const indices = new Int32Array(this.length);
+        let count = 0;
+        for (let i = 0; i < this.length; i++) {
+            let keep = true;
+            for (let c = 0; c < checks.length; c++) {
+                const code = checks[c][0][i];
+                if (code < 0 || checks[c][1][code] === 0) {
+                    keep = false;
+                    break;
+                }
+            }
+            if (keep) indices[count++] = i;
+        }
+        return indices.subarray(0, count);
+    }
+
+    // Materialize a row object for chart code (only done for filtered subsets)
+    row(i) {
+        const row = {};
+        DICTIONARY_COLUMNS.forEach(col => { row[col] = this.value(col, i); });
+        NUMERIC_COLUMNS.forEach(col => {
+            const value = this.numeric[col][i];
+            if (!Number.isNaN(value)) row[col] = value;
+        });
+        TIME_COLUMNS.forEach(col => {
+            const time = this.times[col][i];
+            row[col] = Number.isNaN(time) ? null : new Date(time);
+        });
+        return row;
+    }
+
+    rows(indices) {
+        return Array.from(indices, i => this.row(i));
+    }
+}
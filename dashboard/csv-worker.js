@@ -0,0 +1,12 @@
+// Parses benchmark_summary.csv into a ColumnarStore off the main thread and
+// transfers the typed-array columns back without copying.
+importScripts('https://cdn.jsdelivr.net/npm/d3-dsv@3', 'columnar.js');
+
+self.onmessage = event => {
+    try {
+        const { message, transfer } = ColumnarStore.fromCSV(event.data.csvText).toTransferable();
+        self.postMessage({ ok: true, store: message }, transfer);
+    } catch (error) {
+        self.postMessage({ ok: false, error: error.message });
+    }
+};
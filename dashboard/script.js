@@ -1,11 +1,26 @@
 // Global variables
-let allData = [];
+let dataStore = null; // ColumnarStore (see columnar.js)
 let isDataLoaded = false;
 
 // Separate data for the two sections
 let allModelsData = [];
 let individualModelData = [];
 
+// Per-(model, hour of day) serving performance from latency_by_hour.csv
+let latencyByHourData = [];
+
+// LTTB-downsampled series from timeseries_lttb.json, keyed "model|scenario|metric"
+let downsampledSeries = {};
+
+// Use the coarsest published level that still shows this many points in the visible range
+const MIN_VISIBLE_POINTS = 200;
+
+// Memoized filtered subsets and chart aggregations, keyed by the selection
+// that produced them (see cached()). Values are shared between charts, so
+// callers must not mutate them.
+const AGGREGATION_CACHE_SIZE = 64;
+const aggregationCache = new Map();
+
 // Dynamic mobile detection functions
 function isMobile() {
     return window.innerWidth <= 768;
@@ -24,15 +39,18 @@ const allModelsElements = {
     providerSelect: document.getElementById('allModelsProviderSelect'),
     metricSelect: document.getElementById('allModelsMetricSelect'),
     scenarioSelect: document.getElementById('allModelsScenarioSelect'),
+    runKindSelect: document.getElementById('allModelsRunKindSelect'),
     timePeriodSelect: document.getElementById('allModelsTimePeriodSelect'),
     varianceMetricSelect: document.getElementById('allModelsVarianceMetricSelect'),
-    varianceViewSelect: document.getElementById('allModelsVarianceViewSelect')
+    varianceViewSelect: document.getElementById('allModelsVarianceViewSelect'),
+    latencyStatSelect: document.getElementById('allModelsLatencyStatSelect')
 };
 
 const individualElements = {
     modelSelect: document.getElementById('individualModelSelect'),
     scenarioSelect: document.getElementById('individualScenarioSelect'),
     metricSelect: document.getElementById('individualMetricSelect'),
+    runKindSelect: document.getElementById('individualRunKindSelect'),
     timePeriodSelect: document.getElementById('individualTimePeriodSelect'),
     rowLimitSelect: document.getElementById('rowLimitSelect')
 };
@@ -190,14 +208,17 @@ function setupEventListeners() {
     allModelsElements.providerSelect.addEventListener('change', updateAllModelsVisualization);
     allModelsElements.metricSelect.addEventListener('change', updateAllModelsVisualization);
     allModelsElements.scenarioSelect.addEventListener('change', updateAllModelsVisualization);
+    allModelsElements.runKindSelect.addEventListener('change', updateAllModelsVisualization);
     allModelsElements.timePeriodSelect.addEventListener('change', updateAllModelsScatterplot);
     allModelsElements.varianceMetricSelect.addEventListener('change', updateVarianceChart);
     allModelsElements.varianceViewSelect.addEventListener('change', updateVarianceChart);
+    allModelsElements.latencyStatSelect.addEventListener('change', updateLatencyChart);
 
     // Individual model section listeners
     individualElements.modelSelect.addEventListener('change', updateIndividualModelVisualization);
     individualElements.scenarioSelect.addEventListener('change', updateIndividualModelVisualization);
     individualElements.metricSelect.addEventListener('change', updateIndividualModelVisualization);
+    individualElements.runKindSelect.addEventListener('change', updateIndividualModelVisualization);
     individualElements.timePeriodSelect.addEventListener('change', updateIndividualScatterplot);
     individualElements.rowLimitSelect.addEventListener('change', updateDataTable);
 }
@@ -235,7 +256,10 @@ async function loadDefaultData() {
             console.log(`Response status: ${response.status}, Content-Type: ${response.headers.get('content-type')}`);
             const csvText = await response.text();
             console.log(`CSV file size: ${csvText.length} characters`);
-            processCSVData(csvText);
+            await processCSVData(csvText);
+            subscribeToUpdates();
+            loadLatencyData();
+            loadDownsampledSeries();
         } else {
             console.log(`❌ Both locations failed. Dashboard: ./benchmark_summary.csv, Results: /results/benchmark_summary.csv`);
             throw new Error('CSV file not found in either dashboard or results directory');
@@ -247,37 +271,176 @@ async function loadDefaultData() {
     }
 }
 
-function processCSVData(csvText) {
-    // Parse CSV using D3
-    allData = d3.csvParse(csvText);
-
-    // Convert numeric columns
-    const numericColumns = ['count', 'sum', 'mean', 'min', 'max', 'std', 'variance', 'p25', 'p50', 'p75', 'p90', 'p95', 'p99'];
-    allData.forEach(row => {
-        // Parse timestamps
-        if (row.run_timestamp) {
-            row.run_timestamp = new Date(row.run_timestamp);
+async function loadLatencyData() {
+    // Same lookup order as the main CSV: dashboard directory, then results/
+    for (const url of ['./latency_by_hour.csv', '/results/latency_by_hour.csv']) {
+        try {
+            const response = await fetch(url);
+            if (!response.ok) continue;
+            latencyByHourData = d3.csvParse(await response.text(), d3.autoType);
+            console.log(`✅ Latency data loaded from: ${url}`);
+            updateLatencyChart();
+            return;
+        } catch (error) {
+            console.log(`Could not load latency data from ${url}:`, error.message);
         }
-        if (row.run_date) {
-            row.run_date = new Date(row.run_date);
+    }
+    updateLatencyChart();
+}
+
+async function loadDownsampledSeries() {
+    // Same lookup order as the main CSV: dashboard directory, then results/
+    for (const url of ['./timeseries_lttb.json', '/results/timeseries_lttb.json']) {
+        try {
+            const response = await fetch(url);
+            if (!response.ok) continue;
+            const published = await response.json();
+            Object.values(published.series).forEach(series => {
+                Object.values(series.levels).forEach(level => {
+                    // Timestamps are local "YYYY-MM-DD HH:MM:SS", like run_timestamp in the CSV
+                    level.x = level.t.map(t => new Date(t.replace(' ', 'T')));
+                    level.times = level.x.map(date => date.getTime());
+                });
+            });
+            downsampledSeries = published.series;
+            console.log(`✅ Downsampled series loaded from: ${url}`);
+            if (isDataLoaded) {
+                updateOverviewChart();
+                if (individualElements.modelSelect.value) updateTimeSeriesChart();
+            }
+            return;
+        } catch (error) {
+            console.log(`Could not load downsampled series from ${url}:`, error.message);
         }
+    }
+}
 
-        // Convert numeric columns
-        numericColumns.forEach(col => {
-            if (row[col] && row[col] !== '') {
-                row[col] = +row[col];
+function getDownsampledSeries(model, scenario, metric, runKind) {
+    // Averages across scenarios are computed in the browser and have no published levels
+    if (scenario === '__AVERAGE__') return null;
+    // Only full runs are published; canary probes are plotted from the raw rows
+    if (runKind !== 'full') return null;
+    return downsampledSeries[[model, scenario, metric].join('|')] || null;
+}
+
+// Points to plot for a trace over the visible range [start, end] (epoch ms,
+// null = everything): a downsampled level if one has enough points there,
+// otherwise the full-resolution series.
+function resolveTracePoints(source, start = null, end = null) {
+    if (source.series) {
+        const levels = Object.keys(source.series.levels).map(Number).sort((a, b) => a - b);
+        for (const level of levels) {
+            const points = source.series.levels[level];
+            const visible = start === null ? points.times.length :
+                points.times.filter(time => time >= start && time <= end).length;
+            if (visible >= MIN_VISIBLE_POINTS) {
+                return { x: points.x, y: points.y, text: points.y.map(source.makeText) };
             }
-        });
+        }
+    }
+    return source.full;
+}
 
-        // Ensure metric_name is set (it might be 'name' in the CSV)
-        if (row.name && !row.metric_name) {
-            row.metric_name = row.name;
+// Swap trace resolution as the user zooms/pans; sources are in trace order
+function enableZoomResolution(chartDiv, sources) {
+    if (!sources.some(source => source.series)) return;
+
+    chartDiv.on('plotly_relayout', event => {
+        let start = null;
+        let end = null;
+        if (event['xaxis.range[0]'] !== undefined) {
+            start = new Date(String(event['xaxis.range[0]']).replace(' ', 'T')).getTime();
+            end = new Date(String(event['xaxis.range[1]']).replace(' ', 'T')).getTime();
+        } else if (!event['xaxis.autorange']) {
+            return;
         }
+
+        const points = sources.map(source => resolveTracePoints(source, start, end));
+        Plotly.restyle(chartDiv, {
+            x: points.map(p => p.x),
+            y: points.map(p => p.y),
+            text: points.map(p => p.text),
+        }, sources.map((_, i) => i));
     });
+}
+
+// Return the cached value for keyParts, computing it on a miss. A Map keeps
+// insertion order, so re-inserting on a hit makes the first key the LRU one.
+function cached(keyParts, compute) {
+    const key = JSON.stringify(keyParts);
+    if (aggregationCache.has(key)) {
+        const value = aggregationCache.get(key);
+        aggregationCache.delete(key);
+        aggregationCache.set(key, value);
+        return value;
+    }
+
+    const value = compute();
+    aggregationCache.set(key, value);
+    if (aggregationCache.size > AGGREGATION_CACHE_SIZE) {
+        aggregationCache.delete(aggregationCache.keys().next().value);
+    }
+    return value;
+}
+
+function allModelsSelection() {
+    return [
+        allModelsElements.providerSelect.value,
+        allModelsElements.metricSelect.value,
+        allModelsElements.scenarioSelect.value,
+        allModelsElements.runKindSelect.value,
+    ];
+}
+
+function individualSelection() {
+    return [
+        individualElements.modelSelect.value,
+        individualElements.metricSelect.value,
+        individualElements.scenarioSelect.value,
+        individualElements.runKindSelect.value,
+    ];
+}
+
+// Parse off the main thread when possible; file:// pages can't start workers
+function parseCSV(csvText) {
+    return new Promise(resolve => {
+        let worker;
+        try {
+            worker = new Worker('csv-worker.js');
+        } catch (error) {
+            console.log('Web Worker unavailable, parsing on the main thread:', error.message);
+            resolve(ColumnarStore.fromCSV(csvText));
+            return;
+        }
+
+        const fallback = reason => {
+            console.log('CSV worker failed, parsing on the main thread:', reason);
+            worker.terminate();
+            resolve(ColumnarStore.fromCSV(csvText));
+        };
+        worker.onmessage = event => {
+            worker.terminate();
+            if (event.data.ok) {
+                resolve(ColumnarStore.fromTransferable(event.data.store));
+            } else {
+                fallback(event.data.error);
+            }
+        };
+        worker.onerror = event => {
+            event.preventDefault();
+            fallback(event.message);
+        };
+        worker.postMessage({ csvText });
+    });
+}
+
+async function processCSVData(csvText) {
+    dataStore = await parseCSV(csvText);
+    aggregationCache.clear();
 
     // Log available columns for debugging
-    console.log('Available columns:', Object.keys(allData[0] || {}));
-    console.log('Sample row:', allData[0]);
+    console.log(`Loaded ${dataStore.length} rows into columnar store`);
+    console.log('Sample row:', dataStore.length ? dataStore.row(0) : undefined);
 
     isDataLoaded = true;
     updateAllFilters();
@@ -289,6 +452,56 @@ function processCSVData(csvText) {
     sharedElements.status.style.display = 'none';
 }
 
+// Live updates: `python dashboard/serve.py --watch` pushes newly extracted rows
+function subscribeToUpdates() {
+    if (!window.EventSource || !location.protocol.startsWith('http')) return;
+
+    const source = new EventSource('/events');
+    source.addEventListener('rows', event => {
+        mergeNewRows(JSON.parse(event.data));
+    });
+    source.onerror = () => {
+        // The static site and the plain dev server have no /events endpoint
+        if (source.readyState === EventSource.CLOSED) {
+            console.log('Live updates unavailable');
+        }
+    };
+}
+
+function mergeNewRows(rows) {
+    if (!dataStore) return;
+
+    const newRows = rows.filter(row => !dataStore.hasRow(row));
+    if (newRows.length === 0) return;
+
+    newRows.forEach(row => {
+        // Ensure metric_name is set (it might be 'name' in the CSV)
+        if (row.name && !row.metric_name) row.metric_name = row.name;
+    });
+    dataStore.appendRows(newRows);
+    aggregationCache.clear();
+    console.log(`Merged ${newRows.length} live rows`);
+
+    updateAllFilters();
+
+    // Only redraw the sections whose current selection the new rows touch
+    const metric = allModelsElements.metricSelect.value;
+    const provider = allModelsElements.providerSelect.value;
+    const touchesAllModels = newRows.some(row =>
+        (row.run_kind || 'full') === allModelsElements.runKindSelect.value &&
+        (!metric || row.metric_name === metric) &&
+        (!provider || extractProvider(row.model) === provider)
+    );
+    const touchesIndividual = newRows.some(row =>
+        (row.run_kind || 'full') === individualElements.runKindSelect.value &&
+        row.model === individualElements.modelSelect.value
+    );
+
+    if (touchesAllModels) updateAllModelsVisualization();
+    if (touchesIndividual) updateIndividualModelVisualization();
+    sharedElements.lastUpdated.textContent = new Date().toLocaleString();
+}
+
 function extractProvider(modelName) {
     if (!modelName || typeof modelName !== 'string') {
         return 'Unknown';
@@ -301,10 +514,11 @@ function extractProvider(modelName) {
 
 function updateAllFilters() {
     // Get unique values for each filter
-    const models = [...new Set(allData.map(d => d.model))].filter(Boolean).sort();
+    // The store's dictionaries already hold each column's distinct values
+    const models = dataStore.values('model').sort();
     const providers = [...new Set(models.map(model => extractProvider(model)))].filter(Boolean).sort();
-    const scenarios = [...new Set(allData.map(d => d.scenario_class))].filter(Boolean).sort();
-    const metrics = [...new Set(allData.map(d => d.metric_name))].filter(Boolean).sort();
+    const scenarios = dataStore.values('scenario_class').sort();
+    const metrics = dataStore.values('metric_name').sort();
 
     // Update all models section options
     updateSelectOptions(allModelsElements.providerSelect, providers, true, false); // Include "All" option for providers
@@ -366,30 +580,25 @@ function updateSelectOptions(selectElement, options, includeAll = false, isScena
 function updateAllModelsVisualization() {
     if (!isDataLoaded) return;
 
-    // Filter data for all models section
-    allModelsData = allData.filter(row => {
-        // Filter by metric
-        if (allModelsElements.metricSelect.value && row.metric_name !== allModelsElements.metricSelect.value) return false;
-
-        // Filter by provider
-        if (allModelsElements.providerSelect.value) {
-            const modelProvider = extractProvider(row.model);
-            if (modelProvider !== allModelsElements.providerSelect.value) return false;
-        }
+    const [provider, metric, scenario, runKind] = allModelsSelection();
+    allModelsData = cached(['allModels', provider, metric, scenario, runKind], () => {
+        // Filter on dictionary codes, then materialize only the matching rows
+        const indices = dataStore.filterIndices({
+            run_kind: runKind,
+            metric_name: metric,
+            model: provider ? dataStore.values('model').filter(model => extractProvider(model) === provider) : '',
+            scenario_class: scenario === '__AVERAGE__' ? '' : scenario,
+        });
+        const rows = dataStore.rows(indices);
 
-        return true;
+        // Handle scenario averaging
+        return scenario === '__AVERAGE__' ? calculateAllModelsScenarioAverages(rows) : rows;
     });
 
-    // Handle scenario filtering/averaging
-    if (allModelsElements.scenarioSelect.value === '__AVERAGE__') {
-        allModelsData = calculateAllModelsScenarioAverages(allModelsData);
-    } else if (allModelsElements.scenarioSelect.value) {
-        allModelsData = allModelsData.filter(row => row.scenario_class === allModelsElements.scenarioSelect.value);
-    }
-
     updateOverviewChart();
     updateAllModelsScatterplot();
     updateVarianceChart();
+    updateLatencyChart();
 }
 
 function updateIndividualModelVisualization() {
@@ -402,18 +611,19 @@ function updateIndividualModelVisualization() {
     }
 
     // Filter data for individual model section
-    individualModelData = allData.filter(row => {
-        if (row.model !== individualElements.modelSelect.value) return false;
-        if (individualElements.metricSelect.value && row.metric_name !== individualElements.metricSelect.value) return false;
-        return true;
-    });
+    const [model, metric, scenario, runKind] = individualSelection();
+    individualModelData = cached(['individual', model, metric, scenario, runKind], () => {
+        const indices = dataStore.filterIndices({
+            run_kind: runKind,
+            model: model,
+            metric_name: metric,
+            scenario_class: scenario === '__AVERAGE__' ? '' : scenario,
+        });
+        const rows = dataStore.rows(indices);
 
-    // Handle scenario filtering/averaging
-    if (individualElements.scenarioSelect.value === '__AVERAGE__') {
-        individualModelData = calculateIndividualModelScenarioAverages(individualModelData);
-    } else if (individualElements.scenarioSelect.value) {
-        individualModelData = individualModelData.filter(row => row.scenario_class === individualElements.scenarioSelect.value);
-    }
+        // Handle scenario averaging
+        return scenario === '__AVERAGE__' ? calculateIndividualModelScenarioAverages(rows) : rows;
+    });
 
     updateTimeSeriesChart();
     updateIndividualScatterplot();
@@ -470,10 +680,9 @@ function calculateAllModelsScenarioAverages(data) {
         }
 
         // Calculate averages across scenarios for each numeric metric
-        const numericColumns = ['count', 'sum', 'mean', 'min', 'max', 'std', 'variance', 'p25', 'p50', 'p75', 'p90', 'p95', 'p99'];
         const averages = {};
 
-        numericColumns.forEach(col => {
+        NUMERIC_COLUMNS.forEach(col => {
             const values = group.map(d => d[col]).filter(v => v !== undefined && v !== null && !isNaN(v));
             if (values.length > 0) {
                 averages[col] = d3.mean(values);
@@ -522,15 +731,16 @@ function updateOverviewChart() {
         [...new Set(allModelsData.map(d => d.scenario_class))].filter(Boolean).length;
 
     // Group by model and timestamp to handle multiple points per timestamp
-    const modelTimestampGroups = d3.group(allModelsData,
+    const modelTimestampGroups = cached(['overviewGroups', ...allModelsSelection()], () => d3.group(allModelsData,
         d => d.model,
         d => d.run_timestamp ? d.run_timestamp.getTime() : 0
-    );
+    ));
 
     const colors = ['#667eea', '#48bb78', '#ed8936', '#e53e3e', '#9f7aea', '#38b2ac', '#d69e2e', '#805ad5', '#dd6b20'];
     let colorIndex = 0;
 
     const traces = [];
+    const resolutionSources = [];
     modelTimestampGroups.forEach((timestampGroups, modelName) => {
         // First pass: find the maximum number of data points for this model
         let maxDataPoints = 0;
@@ -568,11 +778,18 @@ function updateOverviewChart() {
 
         if (processedData.length > 0) {
             const color = colors[colorIndex % colors.length];
-            const x = processedData.map(d => d.timestamp);
-            const y = processedData.map(d => d.mean);
-            const text = processedData.map(d =>
-                `${modelName}<br>Mean: ${d.mean.toFixed(4)}`
-            );
+            const makeText = mean => `${modelName}<br>Mean: ${mean.toFixed(4)}`;
+            const source = {
+                series: getDownsampledSeries(modelName, allModelsElements.scenarioSelect.value, allModelsElements.metricSelect.value, allModelsElements.runKindSelect.value),
+                full: {
+                    x: processedData.map(d => d.timestamp),
+                    y: processedData.map(d => d.mean),
+                    text: processedData.map(d => makeText(d.mean)),
+                },
+                makeText: makeText,
+            };
+            const { x, y, text } = resolveTracePoints(source);
+            resolutionSources.push(source);
 
             traces.push({
                 x: x,
@@ -625,6 +842,8 @@ function updateOverviewChart() {
     chartDiv.innerHTML = '';
 
     Plotly.newPlot(chartDiv, traces, mobileLayout, config).then(() => {
+        enableZoomResolution(chartDiv, resolutionSources);
+
         // Force resize after plot is ready
         if (isMobile()) {
             setTimeout(() => {
@@ -647,9 +866,9 @@ function updateTimeSeriesChart() {
     const titleSuffix = isAveraging ? ' (across scenarios)' : '';
 
     // Group by timestamp to handle multiple points per timestamp
-    const timestampGroups = d3.group(individualModelData,
+    const timestampGroups = cached(['timeSeriesGroups', ...individualSelection()], () => d3.group(individualModelData,
         d => d.run_timestamp ? d.run_timestamp.getTime() : 0
-    );
+    ));
 
     // First pass: find the maximum number of data points across all timestamps
     let maxDataPoints = 0;
@@ -684,15 +903,23 @@ function updateTimeSeriesChart() {
     // Sort by timestamp
     processedData.sort((a, b) => a.timestamp - b.timestamp);
 
-    const x = processedData.map(d => d.timestamp);
-    const y = processedData.map(d => d.mean);
-    const text = processedData.map(d => {
-        if (isAveraging) {
-            return `Mean: ${d.mean.toFixed(4)}`;
-        } else {
-            return `Scenario: ${d.scenarios}<br>Mean: ${d.mean.toFixed(4)}`;
-        }
-    });
+    const scenarioLabel = individualElements.scenarioSelect.value || 'All scenarios';
+    const source = {
+        series: getDownsampledSeries(individualElements.modelSelect.value, individualElements.scenarioSelect.value, individualElements.metricSelect.value, individualElements.runKindSelect.value),
+        full: {
+            x: processedData.map(d => d.timestamp),
+            y: processedData.map(d => d.mean),
+            text: processedData.map(d => {
+                if (isAveraging) {
+                    return `Mean: ${d.mean.toFixed(4)}`;
+                } else {
+                    return `Scenario: ${d.scenarios}<br>Mean: ${d.mean.toFixed(4)}`;
+                }
+            }),
+        },
+        makeText: mean => `Scenario: ${scenarioLabel}<br>Mean: ${mean.toFixed(4)}`,
+    };
+    const { x, y, text } = resolveTracePoints(source);
 
     const traces = [{
         x: x,
@@ -733,6 +960,8 @@ function updateTimeSeriesChart() {
     chartDiv.innerHTML = '';
 
     Plotly.newPlot(chartDiv, traces, mobileLayout, config).then(() => {
+        enableZoomResolution(chartDiv, [source]);
+
         // Force resize after plot is ready
         if (isMobile()) {
             setTimeout(() => {
@@ -846,12 +1075,12 @@ function updateComparisonChart() {
     }
 
     // Group data by date instead of by run_id
-    const dateGroups = d3.group(individualModelData, d => {
+    const dateGroups = cached(['comparisonGroups', ...individualSelection()], () => d3.group(individualModelData, d => {
         if (d.run_date) {
             return d.run_date.toDateString(); // Group by date string
         }
         return 'Unknown Date';
-    });
+    }));
 
     // Get the last 7 days for comparison
     const sortedDays = Array.from(dateGroups.entries())
@@ -1021,7 +1250,8 @@ function updateAllModelsScatterplot() {
     }
 
     const timePeriod = allModelsElements.timePeriodSelect.value;
-    const processedData = processDataForScatterplot(allModelsData, timePeriod);
+    const processedData = cached(['allModelsScatter', ...allModelsSelection(), timePeriod],
+        () => processDataForScatterplot(allModelsData, timePeriod));
 
     if (processedData.length === 0) {
         chartDiv.innerHTML = '<div class="empty-state"><h3>No data to display</h3><p>No matching data found for the selected filters.</p></div>';
@@ -1132,7 +1362,8 @@ function updateIndividualScatterplot() {
     }
 
     const timePeriod = individualElements.timePeriodSelect.value;
-    const processedData = processDataForScatterplot(individualModelData, timePeriod);
+    const processedData = cached(['individualScatter', ...individualSelection(), timePeriod],
+        () => processDataForScatterplot(individualModelData, timePeriod));
 
     if (processedData.length === 0) {
         chartDiv.innerHTML = '<div class="empty-state"><h3>No data to display</h3><p>No matching data found for the selected filters.</p></div>';
@@ -1291,7 +1522,8 @@ function updateVarianceChart() {
     let traces = [];
 
     if (viewType === 'overall') {
-        chartData = calculateOverallVarianceData(allModelsData, varianceMetric);
+        chartData = cached(['variance', ...allModelsSelection(), varianceMetric, viewType],
+            () => calculateOverallVarianceData(allModelsData, varianceMetric));
         chartTitle = `Overall Model Consistency (${getVarianceMetricLabel(varianceMetric)})`;
         yAxisLabel = getVarianceMetricLabel(varianceMetric);
 
@@ -1312,7 +1544,8 @@ function updateVarianceChart() {
             }
         }];
     } else if (viewType === 'daily') {
-        chartData = calculateDailyVarianceData(allModelsData, varianceMetric);
+        chartData = cached(['variance', ...allModelsSelection(), varianceMetric, viewType],
+            () => calculateDailyVarianceData(allModelsData, varianceMetric));
         chartTitle = `Daily Model Consistency Over Time (${getVarianceMetricLabel(varianceMetric)})`;
         yAxisLabel = getVarianceMetricLabel(varianceMetric);
 
@@ -1339,7 +1572,8 @@ function updateVarianceChart() {
             });
         });
     } else if (viewType === 'weekly') {
-        chartData = calculateWeeklyVarianceData(allModelsData, varianceMetric);
+        chartData = cached(['variance', ...allModelsSelection(), varianceMetric, viewType],
+            () => calculateWeeklyVarianceData(allModelsData, varianceMetric));
         chartTitle = `Weekly Model Consistency Over Time (${getVarianceMetricLabel(varianceMetric)})`;
         yAxisLabel = getVarianceMetricLabel(varianceMetric);
 
@@ -1629,3 +1863,77 @@ function calculateWeeklyVarianceData(data, metric) {
 
     return allModels;
 }
+
+function updateLatencyChart() {
+    const chartDiv = document.getElementById('allModelsLatencyChart');
+    const stat = allModelsElements.latencyStatSelect.value;
+    const statLabel = allModelsElements.latencyStatSelect.selectedOptions[0].textContent;
+    const provider = allModelsElements.providerSelect.value;
+
+    const data = latencyByHourData.filter(row =>
+        !provider || extractProvider(row.model) === provider
+    );
+
+    if (data.length === 0) {
+        chartDiv.innerHTML = '<div class="empty-state"><h3>No serving data</h3><p>Run "daily-bench extract" to generate latency_by_hour.csv.</p></div>';
+        return;
+    }
+
+    const colors = ['#667eea', '#48bb78', '#ed8936', '#e53e3e', '#9f7aea', '#38b2ac', '#d69e2e', '#805ad5', '#dd6b20'];
+    const traces = [];
+    d3.group(data, d => d.model).forEach((modelData, modelName) => {
+        const color = colors[traces.length % colors.length];
+        const sorted = [...modelData].sort((a, b) => a.run_hour - b.run_hour);
+
+        traces.push({
+            x: sorted.map(d => d.run_hour),
+            y: sorted.map(d => d[stat]),
+            text: sorted.map(d =>
+                `${modelName}<br>Hour: ${d.run_hour}:00<br>${statLabel}: ${(+d[stat]).toFixed(4)}<br>Runs: ${d.num_runs}`
+            ),
+            mode: 'lines+markers',
+            type: 'scatter',
+            name: modelName,
+            line: { color: color, width: isMobile() ? 2 : 3 },
+            marker: { color: color, size: isMobile() ? 5 : 8 }
+        });
+    });
+
+    const providerInfo = provider ? ` (${provider} models)` : '';
+    const layout = {
+        title: {
+            text: `${statLabel} by Hour of Day${providerInfo}`,
+            x: 0.5,
+            font: { size: 16 }
+        },
+        xaxis: {
+            title: 'Time of Day (Hours)',
+            type: 'linear',
+            range: [0, 24],
+            tickmode: 'linear',
+            tick0: 0,
+            dtick: isMobile() ? 6 : 4
+        },
+        yaxis: {
+            title: statLabel
+        },
+        plot_bgcolor: '#f8f9fa',
+        paper_bgcolor: 'white',
+        showlegend: true
+    };
+
+    const mobileLayout = getMobileLayout(layout);
+    const config = getMobileConfig();
+
+    // Clear the div first to ensure proper redraw
+    chartDiv.innerHTML = '';
+
+    Plotly.newPlot(chartDiv, traces, mobileLayout, config).then(() => {
+        // Force resize after plot is ready
+        if (isMobile()) {
+            setTimeout(() => {
+                Plotly.Plots.resize(chartDiv);
+            }, 100);
+        }
+    });
+}
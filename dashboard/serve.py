@@ -2,21 +2,144 @@
 """
 Simple development server for the Daily Bench Dashboard.
 Run this script to serve the dashboard locally for testing.
+
+With --watch, the server polls the results CSV and pushes newly extracted
+rows to connected dashboards over Server-Sent Events at /events.
 """
 
+import argparse
+import csv
 import http.server
+import json
 import os
-import socketserver
+import queue
 import sys
+import threading
+import time
 import webbrowser
 from pathlib import Path
+from typing import Any, Optional
 
 PORT = 8000
+WATCH_INTERVAL_SECONDS = 2.0
+HEARTBEAT_SECONDS = 15.0
+
+# Columns that identify a single stat row across re-extractions
+ROW_KEY_COLUMNS = ("run", "run_name", "name", "split")
+
+
+def row_key(row: dict[str, str]) -> tuple:
+    """Build the identity key for a CSV row (falls back to the full row)."""
+    if all(col in row for col in ROW_KEY_COLUMNS):
+        return tuple(row[col] for col in ROW_KEY_COLUMNS)
+    return tuple(sorted(row.items()))
+
+
+def is_complete(row: dict[str, str]) -> bool:
+    """Whether a DictReader row has exactly one value per header field."""
+    return None not in row and all(value is not None for value in row.values())
+
+
+class SummaryWatcher:
+    """Poll the summary CSV and broadcast rows that were not seen before."""
+
+    def __init__(self, csv_path: Path, interval: float = WATCH_INTERVAL_SECONDS):
+        self.csv_path = csv_path
+        self.interval = interval
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._signature: Optional[tuple[int, int]] = None
+        self._seen_keys: set[tuple] = set()
+
+    def _stat_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self.csv_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_rows(self) -> list[dict[str, str]]:
+        with self.csv_path.open(newline="") as f:
+            return list(csv.DictReader(f))
+
+    def prime(self) -> None:
+        """Record the current CSV contents as already published."""
+        self._signature = self._stat_signature()
+        if self._signature is not None:
+            self._seen_keys = {
+                row_key(row) for row in self._read_rows() if is_complete(row)
+            }
+
+    def poll_once(self) -> list[dict[str, str]]:
+        """Return rows added since the last poll (empty if nothing changed)."""
+        signature = self._stat_signature()
+        if signature is None or signature == self._signature:
+            return []
+
+        try:
+            rows = self._read_rows()
+        except (OSError, csv.Error) as e:
+            # The extractor may still be writing; try again on the next poll
+            print(f"Watcher: could not read {self.csv_path}: {e}")
+            return []
+
+        # A row cut short by a concurrent write has None for its missing
+        # fields; skip it and re-read on the next poll instead of publishing it
+        complete = [row for row in rows if is_complete(row)]
+        if len(complete) == len(rows):
+            self._signature = signature
+        else:
+            print(f"Watcher: skipping {len(rows) - len(complete)} incomplete rows")
+
+        delta = []
+        for row in complete:
+            key = row_key(row)
+            if key not in self._seen_keys:
+                self._seen_keys.add(key)
+                delta.append(row)
+        return delta
+
+    def subscribe(self) -> queue.Queue:
+        """Register a new client queue for pushed rows."""
+        subscriber: queue.Queue = queue.Queue()
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        """Remove a client queue once its stream closes."""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def broadcast(self, rows: list[dict[str, Any]]) -> None:
+        """Send a batch of new rows to every connected client."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.put(rows)
+
+    def run_forever(self) -> None:
+        """Poll the CSV until the process exits."""
+        self.prime()
+        while True:
+            time.sleep(self.interval)
+            delta = self.poll_once()
+            if delta:
+                print(f"Watcher: pushing {len(delta)} new rows to dashboards")
+                self.broadcast(delta)
+
+    def start(self) -> None:
+        """Start polling in a background daemon thread."""
+        thread = threading.Thread(target=self.run_forever, daemon=True)
+        thread.start()
 
 
 class DashboardHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler to serve dashboard files and redirect root to dashboard."""
 
+    # Set by main() when --watch is enabled
+    watcher: Optional[SummaryWatcher] = None
+
     def end_headers(self):
         """Add CORS headers for local development."""
         self.send_header("Access-Control-Allow-Origin", "*")
@@ -26,6 +149,9 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_GET(self):
         """Redirect root to dashboard."""
+        if self.path == "/events":
+            return self.stream_events()
+
         if self.path == "/":
             self.path = "/dashboard/"
         elif self.path == "/dashboard" or self.path == "/dashboard/":
@@ -33,9 +159,50 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
 
         return super().do_GET()
 
+    def stream_events(self):
+        """Stream newly extracted rows to the client as Server-Sent Events."""
+        if self.watcher is None:
+            self.send_error(404, "Live updates are disabled (start with --watch)")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+
+        subscriber = self.watcher.subscribe()
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    rows = subscriber.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    # Comment line keeps proxies from closing an idle stream
+                    self.wfile.write(b": heartbeat\n\n")
+                else:
+                    payload = json.dumps(rows)
+                    self.wfile.write(f"event: rows\ndata: {payload}\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.watcher.unsubscribe(subscriber)
+
 
 def main():
     """Start the development server."""
+    parser = argparse.ArgumentParser(description="Serve the Daily Bench dashboard")
+    parser.add_argument("--port", type=int, default=PORT, help="Port to serve on")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Push newly extracted rows to open dashboards via Server-Sent Events",
+    )
+    args = parser.parse_args()
+    port = args.port
+
     # Get the project root (parent of dashboard directory)
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -65,17 +232,23 @@ def main():
         print(f"⚠ No benchmark data found at {sample_csv}")
         print("Run 'daily-bench extract' to generate the data file.")
 
+    if args.watch:
+        DashboardHandler.watcher = SummaryWatcher(sample_csv)
+        DashboardHandler.watcher.start()
+        print(f"✓ Watching {sample_csv} for new rows (live updates at /events)")
+
     try:
-        with socketserver.TCPServer(("", PORT), DashboardHandler) as httpd:
+        # Threaded so long-lived /events streams don't block file requests
+        with http.server.ThreadingHTTPServer(("", port), DashboardHandler) as httpd:
             print("\nDaily Bench Dashboard development server starting...")
-            print(f"Serving at: http://localhost:{PORT}")
-            print(f"Dashboard URL: http://localhost:{PORT}/dashboard/")
+            print(f"Serving at: http://localhost:{port}")
+            print(f"Dashboard URL: http://localhost:{port}/dashboard/")
             print(f"Project root: {project_root}")
             print("\nPress Ctrl+C to stop the server")
 
             # Try to open the browser automatically
             try:
-                webbrowser.open(f"http://localhost:{PORT}/dashboard/")
+                webbrowser.open(f"http://localhost:{port}/dashboard/")
                 print("Opening dashboard in your default browser...")
             except Exception:
                 print(
@@ -89,7 +262,7 @@ def main():
         print("\nServer stopped by user")
     except OSError as e:
         if e.errno == 48:  # Address already in use
-            print(f"Error: Port {PORT} is already in use")
+            print(f"Error: Port {port} is already in use")
             print("Try stopping other web servers or use a different port")
         else:
             print(f"Error starting server: {e}")
@@ -0,0 +1,331 @@
+"""
+Read HELM run files straight out of .zip and .tar(.gz) archives.
+
+Historical suites are kept as zipped CI artifacts and tarballs of
+benchmark_output/runs. Rather than unpacking them, the extractor's file
+access goes through find_files(), which yields ArchivePath members for an
+archive root. ArchivePath implements the part of pathlib.Path the
+harvesters use (name, parent, /, exists(), read_bytes(), rglob()), so
+`stats_path.parent / "run_spec.json"` works the same inside an archive.
+
+Suites compacted by `daily-bench compact` are SUITE.zip archives inside a
+run root; find_suite_archives() lists them so directory roots cover them too,
+and walk_run_root() finds them in the same walk as the loose run files.
+
+Zips are read by random access through their central directory. Tarballs
+have no index, so each find_files() call is one sequential pass over the
+stream: the wanted members of a run directory (and its SIDECAR_FILES) are
+read into memory, handed out while the caller is on that directory, and
+dropped when the stream moves on. Nothing is written to disk.
+"""
+
+import abc
+import os
+import tarfile
+import zipfile
+from collections import OrderedDict
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator, Optional
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+# Suites compacted by `daily-bench compact` are stored as SUITE.zip
+SUITE_ARCHIVE_SUFFIX = ".zip"
+
+# Files the harvesters read next to the one they are walking
+SIDECAR_FILES = ("run_spec.json",)
+
+ROOT = PurePosixPath(".")
+
+
+def is_archive(path: str | Path) -> bool:
+    """Whether *path* is an archive file find_files() can read."""
+    path = Path(path)
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES) and path.is_file()
+
+
+def find_suite_archives(root: str | Path) -> list[Path]:
+    """
+    Compacted SUITE.zip archives under the directory *root*.
+
+    An archive whose suite directory still exists (compaction was
+    interrupted before the directory was removed) is skipped; the directory
+    is read instead.
+    """
+    return _suite_archives(Path(root).rglob("*" + SUITE_ARCHIVE_SUFFIX))
+
+
+def walk_run_root(root: str | Path, file_name: str) -> tuple[list[Path], list[Path]]:
+    """
+    Files named *file_name* and compacted suite archives under the directory
+    *root*, found in a single walk.
+
+    Returns:
+        (files in walk order, suite archives as from find_suite_archives())
+    """
+    files = []
+    candidates = []
+    for directory, _, file_names in os.walk(root):
+        for name in file_names:
+            if name == file_name:
+                files.append(Path(directory, name))
+            elif name.endswith(SUITE_ARCHIVE_SUFFIX):
+                candidates.append(Path(directory, name))
+    return files, _suite_archives(candidates)
+
+
+def _suite_archives(candidates: Iterable[Path]) -> list[Path]:
+    return [
+        path
+        for path in sorted(candidates)
+        if path.is_file() and not path.with_name(path.stem).is_dir()
+    ]
+
+
+class ArchivePath:
+    """A member (or directory) inside a run archive."""
+
+    def __init__(self, archive: "RunArchive", member: PurePosixPath = ROOT):
+        self.archive = archive
+        self.member = member
+
+    @property
+    def name(self) -> str:
+        return self.member.name
+
+    @property
+    def parent(self) -> "ArchivePath":
+        return ArchivePath(self.archive, self.member.parent)
+
+    def __truediv__(self, other: str) -> "ArchivePath":
+        return ArchivePath(self.archive, self.member / other)
+
+    def __str__(self) -> str:
+        return f"{self.archive.path}!/{self.member}"
+
+    def __repr__(self) -> str:
+        return f"ArchivePath({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ArchivePath)
+            and other.archive.path == self.archive.path
+            and other.member == self.member
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.archive.path, self.member))
+
+    def exists(self) -> bool:
+        return self.archive.exists(self.member)
+
+    def read_bytes(self) -> bytes:
+        return self.archive.read_bytes(self.member)
+
+    def size(self) -> int:
+        """Uncompressed size of the member."""
+        return self.archive.sizes()[self.member]
+
+    def rglob(self, file_name: str) -> Iterator["ArchivePath"]:
+        """Members named *file_name* below this one (exact names only)."""
+        for member in self.archive.sizes():
+            if member.name == file_name and _is_under(member, [self.member]):
+                yield ArchivePath(self.archive, member)
+
+
+def _is_under(member: PurePosixPath, prefixes: Iterable[PurePosixPath]) -> bool:
+    return any(prefix == ROOT or prefix in member.parents for prefix in prefixes)
+
+
+class RunArchive(abc.ABC):
+    """Read access to one archive file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._sizes: Optional[dict[PurePosixPath, int]] = None
+
+    def sizes(self) -> dict[PurePosixPath, int]:
+        """Uncompressed size of every file member."""
+        if self._sizes is None:
+            self._sizes = self._read_sizes()
+        return self._sizes
+
+    @abc.abstractmethod
+    def _read_sizes(self) -> dict[PurePosixPath, int]:
+        """Read the size of every file member from the archive."""
+
+    def exists(self, member: PurePosixPath) -> bool:
+        sizes = self.sizes()
+        return member in sizes or any(member in name.parents for name in sizes)
+
+    @abc.abstractmethod
+    def read_bytes(self, member: PurePosixPath) -> bytes:
+        """Contents of a file member."""
+
+    @abc.abstractmethod
+    def find(
+        self, file_name: str, under: Iterable[PurePosixPath] = (ROOT,)
+    ) -> Iterator[ArchivePath]:
+        """Members named *file_name* below any of *under*, in archive order."""
+
+    def close(self) -> None:
+        """Release any open file handle."""
+
+
+# Zip files held open at once; a compacted history has one zip per suite
+MAX_OPEN_ZIPS = 16
+
+_open_zips: "OrderedDict[Path, zipfile.ZipFile]" = OrderedDict()
+
+
+class ZipRunArchive(RunArchive):
+    """Zip archive, read by random access."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._infos: Optional[list[zipfile.ZipInfo]] = None
+
+    def _zip(self) -> zipfile.ZipFile:
+        """Open handle of the zip, closing the least recently used beyond MAX_OPEN_ZIPS."""
+        handle = _open_zips.pop(self.path, None) or zipfile.ZipFile(self.path)
+        _open_zips[self.path] = handle
+        while len(_open_zips) > MAX_OPEN_ZIPS:
+            _open_zips.popitem(last=False)[1].close()
+        return handle
+
+    def infos(self) -> list[zipfile.ZipInfo]:
+        """The zip's central directory (file entries only)."""
+        if self._infos is None:
+            self._infos = [info for info in self._zip().infolist() if not info.is_dir()]
+        return self._infos
+
+    def _read_sizes(self) -> dict[PurePosixPath, int]:
+        return {PurePosixPath(info.filename): info.file_size for info in self.infos()}
+
+    def read_bytes(self, member: PurePosixPath) -> bytes:
+        try:
+            return self._zip().read(str(member))
+        except KeyError:
+            raise FileNotFoundError(f"{self.path}!/{member}") from None
+
+    def find(
+        self, file_name: str, under: Iterable[PurePosixPath] = (ROOT,)
+    ) -> Iterator[ArchivePath]:
+        under = list(under)
+        for info in self.infos():
+            member = PurePosixPath(info.filename)
+            if member.name == file_name and _is_under(member, under):
+                yield ArchivePath(self, member)
+
+    def close(self) -> None:
+        handle = _open_zips.pop(self.path, None)
+        if handle is not None:
+            handle.close()
+
+
+class TarRunArchive(RunArchive):
+    """Tarball, read as a stream in a single sequential pass per find()."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        # Members of the run directory the current find() pass is on
+        self._buffer: dict[PurePosixPath, bytes] = {}
+
+    def _read_sizes(self) -> dict[PurePosixPath, int]:
+        with tarfile.open(self.path, "r|*") as tar:
+            return {
+                PurePosixPath(member.name): member.size
+                for member in tar
+                if member.isfile()
+            }
+
+    def exists(self, member: PurePosixPath) -> bool:
+        return member in self._buffer or super().exists(member)
+
+    def read_bytes(self, member: PurePosixPath) -> bytes:
+        data = self._buffer.get(member)
+        if data is not None:
+            return data
+        # Not on the current pass (e.g. a member stored away from its
+        # directory): seek for it, which re-reads a compressed stream
+        with tarfile.open(self.path, "r:*") as tar:
+            try:
+                f = tar.extractfile(str(member))
+            except KeyError:
+                f = None
+            if f is None:
+                raise FileNotFoundError(f"{self.path}!/{member}")
+            return f.read()
+
+    def find(
+        self, file_name: str, under: Iterable[PurePosixPath] = (ROOT,)
+    ) -> Iterator[ArchivePath]:
+        under = list(under)
+        wanted = {file_name, *SIDECAR_FILES}
+        directory: Optional[PurePosixPath] = None
+        found: list[PurePosixPath] = []
+        with tarfile.open(self.path, "r|*") as tar:
+            for info in tar:
+                member = PurePosixPath(info.name)
+                if (
+                    not info.isfile()
+                    or member.name not in wanted
+                    or not _is_under(member, under)
+                ):
+                    continue
+                if member.parent != directory:
+                    yield from (ArchivePath(self, path) for path in found)
+                    self._buffer = {}
+                    directory, found = member.parent, []
+                f = tar.extractfile(info)
+                self._buffer[member] = f.read() if f is not None else b""
+                if member.name == file_name:
+                    found.append(member)
+            yield from (ArchivePath(self, path) for path in found)
+        self._buffer = {}
+
+
+# Archive readers (with their member listings) kept for reuse
+MAX_CACHED_ARCHIVES = 64
+
+_archives: "OrderedDict[Path, RunArchive]" = OrderedDict()
+
+
+def open_archive(path: Path) -> RunArchive:
+    """
+    Archive reader for *path*, shared by lookups in the process; the least
+    recently used beyond MAX_CACHED_ARCHIVES are closed and dropped.
+    """
+    archive = _archives.pop(path, None)
+    if archive is None:
+        if path.name.lower().endswith(".zip"):
+            archive = ZipRunArchive(path)
+        else:
+            archive = TarRunArchive(path)
+    _archives[path] = archive
+    while len(_archives) > MAX_CACHED_ARCHIVES:
+        _archives.popitem(last=False)[1].close()
+    return archive
+
+
+def find_files(
+    roots: str | Path | ArchivePath | Iterable[str | Path | ArchivePath],
+    file_name: str,
+) -> Iterator[ArchivePath]:
+    """
+    Members named *file_name* under archive roots.
+
+    Args:
+        roots: archive files, or ArchivePath directories inside them; several
+            roots in the same archive are found in one pass
+        file_name: exact member name, e.g. 'stats.json'
+    """
+    if isinstance(roots, (str, Path, ArchivePath)):
+        roots = [roots]
+    prefixes: dict[RunArchive, list[PurePosixPath]] = {}
+    for root in roots:
+        if not isinstance(root, ArchivePath):
+            root = ArchivePath(open_archive(Path(root).resolve()))
+        prefixes.setdefault(root.archive, []).append(root.member)
+    for archive, under in prefixes.items():
+        yield from archive.find(file_name, under)
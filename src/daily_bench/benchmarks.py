@@ -0,0 +1,328 @@
+"""
+Performance benchmarks for the extractor on synthetic benchmark output.
+
+Times and memory-profiles the extraction entry points and each harvester,
+then compares against a stored baseline so regressions fail loudly. Also
+checks the CLI's cold-start import time against a fixed budget.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from daily_bench import extractor, synthetic
+
+# Recorded at DEFAULT_SCALE; lives at the repository root, next to pyproject.toml
+DEFAULT_BASELINE_PATH = Path(__file__).parents[2] / "benchmarks" / "baseline.json"
+
+# Scale of `daily-bench bench` (and of the committed baseline)
+DEFAULT_SCALE: synthetic.Scale = {
+    "num_models": 5,
+    "num_scenarios": 4,
+    "days": 2,
+    "runs_per_day": 4,
+    "num_instances": 50,
+}
+
+# A run is a regression when it exceeds the baseline by these factors
+TIME_TOLERANCE = 1.5
+MEMORY_TOLERANCE = 1.25
+
+# Absolute slack so sub-millisecond noise on tiny benchmarks isn't flagged
+MIN_REGRESSION = {"seconds": 0.05, "peak_mb": 1.0}
+
+# Total import time allowed for `daily-bench --version`, interpreter startup
+# modules included (pandas alone costs several times this)
+STARTUP_BUDGET_MS = 150.0
+
+# Modules the CLI must not import before a subcommand asks for them
+HEAVY_MODULES = ("pandas", "numpy")
+
+# Commands that must stay on the fast path
+STARTUP_COMMANDS = (["--version"], ["status"])
+
+
+def _extract_full(root: Path, workdir: Path) -> None:
+    extractor.extract_results(root, workdir / "full.csv")
+
+
+def _extract_incremental_cold(root: Path, workdir: Path) -> None:
+    output_path = workdir / "incremental.csv"
+    output_path.unlink(missing_ok=True)
+    extractor.extract_results_incremental(root, output_path)
+
+
+def _extract_incremental_noop(root: Path, workdir: Path) -> None:
+    # After the warm-up run there is nothing new to ingest, so this measures
+    # the load-and-analyze overhead
+    extractor.extract_results_incremental(root, workdir / "noop.csv")
+
+
+def _harvester(func: Callable[[Path], Any]) -> Callable[[Path, Path], None]:
+    def run(root: Path, workdir: Path) -> None:
+        func(root)
+
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[Path, Path], None]] = {
+    "extract_results": _extract_full,
+    "extract_results_incremental": _extract_incremental_cold,
+    "extract_results_incremental_noop": _extract_incremental_noop,
+    "harvest_helm_stats": _harvester(extractor.harvest_helm_stats),
+    "harvest_run_specs": _harvester(extractor.harvest_run_specs),
+    "harvest_instances": _harvester(extractor.harvest_instances),
+    "harvest_per_instance_stats": _harvester(extractor.harvest_per_instance_stats),
+    "harvest_scenario_metadata": _harvester(extractor.harvest_scenario_metadata),
+    "harvest_scenario_state": _harvester(extractor.harvest_scenario_state),
+}
+
+
+def measure(
+    func: Callable[[Path, Path], None], root: Path, workdir: Path, repeat: int = 3
+) -> dict[str, float]:
+    """
+    Time a benchmark (best of *repeat*) and record its peak traced memory.
+
+    A warm-up run primes the file cache (and any benchmark setup), timing
+    runs happen without tracemalloc, and one extra run measures memory.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(root, workdir)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func(root, workdir)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            func(root, workdir)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": round(min(timings), 4), "peak_mb": round(peak / 2**20, 2)}
+
+
+def measure_cli_startup(args: list[str], repeat: int = 5) -> dict[str, Any]:
+    """
+    Run `python -X importtime -m daily_bench.cli ARGS` and total its imports.
+
+    Returns:
+        best-of-*repeat* total import time in ms and the heavy modules imported
+    """
+    env = dict(os.environ)
+    src_dir = str(Path(__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in [src_dir, env.get("PYTHONPATH")] if path
+    )
+
+    best_ms = float("inf")
+    imported: set[str] = set()
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "daily_bench.cli", *args],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        total_us = 0
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, _, module = line[len("import time:") :].split("|")
+            total_us += int(self_us)
+            imported.add(module.strip())
+        best_ms = min(best_ms, total_us / 1000)
+
+    heavy = sorted(
+        module
+        for module in imported
+        if module.split(".")[0] in HEAVY_MODULES and "." not in module
+    )
+    return {"import_ms": round(best_ms, 1), "heavy_modules": heavy}
+
+
+def check_cli_startup(budget_ms: float = STARTUP_BUDGET_MS) -> list[str]:
+    """
+    Check the fast CLI paths against the import-time budget.
+
+    Returns:
+        list of human-readable problems (empty if none)
+    """
+    problems = []
+    for args in STARTUP_COMMANDS:
+        command = "daily-bench " + " ".join(args)
+        startup = measure_cli_startup(args)
+        print(f"  {command:<36} {startup['import_ms']:>9.1f}ms imports")
+        if startup["heavy_modules"]:
+            problems.append(f"{command}: imports {', '.join(startup['heavy_modules'])}")
+        if startup["import_ms"] > budget_ms:
+            problems.append(
+                f"{command}: import time {startup['import_ms']}ms exceeds "
+                f"budget {budget_ms}ms"
+            )
+    return problems
+
+
+def report_startup_problems(budget_ms: float = STARTUP_BUDGET_MS) -> list[str]:
+    """Run check_cli_startup() and print any problems."""
+    print("CLI cold start (python -X importtime):")
+    problems = check_cli_startup(budget_ms)
+    if problems:
+        print("\n" + "!" * 50)
+        print(f"CLI STARTUP PROBLEMS ({len(problems)}):")
+        for problem in problems:
+            print(f"  {problem}")
+        print("!" * 50)
+    else:
+        print(f"CLI startup within {budget_ms}ms budget")
+    return problems
+
+
+def run_benchmarks(
+    scale: synthetic.Scale,
+    root: Optional[Path] = None,
+    names: Optional[list[str]] = None,
+    repeat: int = 3,
+) -> dict[str, dict[str, float]]:
+    """
+    Run the benchmark suite on synthetic data.
+
+    Args:
+        scale: keyword arguments for synthetic.generate_benchmark_output()
+        root: existing synthetic runs directory (generated into a temp dir if None)
+        names: subset of BENCHMARKS to run (default: all)
+        repeat: timing repetitions per benchmark
+
+    Returns:
+        dictionary mapping benchmark name to its seconds / peak_mb
+    """
+    tmpdir = Path(tempfile.mkdtemp(prefix="daily-bench-bench-"))
+    try:
+        if root is None:
+            root = tmpdir / "runs"
+            print(f"Generating synthetic benchmark output: {scale}")
+            synthetic.generate_benchmark_output(root, **scale)
+
+        results = {}
+        for name in names or list(BENCHMARKS):
+            results[name] = measure(BENCHMARKS[name], root, tmpdir, repeat=repeat)
+            print(
+                f"  {name:<36} {results[name]['seconds']:>9.3f}s "
+                f"{results[name]['peak_mb']:>9.1f} MB peak"
+            )
+        return results
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def compare_to_baseline(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, Any],
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+) -> list[str]:
+    """
+    Compare benchmark results against a stored baseline.
+
+    Returns:
+        list of human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        for key, tolerance, unit in [
+            ("seconds", time_tolerance, "s"),
+            ("peak_mb", memory_tolerance, " MB"),
+        ]:
+            limit = max(
+                reference[key] * tolerance, reference[key] + MIN_REGRESSION[key]
+            )
+            if result[key] > limit:
+                regressions.append(
+                    f"{name}: {key} {result[key]}{unit} exceeds baseline "
+                    f"{reference[key]}{unit} x {tolerance} = {limit:.3f}{unit}"
+                )
+    return regressions
+
+
+def main(
+    scale: synthetic.Scale = DEFAULT_SCALE,
+    baseline_path: Path = DEFAULT_BASELINE_PATH,
+    update_baseline: bool = False,
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+    names: Optional[list[str]] = None,
+    repeat: int = 3,
+) -> int:
+    """
+    Run the suite, check it against the baseline and return an exit code.
+
+    With *update_baseline* the baseline is (re)written from this run instead
+    of compared; otherwise a missing baseline is an error, so a checkout
+    without one cannot pass silently. The CLI startup budget is always
+    enforced.
+    """
+    if not update_baseline and not baseline_path.exists():
+        print(
+            f"Error: no baseline at {baseline_path}. Record one on this machine "
+            "with --update-baseline."
+        )
+        return 2
+
+    startup_problems = report_startup_problems()
+    results = run_benchmarks(scale, names=names, repeat=repeat)
+
+    if update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with baseline_path.open("w") as f:
+            json.dump(
+                {"scale": scale, "machine": platform.platform(), "results": results},
+                f,
+                indent=2,
+            )
+            f.write("\n")
+        print(f"Baseline written to {baseline_path}")
+        return 1 if startup_problems else 0
+
+    with baseline_path.open() as f:
+        baseline = json.load(f)
+
+    if baseline.get("scale") != scale:
+        print(
+            f"Error: baseline {baseline_path} was recorded at scale "
+            f"{baseline.get('scale')}, not {scale}. Rerun with --update-baseline."
+        )
+        return 2
+
+    regressions = compare_to_baseline(
+        results, baseline, time_tolerance, memory_tolerance
+    )
+    if regressions:
+        print("\n" + "!" * 50)
+        print(f"PERFORMANCE REGRESSIONS ({len(regressions)}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        print("!" * 50)
+        return 1
+
+    print(f"No regressions against {baseline_path}")
+    return 1 if startup_problems else 0
@@ -1,43 +1,138 @@
 #!/usr/bin/env python3
-"""Command line interface for daily-bench."""
+"""
+Command line interface for daily-bench.
+
+Schedulers call the CLI often for status and no-op checks, so this module
+only imports the standard library at the top. Subcommands import the modules
+they need (pandas comes in with the extractor) when they run; the startup
+budget is checked by `daily-bench bench --startup-only`.
+"""
 
 import argparse
-import os
 import shutil
-import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from daily_bench import extractor
+if TYPE_CHECKING:
+    from daily_bench.synthetic import Scale
 
+REPO_ROOT = Path(__file__).parent.parent.parent
+RESULTS_LOCATION = Path(__file__).parent / "helm_lite/benchmark_output/runs"
+OUTPUT_LOCATION = REPO_ROOT / "results/benchmark_summary.csv"
 
-def run_helm_lite() -> None:
-    """Run the HELM Lite benchmark runner script."""
-    # Get the directory where this script is located
-    current_dir = Path(__file__).parent
-    runner_script = current_dir / "helm_lite" / "run_bench.sh"
 
-    if not runner_script.exists():
-        print(f"Error: runner.sh not found at {runner_script}")
-        sys.exit(1)
+class VersionAction(argparse.Action):
+    """Print the installed version, looking it up only when requested."""
+
+    def __init__(self, option_strings: list[str], dest: str, **kwargs):
+        super().__init__(
+            option_strings,
+            dest=argparse.SUPPRESS,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help="Show the daily-bench version and exit",
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            package_version = version("daily-bench")
+        except PackageNotFoundError:
+            package_version = "unknown (package not installed)"
+        parser.exit(message=f"{parser.prog} {package_version}\n")
+
+
+def show_status(results_location: Path, output_location: Path) -> None:
+    """Print the latest suite and whether it has been extracted yet."""
+    suites = (
+        sorted(p for p in results_location.iterdir() if p.is_dir())
+        if results_location.exists()
+        else []
+    )
+    print(f"Runs directory: {results_location} ({len(suites)} suites)")
+    if suites:
+        print(f"Latest suite:   {suites[-1].name}")
+
+    if not output_location.exists():
+        print(f"Summary CSV:    {output_location} (missing)")
+        return
+    stat = output_location.stat()
+    print(f"Summary CSV:    {output_location} ({stat.st_size / 2**20:.1f} MB)")
+    if suites and suites[-1].stat().st_mtime > stat.st_mtime:
+        print("Latest suite is newer than the summary CSV; run `daily-bench extract`")
+
+
+def run_helm_lite(
+    group_by: str = "provider",
+    max_parallel: Optional[int] = None,
+    helm_summarize: bool = False,
+    replay_options: Optional[dict] = None,
+    batch_sizes: Optional[list[int]] = None,
+    canary: bool = False,
+    canary_interval: Optional[float] = None,
+    canary_instances: int = 10,
+) -> None:
+    """
+    Run the HELM Lite benchmark with one helm-run process per model group.
 
-    # Make sure the script is executable
-    os.chmod(runner_script, 0o755)
+    With *replay_options* (ReplayServer kwargs), HELM is pointed at a local
+    replay server instead of the live provider APIs. With *batch_sizes*, models
+    run adaptively and stop early when they match their history. With *canary*,
+    probes of *canary_instances* instances per scenario run instead of a full
+    suite, every *canary_interval* minutes if given.
+    """
+    import os
 
-    # Change to the helm_lite directory to run the script
-    original_cwd = os.getcwd()
-    helm_lite_dir = current_dir / "helm_lite"
+    from daily_bench import orchestrator
 
+    helm_lite_dir = orchestrator.HELM_LITE_DIR
+    print(f"Running HELM Lite benchmark from {helm_lite_dir}")
+
+    server = None
+    models = None
+    env = None
     try:
-        os.chdir(helm_lite_dir)
-        print(f"Running HELM Lite benchmark from {helm_lite_dir}")
+        if replay_options is not None:
+            from daily_bench import replay
 
-        # Run the shell script
-        result = subprocess.run(
-            ["bash", str(runner_script)], check=False, cwd=helm_lite_dir
-        )
+            server = replay.ReplayServer(**replay_options)
+            server.start_background()
+            models, skipped = replay.replayable_models(orchestrator.get_models_to_run())
+            if skipped:
+                print(f"Replay: skipping models without a replay endpoint: {skipped}")
+            env = {**os.environ, **replay.replay_env(server.url)}
+            print(
+                f"Replay: serving {len(server.by_prompt)} recorded completions "
+                f"at {server.url}"
+            )
 
-        sys.exit(result.returncode)
+        if canary:
+            exit_codes = orchestrator.run_canary(
+                interval_minutes=canary_interval,
+                max_eval_instances=canary_instances,
+                models=models,
+                group_by=group_by,
+                max_parallel=max_parallel,
+                cwd=helm_lite_dir,
+                helm_summarize=helm_summarize,
+                env=env,
+            )
+        else:
+            exit_codes = orchestrator.run_suite(
+                models=models,
+                group_by=group_by,
+                max_parallel=max_parallel,
+                cwd=helm_lite_dir,
+                helm_summarize=helm_summarize,
+                env=env,
+                batch_sizes=tuple(sorted(batch_sizes)) if batch_sizes else None,
+                history_path=OUTPUT_LOCATION,
+            )
+        if server is not None:
+            print(f"Replay: {server.stats}")
+        sys.exit(0 if all(code == 0 for code in exit_codes.values()) else 1)
 
     except KeyboardInterrupt:
         print("\nBenchmark interrupted by user")
@@ -46,49 +141,453 @@ def run_helm_lite() -> None:
         print(f"Error running benchmark: {e}")
         sys.exit(1)
     finally:
-        os.chdir(original_cwd)
+        if server is not None:
+            server.shutdown()
+
+
+def serve_replay(replay_options: dict) -> None:
+    """Run the replay server in the foreground until interrupted."""
+    from daily_bench import replay
+
+    try:
+        server = replay.ReplayServer(**replay_options)
+    except (OSError, ValueError) as e:
+        print(f"Error starting replay server: {e}")
+        sys.exit(1)
+    print(f"Replaying {len(server.by_prompt)} recorded completions at {server.url}")
+    print("Point HELM or a load generator at it with:")
+    for name, value in replay.replay_env(server.url).items():
+        print(f"  export {name}={value}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStopped; {server.stats}")
+    finally:
+        server.server_close()
+
+
+def prepare_scenarios(force: bool = False) -> None:
+    """Materialize and cache the scenario datasets used by `daily-bench run`."""
+    from daily_bench import orchestrator
+
+    try:
+        orchestrator.prepare_scenarios(force=force)
+    except (OSError, RuntimeError) as e:
+        print(f"Error preparing scenarios: {e}")
+        sys.exit(1)
+
+
+def summarize_suite(results_location: Path, suite: Optional[str] = None) -> None:
+    """Write the daily-bench summary for *suite* (default: the latest suite)."""
+    from daily_bench import summarize
+
+    if suite is None:
+        suites = (
+            sorted(p.name for p in results_location.iterdir() if p.is_dir())
+            if results_location.exists()
+            else []
+        )
+        if not suites:
+            print(f"No suites found in {results_location}")
+            sys.exit(1)
+        suite = suites[-1]
+
+    try:
+        summary_path = summarize.summarize_suite(results_location / suite)
+    except FileNotFoundError as e:
+        print(e)
+        sys.exit(1)
+    summarize.print_summary(summary_path)
 
 
 def run_results_extractor(
-    results_location: Path, output_location: Path, incremental: bool = True
+    results_location: Path,
+    output_location: Path,
+    incremental: bool = True,
+    profile: bool = False,
+    cprofile: bool = False,
+    max_memory: Optional[int] = None,
 ) -> None:
     """Run the results extractor function."""
-    if incremental:
-        data = extractor.extract_results_incremental(
-            root=results_location, output_path=output_location
-        )
-        print(
-            "Incremental extraction completed. ",
-            f"Processed {data.get('new_runs_processed', 0)} new runs.",
-        )
-    else:
-        data = extractor.extract_results(
-            root=results_location, output_path=output_location
-        )
-        print("Full extraction completed.")
+    import contextlib
+
+    from daily_bench import extractor, profiling
+
+    profile_context = (
+        profiling.profile(cprofile=cprofile)
+        if profile or cprofile
+        else contextlib.nullcontext()
+    )
+    with profile_context as profiler:
+        if incremental:
+            data = extractor.extract_results_incremental(
+                root=results_location, output_path=output_location
+            )
+            print(
+                "Incremental extraction completed. ",
+                f"Processed {data.get('new_runs_processed', 0)} new runs.",
+            )
+        elif max_memory:
+            data = extractor.extract_results_chunked(
+                root=results_location,
+                output_path=output_location,
+                max_memory=max_memory,
+            )
+            print("Chunked full extraction completed.")
+        else:
+            data = extractor.extract_results(
+                root=results_location, output_path=output_location
+            )
+            print("Full extraction completed.")
 
     extractor.report(data)
     print(f"Results extracted to {output_location}")
 
-    # Copy results to dashboard for easy access
+    if profiler is not None:
+        report_path = output_location.with_name("extract_profile.json")
+        profiler.write_report(report_path)
+        print("\nExtraction profile:")
+        print(profiler.summary())
+        print(f"Profile report written to {report_path}")
+        if cprofile:
+            cprofile_path = output_location.with_name("extract_profile.prof")
+            profiler.dump_cprofile(cprofile_path)
+            print(f"cProfile stats written to {cprofile_path}")
+
+    copy_results_to_dashboard(output_location)
+
+
+def extract_partial(
+    runs_dirs: list[Path], partial_path: Path, shard: Optional[str] = None
+) -> None:
+    """Harvest (one shard of) the suites under *runs_dirs* into a partial summary."""
+    from daily_bench import shards
+
+    try:
+        shard_index, num_shards = shards.parse_shard(shard or "0/1")
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    shards.extract_shard(runs_dirs, partial_path, shard_index, num_shards)
+
+
+def merge_partials(
+    partial_paths: list[Path],
+    output_location: Path,
+    replace: bool = False,
+    fail_on_conflict: bool = False,
+) -> None:
+    """Merge partial summaries into the summary CSV."""
+    from daily_bench import shards
+
+    missing = [path for path in partial_paths if not path.exists()]
+    if missing:
+        print(f"Partial summaries not found: {', '.join(map(str, missing))}")
+        sys.exit(1)
+    try:
+        _, conflicts = shards.merge_partials(
+            partial_paths, output_location, include_existing=not replace
+        )
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    copy_results_to_dashboard(output_location)
+    if fail_on_conflict and not conflicts.empty:
+        sys.exit(1)
+
+
+def rescore_results(
+    results_location: Path, output_location: Path, metrics: list[str]
+) -> None:
+    """Recompute reference-based metrics from stored completions."""
+    from daily_bench import rescore
+
+    try:
+        _, agreement = rescore.rescore_runs(results_location, output_location, metrics)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error rescoring results: {e}")
+        sys.exit(1)
+    if not agreement.empty:
+        print("\nAgreement with HELM's stats.json means:")
+        print(agreement.to_string(index=False))
+
+
+def schedule_run(
+    output_location: Path,
+    max_delay: float,
+    metric: str,
+    all_models: bool,
+    seed: Optional[int],
+) -> None:
+    """Print the delay in seconds before the next run; the reasoning goes to stderr."""
+    from daily_bench import orchestrator, scheduler
+
+    schedule = scheduler.schedule_next_run(
+        output_location,
+        max_delay=max_delay,
+        metric=metric,
+        models=None if all_models else orchestrator.get_models_to_run(),
+        seed=seed,
+    )
+    print(scheduler.format_schedule(schedule), file=sys.stderr)
+    print(schedule.delay_seconds)
+
+
+def compact_runs(
+    runs_dir: Path, min_age_hours: float, drop_unused: bool, dry_run: bool
+) -> None:
+    """Compact finished suites into one zip each."""
+    from daily_bench import compact
+
+    try:
+        compact.compact_runs(
+            runs_dir,
+            min_age=min_age_hours * 3600,
+            drop_unused=drop_unused,
+            dry_run=dry_run,
+        )
+    except OSError as e:
+        print(f"Error compacting suites: {e}")
+        sys.exit(1)
+
+
+def copy_results_to_dashboard(output_location: Path) -> None:
+    """Copy the summary CSV and its companion files to dashboard/."""
     dashboard_csv = Path("dashboard/benchmark_summary.csv")
     if dashboard_csv.parent.exists():
         shutil.copy(output_location, dashboard_csv)
         print(f"Results also copied to {dashboard_csv} for dashboard use")
 
+        for name in [
+            "latency_summary.csv",
+            "latency_by_hour.csv",
+            "timeseries_lttb.json",
+        ]:
+            extra_output = output_location.with_name(name)
+            if extra_output.exists():
+                shutil.copy(extra_output, dashboard_csv.with_name(name))
+
+
+def watch_results(
+    results_location: Path,
+    output_location: Path,
+    poll_interval: Optional[float] = None,
+    settle_seconds: Optional[float] = None,
+) -> None:
+    """Extract each scenario as soon as HELM finishes writing it."""
+    from daily_bench import watch
+
+    watcher = watch.ScenarioWatcher(
+        results_location,
+        output_location,
+        poll_interval=poll_interval or watch.POLL_INTERVAL_SECONDS,
+        settle_seconds=settle_seconds or watch.SETTLE_SECONDS,
+        on_extract=lambda _: copy_results_to_dashboard(output_location),
+    )
+    try:
+        watcher.run_forever()
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def parse_memory_size(text: str) -> int:
+    """Parse a memory size such as '512M', '2G' or '1500000000' into bytes."""
+    units = {"K": 2**10, "M": 2**20, "G": 2**30}
+    text = text.strip().upper().removesuffix("B")
+    try:
+        if text and text[-1] in units:
+            return int(float(text[:-1]) * units[text[-1]])
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid memory size {text!r} (use e.g. 512M or 2G)"
+        ) from None
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser, days: int = 7) -> None:
+    """Add the synthetic data scale options to a subcommand parser."""
+    parser.add_argument("--models", type=int, default=5, help="Number of models")
+    parser.add_argument("--scenarios", type=int, default=4, help="Number of scenarios")
+    parser.add_argument("--days", type=int, default=days, help="Days of history")
+    parser.add_argument("--runs-per-day", type=int, default=4, help="Suites per day")
+    parser.add_argument(
+        "--instances", type=int, default=50, help="Evaluation instances per run"
+    )
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the replay server options to a subcommand parser."""
+    parser.add_argument(
+        "--replay-from",
+        type=Path,
+        default=RESULTS_LOCATION,
+        help="Runs directory whose scenario_state.json completions are replayed "
+        "(default: helm_lite/benchmark_output/runs)",
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier on recorded request times; 0 answers immediately (default: 1)",
+    )
+    parser.add_argument(
+        "--latency-median",
+        type=float,
+        help="Sample latency from a lognormal with this median (seconds) instead",
+    )
+    parser.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=0.5,
+        help="Lognormal sigma (default: 0.5)",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with a 429 or 500 (default: 0)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=16,
+        help="Requests served at once; the rest queue (default: 16)",
+    )
+
+
+def get_replay_options(args: argparse.Namespace) -> dict:
+    """Collect the replay options into ReplayServer kwargs."""
+    return {
+        "recordings_root": args.replay_from,
+        "latency_scale": args.latency_scale,
+        "latency_median": args.latency_median,
+        "latency_sigma": args.latency_sigma,
+        "error_rate": args.error_rate,
+        "max_concurrency": args.max_concurrency,
+    }
+
+
+def get_scale(args: argparse.Namespace) -> "Scale":
+    """Collect the synthetic data scale options into generator kwargs."""
+    return {
+        "num_models": args.models,
+        "num_scenarios": args.scenarios,
+        "days": args.days,
+        "runs_per_day": args.runs_per_day,
+        "num_instances": args.instances,
+    }
+
 
 def main() -> None:
     """Execute the main CLI entry point with subcommands."""
     parser = argparse.ArgumentParser(
         prog="daily-bench", description="Daily benchmarking for LLMs"
     )
+    parser.add_argument("--version", action=VersionAction)
 
     subparsers = parser.add_subparsers(
         dest="command", help="Available commands", required=True
     )
 
     # Add 'run' subcommand
-    _ = subparsers.add_parser("run", help="Run the HELM Lite benchmark")
+    run_parser = subparsers.add_parser("run", help="Run the HELM Lite benchmark")
+    run_parser.add_argument(
+        "--group-by",
+        choices=["provider", "model"],
+        default="provider",
+        help="Launch one helm-run process per provider or per model (default: provider)",
+    )
+    run_parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=None,
+        help="Maximum helm-run processes at once (default: all groups)",
+    )
+    run_parser.add_argument(
+        "--helm-summarize",
+        action="store_true",
+        help="Run HELM's full helm-summarize instead of the native daily-bench summary",
+    )
+    run_parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Answer HELM's OpenAI/Anthropic requests from recorded runs on a local "
+        "server instead of the live APIs (other providers are skipped)",
+    )
+    add_replay_arguments(run_parser)
+    run_parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Evaluate growing instance batches and stop each model early once a "
+        "sequential test shows it matches its history in results/benchmark_summary.csv",
+    )
+    run_parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[20, 35, 50],
+        metavar="N",
+        help="Instance counts per adaptive batch; the last is the full set "
+        "(default: 20 35 50)",
+    )
+
+    run_parser.add_argument(
+        "--canary",
+        action="store_true",
+        help="Run a small canary probe (the same few instances per scenario) into "
+        "a canary-TIMESTAMP suite, extracted as a separate series",
+    )
+    run_parser.add_argument(
+        "--canary-instances",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Instances per scenario in a canary probe (default: 10)",
+    )
+    run_parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        metavar="MINUTES",
+        help="With --canary, start a probe every MINUTES until interrupted",
+    )
+
+    # Add 'replay' subcommand
+    replay_parser = subparsers.add_parser(
+        "replay",
+        help="Serve recorded completions on OpenAI/Anthropic-compatible endpoints",
+    )
+    replay_parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    replay_parser.add_argument(
+        "--port", type=int, default=8765, help="Port to bind (default: 8765)"
+    )
+    add_replay_arguments(replay_parser)
+
+    # Add 'prepare' subcommand
+    prepare_parser = subparsers.add_parser(
+        "prepare",
+        help="Download and cache the scenario datasets so `run` starts immediately",
+    )
+    prepare_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild the cache even if one exists for this conf and instance limit",
+    )
+
+    # Add 'summarize' subcommand
+    summarize_parser = subparsers.add_parser(
+        "summarize",
+        help="Write the daily-bench summary of a suite (a fast helm-summarize)",
+    )
+    summarize_parser.add_argument(
+        "--suite", help="Suite name, e.g. results-20250608_112220 (default: latest)"
+    )
+    summarize_parser.add_argument(
+        "--runs-dir",
+        type=Path,
+        default=RESULTS_LOCATION,
+        help="Directory containing the suites (default: helm_lite/benchmark_output/runs)",
+    )
 
     # Add 'extract' subcommand
     extract_parser = subparsers.add_parser(
@@ -99,17 +598,324 @@ def main() -> None:
         action="store_true",
         help="Perform full extraction instead of incremental (slower but processes all runs)",
     )
+    extract_parser.add_argument(
+        "--max-memory",
+        type=parse_memory_size,
+        metavar="SIZE",
+        help="With --full, process suites in chunks sized to this memory budget "
+        "(e.g. 2G) and merge them from disk",
+    )
+    extract_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage wall/CPU time, files/bytes read and peak RSS growth "
+        "to results/extract_profile.json",
+    )
+    extract_parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="Also dump cProfile stats to results/extract_profile.prof (implies --profile)",
+    )
+    extract_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and extract each scenario as soon as HELM finishes it",
+    )
+    extract_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        help="Seconds between scans in --watch mode (default: 2)",
+    )
+    extract_parser.add_argument(
+        "--settle",
+        type=float,
+        help="Seconds a scenario's files must stay unchanged before it is "
+        "extracted in --watch mode (default: 3)",
+    )
+
+    extract_parser.add_argument(
+        "--partial",
+        type=Path,
+        metavar="PATH",
+        help="Write a partial summary of --runs-dir to PATH for `daily-bench merge` "
+        "instead of updating results/",
+    )
+    extract_parser.add_argument(
+        "--runs-dir",
+        type=Path,
+        action="append",
+        metavar="DIR",
+        help="Run root to extract: a directory of suites or a .zip/.tar(.gz) of one; "
+        "repeat for several roots with --partial "
+        "(default: helm_lite/benchmark_output/runs)",
+    )
+    extract_parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="With --partial, only harvest suites in shard I of N (e.g. 0/4)",
+    )
+
+    # Add 'merge' subcommand
+    merge_parser = subparsers.add_parser(
+        "merge",
+        help="Merge partial summaries from `extract --partial` into the results CSV",
+    )
+    merge_parser.add_argument(
+        "partials",
+        type=Path,
+        nargs="+",
+        help="Partial summary CSVs; on conflicting rows the last one listed wins",
+    )
+    merge_parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Build the results CSV from the partials only instead of merging "
+        "into the existing one",
+    )
+    merge_parser.add_argument(
+        "--fail-on-conflict",
+        action="store_true",
+        help="Exit with status 1 if any stat row differs between sources",
+    )
+
+    # Add 'rescore' subcommand
+    rescore_parser = subparsers.add_parser(
+        "rescore",
+        help="Recompute exact/quasi-exact match, F1 and ROUGE-L from stored "
+        "completions, without any API calls",
+    )
+    rescore_parser.add_argument(
+        "--runs-dir",
+        type=Path,
+        default=RESULTS_LOCATION,
+        help="Run root to rescore: a directory of suites or a .zip/.tar(.gz) of one "
+        "(default: helm_lite/benchmark_output/runs)",
+    )
+    rescore_parser.add_argument(
+        "--metrics",
+        nargs="+",
+        choices=["exact_match", "quasi_exact_match", "f1_score", "rouge_l"],
+        default=["exact_match", "quasi_exact_match", "f1_score", "rouge_l"],
+        help="Metrics to compute (default: all)",
+    )
+
+    # Add 'schedule' subcommand
+    schedule_parser = subparsers.add_parser(
+        "schedule",
+        help="Print the delay (seconds) before the next run that best fills the "
+        "least-covered hour-of-week/hour-of-day buckets",
+    )
+    schedule_parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=19800,
+        metavar="SECONDS",
+        help="Latest start, in seconds from now (default: 19800, 5.5 hours)",
+    )
+    schedule_parser.add_argument(
+        "--metric",
+        default="exact_match",
+        help="Metric whose run-to-run variance is measured (default: exact_match)",
+    )
+    schedule_parser.add_argument(
+        "--all-models",
+        action="store_true",
+        help="Count every model in the results, not just the ones being run",
+    )
+    schedule_parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for tie-breaks and the minute"
+    )
+
+    # Add 'compact' subcommand
+    compact_parser = subparsers.add_parser(
+        "compact",
+        help="Compress finished suites into one indexed zip each; "
+        "extraction reads them transparently",
+    )
+    compact_parser.add_argument(
+        "--runs-dir",
+        type=Path,
+        default=RESULTS_LOCATION,
+        help="Directory containing the suites (default: helm_lite/benchmark_output/runs)",
+    )
+    compact_parser.add_argument(
+        "--min-age",
+        type=float,
+        default=6.0,
+        metavar="HOURS",
+        help="Only compact suites unchanged for this long (default: 6)",
+    )
+    compact_parser.add_argument(
+        "--drop-unused",
+        action="store_true",
+        help="Also drop files and fields daily-bench never reads "
+        "(display_*.json, per-token completion details)",
+    )
+    compact_parser.add_argument(
+        "--dry-run", action="store_true", help="Only list the suites to compact"
+    )
+
+    # Add 'status' subcommand
+    subparsers.add_parser(
+        "status", help="Show the latest suite and whether it has been extracted"
+    )
+
+    # Add 'synth' subcommand
+    synth_parser = subparsers.add_parser(
+        "synth", help="Generate synthetic HELM benchmark output for testing"
+    )
+    synth_parser.add_argument("output", type=Path, help="Runs directory to write into")
+    add_scale_arguments(synth_parser)
+
+    # Add 'bench' subcommand
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark the extractor on synthetic data against a baseline"
+    )
+    add_scale_arguments(bench_parser, days=2)
+    bench_parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON file (default: benchmarks/baseline.json)",
+    )
+    bench_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run instead of comparing",
+    )
+    bench_parser.add_argument(
+        "--only", nargs="+", metavar="NAME", help="Run only these benchmarks"
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=3, help="Timing repetitions per benchmark"
+    )
+    bench_parser.add_argument(
+        "--startup-only",
+        action="store_true",
+        help="Only check the CLI cold-start import time and heavy imports",
+    )
+
+    # Add 'build-site' subcommand
+    build_site_parser = subparsers.add_parser(
+        "build-site",
+        help="Build a hashed, minified and precompressed dashboard bundle",
+    )
+    build_site_parser.add_argument(
+        "--source",
+        type=Path,
+        default=REPO_ROOT / "dashboard",
+        help="Dashboard directory (default: dashboard/)",
+    )
+    build_site_parser.add_argument(
+        "--output",
+        type=Path,
+        default=REPO_ROOT / "site",
+        help="Bundle output directory, replaced on each build (default: site/)",
+    )
+    build_site_parser.add_argument(
+        "--results",
+        type=Path,
+        default=REPO_ROOT / "results",
+        help="Fallback directory for data files (default: results/)",
+    )
 
     args = parser.parse_args()
 
     if args.command == "run":
-        run_helm_lite()
+        if args.canary and args.adaptive:
+            run_parser.error("--canary and --adaptive cannot be combined")
+        if args.interval is not None and not args.canary:
+            run_parser.error("--interval requires --canary")
+        run_helm_lite(
+            group_by=args.group_by,
+            max_parallel=args.max_parallel,
+            helm_summarize=args.helm_summarize,
+            replay_options=get_replay_options(args) if args.replay else None,
+            batch_sizes=args.batch_sizes if args.adaptive else None,
+            canary=args.canary,
+            canary_interval=args.interval,
+            canary_instances=args.canary_instances,
+        )
+    elif args.command == "replay":
+        serve_replay({**get_replay_options(args), "host": args.host, "port": args.port})
+    elif args.command == "prepare":
+        prepare_scenarios(force=args.force)
+    elif args.command == "summarize":
+        summarize_suite(args.runs_dir, args.suite)
+    elif args.command == "rescore":
+        rescore_results(args.runs_dir, OUTPUT_LOCATION, args.metrics)
+    elif args.command == "schedule":
+        schedule_run(
+            OUTPUT_LOCATION, args.max_delay, args.metric, args.all_models, args.seed
+        )
+    elif args.command == "compact":
+        compact_runs(args.runs_dir, args.min_age, args.drop_unused, args.dry_run)
+    elif args.command == "status":
+        show_status(RESULTS_LOCATION, OUTPUT_LOCATION)
     elif args.command == "extract":
-        current_dir = Path(__file__).parent
-        results_location = current_dir / "helm_lite/benchmark_output/runs"
-        output_location = current_dir.parent.parent / "results/benchmark_summary.csv"
+        if args.watch:
+            if len(args.runs_dir or []) > 1:
+                extract_parser.error("--watch takes a single --runs-dir")
+            watch_results(
+                args.runs_dir[0] if args.runs_dir else RESULTS_LOCATION,
+                OUTPUT_LOCATION,
+                poll_interval=args.poll_interval,
+                settle_seconds=args.settle,
+            )
+            return
+        if args.partial:
+            extract_partial(
+                args.runs_dir or [RESULTS_LOCATION], args.partial, args.shard
+            )
+            return
+        if args.shard or len(args.runs_dir or []) > 1:
+            extract_parser.error("--shard and several --runs-dir require --partial")
+        if args.max_memory and not args.full:
+            extract_parser.error("--max-memory requires --full")
         incremental = not args.full  # Use incremental unless --full is specified
-        run_results_extractor(results_location, output_location, incremental)
+        run_results_extractor(
+            args.runs_dir[0] if args.runs_dir else RESULTS_LOCATION,
+            OUTPUT_LOCATION,
+            incremental,
+            profile=args.profile,
+            cprofile=args.cprofile,
+            max_memory=args.max_memory,
+        )
+    elif args.command == "merge":
+        merge_partials(
+            args.partials,
+            OUTPUT_LOCATION,
+            replace=args.replace,
+            fail_on_conflict=args.fail_on_conflict,
+        )
+    elif args.command == "synth":
+        from daily_bench import synthetic
+
+        suites = synthetic.generate_benchmark_output(args.output, **get_scale(args))
+        print(f"Wrote {len(suites)} synthetic suites to {args.output}")
+    elif args.command == "bench":
+        from daily_bench import benchmarks
+
+        if args.startup_only:
+            sys.exit(1 if benchmarks.report_startup_problems() else 0)
+        unknown = set(args.only or []) - set(benchmarks.BENCHMARKS)
+        if unknown:
+            bench_parser.error(
+                f"unknown benchmarks {sorted(unknown)}; "
+                f"choose from {list(benchmarks.BENCHMARKS)}"
+            )
+        sys.exit(
+            benchmarks.main(
+                get_scale(args),
+                baseline_path=args.baseline or benchmarks.DEFAULT_BASELINE_PATH,
+                update_baseline=args.update_baseline,
+                names=args.only,
+                repeat=args.repeat,
+            )
+        )
+    elif args.command == "build-site":
+        from daily_bench import site_builder
+
+        site_builder.build_site(args.source, args.output, args.results)
     else:
         parser.print_help()
         sys.exit(1)
@@ -0,0 +1,166 @@
+"""
+Compact finished suites into one compressed, indexed archive each.
+
+HELM leaves every suite as a directory of pretty-printed JSON files, most of
+the bytes in scenario_state.json and per_instance_stats.json. `daily-bench
+compact` rewrites each finished suite as SUITE.zip next to where the
+directory was:
+
+- JSON is re-serialized without indentation (same values) and deflated
+- the zip's central directory indexes every file, so a single stats.json is
+  read without decompressing the rest
+- with drop_unused, files and fields daily-bench never reads are dropped
+  (UNREAD_FILES, and per-token details of completions; the token count the
+  extractor uses is kept)
+
+The archive is verified against the directory before the directory is
+removed. The extractor finds SUITE.zip archives under a run root next to the
+suite directories (see archives.find_suite_archives()), so compacted suites
+are re-extracted like any other. Only the standard library is used.
+"""
+
+import json
+import shutil
+import time
+import zipfile
+from pathlib import Path
+from typing import Any
+
+from daily_bench.archives import SUITE_ARCHIVE_SUFFIX
+
+# Suites modified more recently than this may still be running
+MIN_AGE_SECONDS = 6 * 3600
+
+# HELM frontend copies of scenario_state.json; nothing in daily-bench reads them
+UNREAD_FILES = ("display_predictions.json", "display_requests.json")
+
+COMPRESS_LEVEL = 9
+
+
+def suite_archive_path(suite_dir: Path) -> Path:
+    """SUITE.zip next to *suite_dir*."""
+    return suite_dir.with_name(suite_dir.name + SUITE_ARCHIVE_SUFFIX)
+
+
+def is_finished(suite_dir: Path, min_age: float = MIN_AGE_SECONDS) -> bool:
+    """
+    Whether every run spec in *suite_dir* has its stats.json and nothing in
+    the suite changed for *min_age* seconds.
+
+    Run spec directories are the ones with a run_spec.json; others, such as
+    the groups/ directory helm-summarize adds, are not checked.
+    """
+    run_dirs = [path.parent for path in suite_dir.glob("*/run_spec.json")]
+    if not run_dirs or not all((path / "stats.json").exists() for path in run_dirs):
+        return False
+    newest = max(path.stat().st_mtime for path in suite_dir.rglob("*"))
+    return time.time() - newest >= min_age
+
+
+def drop_unused_fields(scenario_state: dict[str, Any]) -> dict[str, Any]:
+    """
+    Replace each completion's tokens with empty objects.
+
+    Tokens (text, logprob and top alternatives per token) are most of a
+    scenario_state.json, but the extractor only counts them.
+    """
+    for request_state in scenario_state.get("request_states", []):
+        for completion in request_state.get("result", {}).get("completions") or []:
+            if "tokens" in completion:
+                completion["tokens"] = [{} for _ in completion["tokens"]]
+    return scenario_state
+
+
+def _compact_bytes(path: Path, drop_unused: bool) -> bytes:
+    """Contents of *path* as stored in the archive."""
+    data = path.read_bytes()
+    if path.suffix != ".json":
+        return data
+    value = json.loads(data)
+    if drop_unused and path.name == "scenario_state.json":
+        value = drop_unused_fields(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def compact_suite(suite_dir: Path, drop_unused: bool = False) -> tuple[int, int]:
+    """
+    Write SUITE.zip for *suite_dir*, verify it and remove the directory.
+
+    Returns:
+        (bytes before, bytes after)
+    """
+    archive = suite_archive_path(suite_dir)
+    partial = archive.with_name(archive.name + ".partial")
+    files = sorted(path for path in suite_dir.rglob("*") if path.is_file())
+    if drop_unused:
+        files = [path for path in files if path.name not in UNREAD_FILES]
+
+    with zipfile.ZipFile(
+        partial, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL
+    ) as zf:
+        for path in files:
+            arcname = path.relative_to(suite_dir.parent).as_posix()
+            zf.writestr(arcname, _compact_bytes(path, drop_unused))
+
+    # Every file must read back with a valid CRC before anything is deleted
+    with zipfile.ZipFile(partial) as zf:
+        bad = zf.testzip()
+        stored = set(zf.namelist())
+    expected = {path.relative_to(suite_dir.parent).as_posix() for path in files}
+    if bad is not None or stored != expected:
+        partial.unlink()
+        raise OSError(f"Verification of {archive} failed; {suite_dir} was kept")
+
+    before = sum(path.stat().st_size for path in suite_dir.rglob("*") if path.is_file())
+    partial.replace(archive)
+    shutil.rmtree(suite_dir)
+    return before, archive.stat().st_size
+
+
+def compact_runs(
+    root: str | Path,
+    min_age: float = MIN_AGE_SECONDS,
+    drop_unused: bool = False,
+    dry_run: bool = False,
+) -> list[Path]:
+    """
+    Compact every finished suite directory under *root*.
+
+    Args:
+        root: runs directory containing SUITE directories
+        min_age: seconds a suite must be unchanged to count as finished
+        drop_unused: also drop files and fields daily-bench never reads
+        dry_run: only list the suites that would be compacted
+
+    Returns:
+        the suite directories compacted (or that would be)
+    """
+    root = Path(root)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Runs directory not found: {root}")
+
+    suites = [
+        path
+        for path in sorted(root.iterdir())
+        if path.is_dir() and is_finished(path, min_age)
+    ]
+    total_before = total_after = 0
+    for suite_dir in suites:
+        if dry_run:
+            print(f"Would compact {suite_dir.name}")
+            continue
+        before, after = compact_suite(suite_dir, drop_unused=drop_unused)
+        total_before += before
+        total_after += after
+        print(
+            f"Compacted {suite_dir.name}: {before / 2**20:.1f} MB -> "
+            f"{after / 2**20:.1f} MB"
+        )
+    if suites and not dry_run:
+        print(
+            f"Compacted {len(suites)} suites: {total_before / 2**20:.1f} MB -> "
+            f"{total_after / 2**20:.1f} MB ({total_before / max(total_after, 1):.1f}x)"
+        )
+    elif not suites:
+        print(f"No finished suites to compact in {root}")
+    return suites
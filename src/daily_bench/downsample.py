@@ -0,0 +1,162 @@
+"""
+Shape-preserving downsampling of benchmark time series for plotting.
+
+Each (model, scenario, metric) series in the summary CSV is reduced with
+largest-triangle-three-buckets (LTTB) at a few zoom levels and written to
+timeseries_lttb.json, so the dashboard can draw a few hundred points and
+only switch to full resolution when zoomed in. Only full runs are plotted;
+canary probes (run_kind 'canary') are left out.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Points per series at each published zoom level
+DOWNSAMPLE_LEVELS = (250, 1000, 4000)
+
+# Series key for "all scenarios" (matches the dashboard's empty scenario filter)
+ALL_SCENARIOS = ""
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Select *threshold* points of (x, y) with largest-triangle-three-buckets.
+
+    The first and last points are always kept. The points between them are
+    split into threshold - 2 buckets, and from each bucket the point forming
+    the largest triangle with the previously selected point and the mean of
+    the next bucket is kept.
+
+    Args:
+        x: sorted x values (e.g. epoch seconds)
+        y: y values
+        threshold: number of points to keep
+
+    Returns:
+        sorted indices of the selected points
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+
+        # Twice the triangle area; the constant factor doesn't change argmax
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+
+    return indices
+
+
+def _complete_points(df: pd.DataFrame, series_cols: list[str]) -> pd.DataFrame:
+    """
+    Average 'mean' per timestamp, keeping only timestamps with the series'
+    maximum number of values (the dashboard drops partial runs the same way).
+    """
+    points = (
+        df.groupby(series_cols + ["run_timestamp"])["mean"]
+        .agg(["mean", "count"])
+        .reset_index()
+    )
+    max_count = points.groupby(series_cols)["count"].transform("max")
+    return points[points["count"] == max_count].drop(columns="count")
+
+
+def build_downsampled_series(
+    summary_df: pd.DataFrame, levels: tuple[int, ...] = DOWNSAMPLE_LEVELS
+) -> dict[str, Any]:
+    """
+    Downsample every (model, scenario, metric) series of a summary CSV.
+
+    Series are also built across all scenarios (scenario ""). Levels at or
+    above a series' length are omitted; the full series is the CSV itself.
+
+    Args:
+        summary_df: DataFrame in the benchmark_summary.csv layout
+        levels: number of points per zoom level
+
+    Returns:
+        {"levels": [...], "series": {"model|scenario|metric": {"num_points": n,
+        "levels": {"250": {"t": [...], "y": [...]}, ...}}}}
+    """
+    metric_col = "metric_name" if "metric_name" in summary_df.columns else "name"
+    if "run_kind" in summary_df.columns:
+        summary_df = summary_df[summary_df["run_kind"].fillna("full") == "full"]
+    df = summary_df[["model", "scenario_class", metric_col, "run_timestamp", "mean"]]
+    df = df.rename(columns={metric_col: "metric_name"}).copy()
+    df["run_timestamp"] = pd.to_datetime(df["run_timestamp"], errors="coerce")
+    df["mean"] = pd.to_numeric(df["mean"], errors="coerce")
+    df = df.dropna(subset=["run_timestamp", "mean"])
+
+    per_scenario = _complete_points(df, ["model", "scenario_class", "metric_name"])
+    all_scenarios = _complete_points(df, ["model", "metric_name"])
+    all_scenarios["scenario_class"] = ALL_SCENARIOS
+    points = pd.concat([per_scenario, all_scenarios], ignore_index=True)
+    points = points.sort_values(
+        ["model", "scenario_class", "metric_name", "run_timestamp"]
+    )
+
+    series = {}
+    for (model, scenario, metric), group in points.groupby(
+        ["model", "scenario_class", "metric_name"], sort=False
+    ):
+        x = group["run_timestamp"].to_numpy("datetime64[s]").astype(np.int64)
+        y = group["mean"].to_numpy(dtype=float)
+        published = {}
+        for level in levels:
+            if level >= len(x):
+                break
+            keep = lttb_indices(x.astype(float), y, level)
+            published[str(level)] = {
+                "t": group["run_timestamp"]
+                .iloc[keep]
+                .dt.strftime("%Y-%m-%d %H:%M:%S")
+                .tolist(),
+                "y": np.round(y[keep], 6).tolist(),
+            }
+        if published:
+            series[f"{model}|{scenario}|{metric}"] = {
+                "num_points": len(x),
+                "levels": published,
+            }
+
+    return {"levels": list(levels), "series": series}
+
+
+def save_downsampled_series(summary_df: pd.DataFrame, output_path: str | Path) -> Path:
+    """
+    Write timeseries_lttb.json next to *output_path*.
+
+    Args:
+        summary_df: the summary DataFrame that was written to *output_path*
+        output_path: path of the main summary CSV
+
+    Returns:
+        path of the JSON file written
+    """
+    lttb_path = Path(output_path).with_name("timeseries_lttb.json")
+    lttb_path.parent.mkdir(parents=True, exist_ok=True)
+    with lttb_path.open("w") as f:
+        json.dump(build_downsampled_series(summary_df), f, separators=(",", ":"))
+    return lttb_path
@@ -3,14 +3,84 @@ Extract data from the HELM Lite benchmark.
 Data from runs is stored in the `benchmark_output/runs` directory.
 """
 
+import contextlib
 import csv
 import datetime
+import heapq
+import itertools
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 import pandas as pd
 
+from daily_bench import (
+    archives,
+    downsample,
+    profiling,
+    regression,
+    run_kinds,
+    store,
+    summarize,
+)
+
+
+def _find_files(
+    root: str | Path | archives.ArchivePath, file_name: str
+) -> Iterable[Path | archives.ArchivePath]:
+    """
+    List every *file_name* under *root* (the directory walk stage).
+
+    *root* may also be a .zip/.tar(.gz) of run directories, or a directory
+    inside one, and compacted SUITE.zip archives under a directory root are
+    included. Archive members are yielded while the archive is streamed, so
+    load each one (and its run_spec.json) before moving to the next.
+    """
+    if isinstance(root, archives.ArchivePath) or archives.is_archive(root):
+        return archives.find_files(root, file_name)
+    with profiling.stage("walk"):
+        files, suite_archives = archives.walk_run_root(root, file_name)
+    if suite_archives:
+        return itertools.chain(files, archives.find_files(suite_archives, file_name))
+    return files
+
+
+def _find_files_in(
+    run_paths: Sequence[Path | archives.ArchivePath], file_name: str
+) -> Iterator[Path | archives.ArchivePath]:
+    """_find_files() over several roots; roots inside one archive share a pass."""
+    in_archives = []
+    for run_path in run_paths:
+        if isinstance(run_path, archives.ArchivePath):
+            in_archives.append(run_path)
+        else:
+            yield from _find_files(run_path, file_name)
+    if in_archives:
+        yield from archives.find_files(in_archives, file_name)
+
+
+def _load_json(path: Path | archives.ArchivePath) -> Any:
+    """Read and decode a JSON file, recording it with the active profiler."""
+    with profiling.stage("file_read"):
+        data = path.read_bytes()
+        profiling.record_read(len(data))
+    with profiling.stage("json_decode"):
+        return json.loads(data)
+
+
+def _rows_to_frame(
+    rows: list[dict[str, Any]],
+    sort_columns: str | list[str],
+    ascending: bool | list[bool] = True,
+) -> pd.DataFrame:
+    """Build a DataFrame from harvested rows and sort it."""
+    with profiling.stage("dataframe"):
+        df = pd.DataFrame(rows)
+    with profiling.stage("sort"):
+        return df.sort_values(sort_columns, ascending=ascending).reset_index(drop=True)
+
 
 def harvest_helm_stats(root: str | Path = "benchmark_output/runs") -> pd.DataFrame:
     """
@@ -22,17 +92,15 @@ def harvest_helm_stats(root: str | Path = "benchmark_output/runs") -> pd.DataFra
     """
     rows: list[dict[str, Any]] = []
 
-    for stats_path in Path(root).rglob("stats.json"):
+    for stats_path in _find_files(root, "stats.json"):
         # Load stats.json
-        with stats_path.open() as f:
-            stats_list: list[dict[str, Any]] = json.load(f)
+        stats_list: list[dict[str, Any]] = _load_json(stats_path)
 
         # Load corresponding run_spec.json
         run_spec_path = stats_path.parent / "run_spec.json"
         run_spec = {}
         if run_spec_path.exists():
-            with run_spec_path.open() as f:
-                run_spec = json.load(f)
+            run_spec = _load_json(run_spec_path)
 
         # Extract metadata from run_spec
         model = run_spec.get("adapter_spec", {}).get("model", "unknown")
@@ -74,11 +142,7 @@ def harvest_helm_stats(root: str | Path = "benchmark_output/runs") -> pd.DataFra
     if len(rows) == 0:
         raise ValueError(f"No rows found in harvest_helm_stats! Along path {root}")
 
-    return (
-        pd.DataFrame(rows)
-        .sort_values(["model", "run"], ascending=[True, True])
-        .reset_index(drop=True)
-    )
+    return _rows_to_frame(rows, ["model", "run"], ascending=[True, True])
 
 
 def harvest_run_specs(root: str | Path = "benchmark_output/runs") -> pd.DataFrame:
@@ -91,9 +155,8 @@ def harvest_run_specs(root: str | Path = "benchmark_output/runs") -> pd.DataFram
     """
     rows: list[dict[str, Any]] = []
 
-    for run_spec_path in Path(root).rglob("run_spec.json"):
-        with run_spec_path.open() as f:
-            run_spec = json.load(f)
+    for run_spec_path in _find_files(root, "run_spec.json"):
+        run_spec = _load_json(run_spec_path)
 
         # Extract adapter spec details
         adapter_spec = run_spec.get("adapter_spec", {})
@@ -137,7 +200,7 @@ def harvest_run_specs(root: str | Path = "benchmark_output/runs") -> pd.DataFram
 
         rows.append(row)
 
-    return pd.DataFrame(rows).sort_values("run_id").reset_index(drop=True)
+    return _rows_to_frame(rows, "run_id")
 
 
 def harvest_instances(root: str | Path = "benchmark_output/runs") -> pd.DataFrame:
@@ -150,9 +213,8 @@ def harvest_instances(root: str | Path = "benchmark_output/runs") -> pd.DataFram
     """
     rows: list[dict[str, Any]] = []
 
-    for instances_path in Path(root).rglob("instances.json"):
-        with instances_path.open() as f:
-            instances = json.load(f)
+    for instances_path in _find_files(root, "instances.json"):
+        instances = _load_json(instances_path)
 
         run_id = instances_path.parent.name
 
@@ -161,12 +223,11 @@ def harvest_instances(root: str | Path = "benchmark_output/runs") -> pd.DataFram
         model = "unknown"
         scenario_class = "unknown"
         if run_spec_path.exists():
-            with run_spec_path.open() as f:
-                run_spec = json.load(f)
-                model = run_spec.get("adapter_spec", {}).get("model", "unknown")
-                scenario_class = run_spec.get("scenario_spec", {}).get(
-                    "class_name", "unknown"
-                )
+            run_spec = _load_json(run_spec_path)
+            model = run_spec.get("adapter_spec", {}).get("model", "unknown")
+            scenario_class = run_spec.get("scenario_spec", {}).get(
+                "class_name", "unknown"
+            )
 
         for instance in instances:
             # Extract references
@@ -190,9 +251,7 @@ def harvest_instances(root: str | Path = "benchmark_output/runs") -> pd.DataFram
 
             rows.append(row)
 
-    return (
-        pd.DataFrame(rows).sort_values(["run_id", "instance_id"]).reset_index(drop=True)
-    )
+    return _rows_to_frame(rows, ["run_id", "instance_id"])
 
 
 def harvest_per_instance_stats(
@@ -206,9 +265,8 @@ def harvest_per_instance_stats(
     """
     rows: list[dict[str, Any]] = []
 
-    for per_instance_path in Path(root).rglob("per_instance_stats.json"):
-        with per_instance_path.open() as f:
-            per_instance_data = json.load(f)
+    for per_instance_path in _find_files(root, "per_instance_stats.json"):
+        per_instance_data = _load_json(per_instance_path)
 
         run_id = per_instance_path.parent.name
 
@@ -216,9 +274,8 @@ def harvest_per_instance_stats(
         run_spec_path = per_instance_path.parent / "run_spec.json"
         model = "unknown"
         if run_spec_path.exists():
-            with run_spec_path.open() as f:
-                run_spec = json.load(f)
-                model = run_spec.get("adapter_spec", {}).get("model", "unknown")
+            run_spec = _load_json(run_spec_path)
+            model = run_spec.get("adapter_spec", {}).get("model", "unknown")
 
         for instance_data in per_instance_data:
             instance_id = instance_data.get("instance_id", "")
@@ -245,11 +302,7 @@ def harvest_per_instance_stats(
 
                 rows.append(row)
 
-    return (
-        pd.DataFrame(rows)
-        .sort_values(["run_id", "instance_id", "name"])
-        .reset_index(drop=True)
-    )
+    return _rows_to_frame(rows, ["run_id", "instance_id", "name"])
 
 
 def harvest_scenario_metadata(
@@ -258,9 +311,8 @@ def harvest_scenario_metadata(
     """Extract scenario metadata and descriptions."""
     rows: list[dict[str, Any]] = []
 
-    for scenario_path in Path(root).rglob("scenario.json"):
-        with scenario_path.open() as f:
-            scenario_data = json.load(f)
+    for scenario_path in _find_files(root, "scenario.json"):
+        scenario_data = _load_json(scenario_path)
 
         run_id = scenario_path.parent.name
 
@@ -274,23 +326,29 @@ def harvest_scenario_metadata(
 
         rows.append(row)
 
-    return pd.DataFrame(rows).sort_values("run_id").reset_index(drop=True)
+    return _rows_to_frame(rows, "run_id")
 
 
-def harvest_scenario_state(root: str | Path = "benchmark_output/runs") -> pd.DataFrame:
+def harvest_scenario_state(
+    root: str | Path | Sequence[Path | archives.ArchivePath] = "benchmark_output/runs",
+) -> pd.DataFrame:
     """
     Extract scenario state data including request/response information.
 
+    *root* may also be a list of suite directories (read in one pass per archive).
+
     Returns:
         DataFrame with detailed request/response data for each instance.
     """
     rows: list[dict[str, Any]] = []
 
-    for scenario_state_path in Path(root).rglob("scenario_state.json"):
-        with scenario_state_path.open() as f:
-            scenario_state = json.load(f)
+    roots = [Path(root)] if isinstance(root, (str, Path)) else root
+    for scenario_state_path in _find_files_in(roots, "scenario_state.json"):
+        scenario_state = _load_json(scenario_state_path)
 
         run_id = scenario_state_path.parent.name
+        # Path is benchmark_output/runs/SUITE_NAME/scenario/scenario_state.json
+        suite_name = scenario_state_path.parent.parent.name
 
         # Extract adapter spec info (same for all instances in this run)
         adapter_spec = scenario_state.get("adapter_spec", {})
@@ -307,6 +365,7 @@ def harvest_scenario_state(root: str | Path = "benchmark_output/runs") -> pd.Dat
             )
             row = {
                 "run_id": run_id,
+                "run": suite_name,
                 # Instance info
                 "instance_id": instance.get("id", ""),
                 "split": instance.get("split", ""),
@@ -349,9 +408,7 @@ def harvest_scenario_state(root: str | Path = "benchmark_output/runs") -> pd.Dat
 
             rows.append(row)
 
-    return (
-        pd.DataFrame(rows).sort_values(["run_id", "instance_id"]).reset_index(drop=True)
-    )
+    return _rows_to_frame(rows, ["run_id", "instance_id"])
 
 
 def create_comprehensive_report(
@@ -363,15 +420,20 @@ def create_comprehensive_report(
         dictionary containing multiple DataFrames with different aspects
         of the evaluation results.
     """
-    report = {
-        "stats": harvest_helm_stats(root),
-        "run_specs": harvest_run_specs(root),
-        "instances": harvest_instances(root),
-        "per_instance_stats": harvest_per_instance_stats(root),
-        "scenario_metadata": harvest_scenario_metadata(root),
-        "scenario_state": harvest_scenario_state(root),
+    harvesters = {
+        "stats": harvest_helm_stats,
+        "run_specs": harvest_run_specs,
+        "instances": harvest_instances,
+        "per_instance_stats": harvest_per_instance_stats,
+        "scenario_metadata": harvest_scenario_metadata,
+        "scenario_state": harvest_scenario_state,
     }
 
+    report = {}
+    for name, harvester in harvesters.items():
+        with profiling.stage(harvester.__name__):
+            report[name] = harvester(root)
+
     return report
 
 
@@ -488,9 +550,27 @@ def extract_run_timestamp(run_id: str) -> Optional[datetime.datetime]:
     return None
 
 
+def add_run_kind(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Set the run_kind column from the suite name: 'canary' for canary probe
+    suites, 'full' for full suites.
+
+    Canary probes evaluate a few instances, so their means are a separate,
+    lower-precision series and are never averaged with full runs.
+    """
+    run_col = "run_id" if "run_id" in df.columns else "run"
+    canary = df[run_col].astype(str).str.startswith(run_kinds.CANARY_SUITE_PREFIX + "-")
+    return df.assign(
+        run_kind=canary.map(
+            {True: run_kinds.RUN_KIND_CANARY, False: run_kinds.RUN_KIND_FULL}
+        )
+    )
+
+
 def add_temporal_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Add temporal analysis columns to a dataframe with run_id or run column.
+    Add temporal analysis columns (and run_kind) to a dataframe with run_id or
+    run column.
 
     Args:
         df: DataFrame with 'run_id' or 'run' column
@@ -507,6 +587,7 @@ def add_temporal_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     # Extract timestamps
     df["run_timestamp"] = df[run_col].apply(extract_run_timestamp)
+    df = add_run_kind(df)
 
     # Add date components for easier filtering
     df["run_date"] = df["run_timestamp"].dt.date
@@ -571,6 +652,7 @@ def track_model_dataset_over_time(
     model: str,
     dataset: str,
     metric_columns: Optional[list[str]] = None,
+    run_kind: Optional[str] = run_kinds.RUN_KIND_FULL,
 ) -> pd.DataFrame:
     """
     Track a specific model-dataset combination over time.
@@ -580,6 +662,7 @@ def track_model_dataset_over_time(
         model: Model name to filter for
         dataset: Dataset/scenario_class name to filter for
         metric_columns: list of metric columns to track. If None, will find numeric columns.
+        run_kind: only runs of this kind ('full' or 'canary'); None for all
 
     Returns:
         DataFrame with time-series data for the model-dataset combo
@@ -590,6 +673,8 @@ def track_model_dataset_over_time(
     filtered_df = df_with_time[
         (df_with_time["model"] == model) & (df_with_time["scenario_class"] == dataset)
     ].copy()
+    if run_kind is not None:
+        filtered_df = filtered_df[filtered_df["run_kind"] == run_kind]
 
     if filtered_df.empty:
         print(f"No data found for model='{model}' and dataset='{dataset}'")
@@ -762,9 +847,196 @@ def get_performance_summary_by_time(
     return summary
 
 
+def compute_latency_stats(scenario_state_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize provider serving performance per (model, run, scenario).
+
+    Args:
+        scenario_state_df: DataFrame from harvest_scenario_state()
+
+    Returns:
+        DataFrame with request counts, error rate, p50/p90/p99 request time
+        (seconds) and median tokens per second for each model, suite and run spec.
+    """
+    columns = [
+        "model",
+        "run",
+        "run_id",
+        "scenario",
+        "num_requests",
+        "error_rate",
+        "request_time_p50",
+        "request_time_p90",
+        "request_time_p99",
+        "tokens_per_second",
+    ]
+    if scenario_state_df.empty:
+        return pd.DataFrame(columns=columns)
+
+    df = scenario_state_df[
+        ["model", "run", "run_id", "success", "cached", "request_time", "num_tokens"]
+    ].copy()
+    df["success"] = df["success"].astype(bool)
+    df["scenario"] = df["run_id"].str.split(":").str[0]
+
+    # Cached responses say nothing about provider latency
+    timed = df[df["success"] & ~df["cached"].astype(bool)].copy()
+    timed["request_time"] = pd.to_numeric(timed["request_time"], errors="coerce")
+    timed = timed[timed["request_time"] > 0]
+    timed["tokens_per_second"] = timed["num_tokens"] / timed["request_time"]
+
+    group_cols = ["model", "run", "run_id", "scenario"]
+    counts = df.groupby(group_cols).agg(
+        num_requests=("success", "size"), error_rate=("success", lambda s: 1 - s.mean())
+    )
+    percentiles = (
+        timed.groupby(group_cols)["request_time"].quantile([0.5, 0.9, 0.99]).unstack()
+    )
+    percentiles.columns = ["request_time_p50", "request_time_p90", "request_time_p99"]
+    throughput = timed.groupby(group_cols)["tokens_per_second"].median()
+
+    latency_df = counts.join(percentiles).join(throughput).reset_index()
+    latency_df = latency_df[columns].round(4)
+    return latency_df.sort_values(["model", "run", "run_id"]).reset_index(drop=True)
+
+
+def get_latency_by_hour(latency_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll up per-run latency stats by model and hour of day.
+
+    Args:
+        latency_df: DataFrame from compute_latency_stats()
+
+    Returns:
+        DataFrame with mean latency percentiles, throughput and error rate
+        for each (model, run_hour) bucket.
+    """
+    # Hour of day comes from the suite name, not the per-scenario run_id
+    df_with_time = add_temporal_columns(latency_df.drop(columns=["run_id"]))
+    by_hour = (
+        df_with_time.groupby(["model", "run_hour"])
+        .agg(
+            num_runs=("run", "nunique"),
+            num_requests=("num_requests", "sum"),
+            error_rate=("error_rate", "mean"),
+            request_time_p50=("request_time_p50", "mean"),
+            request_time_p90=("request_time_p90", "mean"),
+            request_time_p99=("request_time_p99", "mean"),
+            tokens_per_second=("tokens_per_second", "mean"),
+        )
+        .round(4)
+        .reset_index()
+    )
+    by_hour["run_hour"] = by_hour["run_hour"].astype(int)
+    return by_hour.sort_values(["model", "run_hour"]).reset_index(drop=True)
+
+
+def save_latency_tables(
+    latency_df: pd.DataFrame,
+    output_path: str | Path,
+    append: bool = False,
+) -> pd.DataFrame:
+    """
+    Write latency_summary.csv and latency_by_hour.csv next to *output_path*.
+
+    Args:
+        latency_df: per-run latency stats from compute_latency_stats()
+        output_path: path of the main summary CSV; latency tables go beside it
+        append: merge with an existing latency_summary.csv instead of replacing it
+
+    Returns:
+        the full latency summary that was written
+    """
+    summary_path = Path(output_path).with_name("latency_summary.csv")
+    by_hour_path = Path(output_path).with_name("latency_by_hour.csv")
+
+    if append and summary_path.exists():
+        existing_df = pd.read_csv(summary_path)
+        latency_df = pd.concat([existing_df, latency_df], ignore_index=True)
+        latency_df = latency_df.drop_duplicates(subset=["run", "run_id"], keep="last")
+
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    latency_df.to_csv(summary_path, index=False, lineterminator="\n")
+    if not latency_df.empty:
+        get_latency_by_hour(latency_df).to_csv(
+            by_hour_path, index=False, lineterminator="\n"
+        )
+    return latency_df
+
+
+# Stat columns placed right after the key columns of the summary CSV
+SUMMARY_METRIC_COLUMNS = [
+    "count",
+    "sum",
+    "mean",
+    "min",
+    "max",
+    "std",
+    "variance",
+    "p25",
+    "p50",
+    "p75",
+    "p90",
+    "p95",
+    "p99",
+]
+
+
+def order_summary_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Order summary columns: keys, then stats, then the rest.
+
+    The run_hour/run_weekday helper columns are dropped.
+    """
+    key_columns = [
+        "model",
+        "scenario_class",
+        "run_timestamp",
+        "run_date",
+        "run_id" if "run_id" in df.columns else "run",
+        "run_kind",
+        "metric_name",
+        "split",
+    ]
+    metric_columns = [col for col in df.columns if col in SUMMARY_METRIC_COLUMNS]
+    other_columns = [
+        col
+        for col in df.columns
+        if col not in key_columns + metric_columns + ["run_hour", "run_weekday"]
+    ]
+    final_column_order = key_columns + metric_columns + other_columns
+    return df[[col for col in final_column_order if col in df.columns]]
+
+
+def write_csv_atomic(df: pd.DataFrame, path: str | Path, **to_csv_kwargs: Any) -> None:
+    """
+    Write *df* to *path* through a temporary file in the same directory, so
+    readers (the dashboard's --watch server) never see a half-written CSV.
+    """
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(
+        "w", newline="", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as f:
+        tmp_path = Path(f.name)
+    try:
+        df.to_csv(tmp_path, index=False, **to_csv_kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _csv_header(path: str | Path) -> list[str]:
+    """Column names of the CSV at *path* (empty if it is missing or empty)."""
+    if not Path(path).exists():
+        return []
+    with open(path, newline="") as f:
+        return next(csv.reader(f), [])
+
+
 def extract_results_incremental(
     root: str | Path = "benchmark_output/runs",
     output_path: str | Path = "results/benchmark_summary.csv",
+    run_paths: Optional[list[Path]] = None,
 ) -> dict[str, Any]:
     """
     Extract and process only NEW benchmark data, appending to existing CSV.
@@ -772,42 +1044,53 @@ def extract_results_incremental(
     Args:
         root: Root directory containing benchmark runs
         output_path: Path to save final summary CSV
+        run_paths: suite or scenario directories to append, instead of
+            discovering suites that are not in the CSV yet (used by watch mode)
 
     Returns:
         dictionary containing processed data for reporting
     """
-    print(f"Looking for existing results at: {output_path}")
-
-    # Get existing run IDs from CSV
-    existing_run_ids = get_existing_run_ids(output_path)
-    print(f"Found {len(existing_run_ids)} existing run IDs")
-
-    # Find new runs
-    new_run_paths = find_new_runs(root, existing_run_ids)
-    print(f"Found {len(new_run_paths)} new runs to process")
+    existing_scenarios: Optional[set[tuple[str, str]]] = None
+    if run_paths is None:
+        print(f"Looking for existing results at: {output_path}")
+
+        # Get existing (suite, scenario) pairs from the store or CSV
+        known_scenarios = get_existing_scenarios(output_path)
+        print(f"Found {len(known_scenarios)} existing scenario runs")
+
+        # Find new scenario directories, including ones in partly ingested suites
+        new_run_paths = find_new_scenarios(root, known_scenarios)
+        print(f"Found {len(new_run_paths)} new scenario runs to process")
+        existing_scenarios = known_scenarios
+    else:
+        new_run_paths = list(run_paths)
 
     if not new_run_paths:
         print("No new runs found - loading existing data for reporting")
         if Path(output_path).exists():
-            final_df = pd.read_csv(output_path)
-            stats_df = add_temporal_columns(final_df)
-            combos = get_model_dataset_combos(stats_df)
-
-            # Generate analysis on existing data
-            time_series = None
-            comparison = None
-            example_model = None
-            example_dataset = None
-
-            if not combos.empty:
-                example_model = combos.iloc[0]["model"]
-                example_dataset = combos.iloc[0]["scenario_class"]
-                time_series = track_model_dataset_over_time(
-                    stats_df, example_model, example_dataset
-                )
-                comparison = compare_recent_runs(
-                    stats_df, example_model, example_dataset, last_n_runs=3
-                )
+            with profiling.stage("csv_read"):
+                final_df = pd.read_csv(output_path)
+
+            with profiling.stage("analysis"):
+                stats_df = add_temporal_columns(final_df)
+                combos = get_model_dataset_combos(stats_df)
+                regression_df = regression.build_regression_report(final_df)
+
+                # Generate analysis on existing data
+                time_series = None
+                comparison = None
+                example_model = None
+                example_dataset = None
+
+                if not combos.empty:
+                    example_model = combos.iloc[0]["model"]
+                    example_dataset = combos.iloc[0]["scenario_class"]
+                    time_series = track_model_dataset_over_time(
+                        stats_df, example_model, example_dataset
+                    )
+                    comparison = compare_recent_runs(
+                        stats_df, example_model, example_dataset, last_n_runs=3
+                    )
 
             return {
                 "report": {},
@@ -816,6 +1099,7 @@ def extract_results_incremental(
                 "time_series": time_series,
                 "comparison": comparison,
                 "final_df": final_df,
+                "regression": regression_df,
                 "example_model": example_model,
                 "example_dataset": example_dataset,
                 "output_path": output_path,
@@ -826,112 +1110,140 @@ def extract_results_incremental(
             return extract_results(root, output_path)
 
     # Process only new runs
-    print(f"Processing new runs: {[p.name for p in new_run_paths]}")
-    new_stats_df = harvest_helm_stats_from_runs(new_run_paths)
+    run_names = [f"{path.parent.name}/{path.name}" for path in new_run_paths]
+    print(f"Processing new runs: {run_names}")
+    with profiling.stage("harvest_helm_stats_from_runs"):
+        new_stats_df = harvest_helm_stats_from_runs(new_run_paths)
 
     if new_stats_df.empty:
         print("No new stats found in new runs")
-        return extract_results_incremental(root, output_path)  # Return existing data
+        # Return existing data
+        return extract_results_incremental(root, output_path, run_paths=[])
 
     # Add temporal information
     new_stats_df = add_temporal_columns(new_stats_df)
 
     # Apply the same filtering as the original extract_results
-    keep_metric_names = ["perplexity", "exact_match", "f1_score", "bleu_4", "rouge_l"]
     if "name" in new_stats_df.columns:
         new_stats_df = new_stats_df[
-            new_stats_df.name.isin(keep_metric_names)
+            new_stats_df.name.isin(summarize.KEEP_METRIC_NAMES)
         ].reset_index(drop=True)
 
-    # Load existing data if it exists
-    if Path(output_path).exists():
-        existing_df = pd.read_csv(output_path)
-        # Combine with new data
-        final_df = pd.concat([existing_df, new_stats_df], ignore_index=True)
-    else:
-        final_df = new_stats_df
-
-    # Reorder columns for better readability (same as original)
-    key_columns = [
-        "model",
-        "scenario_class",
-        "run_timestamp",
-        "run_date",
-        "run_id" if "run_id" in final_df.columns else "run",
-        "metric_name",
-        "split",
-    ]
-
-    # Add all metric/stat columns
-    metric_columns = [
-        col
-        for col in final_df.columns
-        if col
-        in [
-            "count",
-            "sum",
-            "mean",
-            "min",
-            "max",
-            "std",
-            "variance",
-            "p25",
-            "p50",
-            "p75",
-            "p90",
-            "p95",
-            "p99",
-        ]
-    ]
-
-    # Add any remaining columns that might be useful
-    other_columns = [
-        col
-        for col in final_df.columns
-        if col not in key_columns + metric_columns + ["run_hour", "run_weekday"]
-    ]
-
-    # Final column order
-    final_column_order = key_columns + metric_columns + other_columns
-    final_column_order = [col for col in final_column_order if col in final_df.columns]
-
-    final_df = final_df[final_column_order]
-
-    # Sort by model, scenario, timestamp, and metric name for consistent ordering
-    sort_columns = ["model", "scenario_class", "run_timestamp", "name"]
-    sort_columns = [col for col in sort_columns if col in final_df.columns]
-    final_df = final_df.sort_values(sort_columns).reset_index(drop=True)
+    # Reorder columns and sort the new rows like a full extraction
+    new_stats_df = order_summary_columns(new_stats_df)
+    sort_columns = [col for col in SUMMARY_SORT_COLUMNS if col in new_stats_df.columns]
+    with profiling.stage("sort"):
+        new_stats_df = new_stats_df.sort_values(sort_columns).reset_index(drop=True)
 
     # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Save to CSV with proper line endings and quoting
-    final_df.to_csv(
-        output_path, index=False, lineterminator="\n", quoting=csv.QUOTE_MINIMAL
-    )
+    if existing_scenarios is None:
+        existing_scenarios = get_existing_scenarios(output_path)
+    new_scenarios = set(zip(new_stats_df["run"], new_stats_df["run_name"]))
+    header = _csv_header(output_path)
+
+    final_df = None
+    if not header:
+        with profiling.stage("csv_write"):
+            write_csv_atomic(
+                new_stats_df,
+                output_path,
+                lineterminator="\n",
+                quoting=csv.QUOTE_MINIMAL,
+            )
+        final_df = new_stats_df
+    elif new_scenarios.isdisjoint(existing_scenarios) and set(
+        new_stats_df.columns
+    ) <= set(header):
+        # Only new scenarios with known columns: append them in the CSV's layout
+        with profiling.stage("csv_write"):
+            new_stats_df.reindex(columns=header).to_csv(
+                output_path,
+                mode="a",
+                header=False,
+                index=False,
+                lineterminator="\n",
+                quoting=csv.QUOTE_MINIMAL,
+            )
+    else:
+        # Re-ingested scenarios replace their rows and new scenario args add
+        # columns, so the CSV is rewritten
+        with profiling.stage("csv_read"):
+            existing_df = pd.read_csv(output_path)
+        replaced = pd.Series(
+            list(zip(existing_df["run"], existing_df["run_name"]))
+        ).isin(new_scenarios)
+        final_df = pd.concat(
+            [existing_df[~replaced.to_numpy()], new_stats_df], ignore_index=True
+        )
+        columns = store.merge_column_order(header, list(new_stats_df.columns))
+        final_df = order_summary_columns(final_df[columns])
+        with profiling.stage("sort"):
+            final_df = final_df.sort_values(sort_columns).reset_index(drop=True)
+        with profiling.stage("csv_write"):
+            write_csv_atomic(
+                final_df, output_path, lineterminator="\n", quoting=csv.QUOTE_MINIMAL
+            )
+
+    # Keep the store in step once it exists; otherwise query() imports the CSV
+    # the first time it is needed, so runs without one never pay for it
+    db_path = store.db_path_for(output_path)
+    if db_path.exists():
+        with profiling.stage("db_write"):
+            store.upsert(new_stats_df, db_path)
+
+    # The reports below cover every series
+    if final_df is None:
+        with profiling.stage("csv_read"):
+            final_df = pd.read_csv(output_path)
     print(
         f"Updated CSV saved with {len(final_df)} total rows ({len(new_stats_df)} new rows)"
     )
 
+    # Downsampled series for the dashboard's long time ranges
+    with profiling.stage("downsample"):
+        downsample.save_downsampled_series(final_df, output_path)
+
+    # Latest run vs. trailing baseline for every series
+    with profiling.stage("regression"):
+        regression_df = regression.save_regression_report(final_df, output_path)
+
+    # Provider serving performance for the new runs only
+    latency_df = None
+    with profiling.stage("latency"):
+        with_scenario_state = [
+            run_path
+            for run_path in new_run_paths
+            if any(run_path.rglob("scenario_state.json"))
+        ]
+        if with_scenario_state:
+            latency_df = save_latency_tables(
+                compute_latency_stats(harvest_scenario_state(with_scenario_state)),
+                output_path,
+                append=True,
+            )
+
     # Generate analysis on full dataset
-    stats_df = add_temporal_columns(final_df)
-    combos = get_model_dataset_combos(stats_df)
-
-    # Track example model-dataset combo over time (if available)
-    time_series = None
-    comparison = None
-    example_model = None
-    example_dataset = None
-
-    if not combos.empty:
-        example_model = combos.iloc[0]["model"]
-        example_dataset = combos.iloc[0]["scenario_class"]
-        time_series = track_model_dataset_over_time(
-            stats_df, example_model, example_dataset
-        )
-        comparison = compare_recent_runs(
-            stats_df, example_model, example_dataset, last_n_runs=3
-        )
+    with profiling.stage("analysis"):
+        stats_df = add_temporal_columns(final_df)
+        combos = get_model_dataset_combos(stats_df)
+
+        # Track example model-dataset combo over time (if available)
+        time_series = None
+        comparison = None
+        example_model = None
+        example_dataset = None
+
+        if not combos.empty:
+            example_model = combos.iloc[0]["model"]
+            example_dataset = combos.iloc[0]["scenario_class"]
+            time_series = track_model_dataset_over_time(
+                stats_df, example_model, example_dataset
+            )
+            comparison = compare_recent_runs(
+                stats_df, example_model, example_dataset, last_n_runs=3
+            )
 
     return {
         "report": {},
@@ -940,10 +1252,12 @@ def extract_results_incremental(
         "time_series": time_series,
         "comparison": comparison,
         "final_df": final_df,
+        "regression": regression_df,
         "example_model": example_model,
         "example_dataset": example_dataset,
         "output_path": output_path,
         "new_runs_processed": len(new_run_paths),
+        "latency_df": latency_df,
     }
 
 
@@ -965,101 +1279,307 @@ def extract_results(
     # Create comprehensive report
     report = create_comprehensive_report(root)
 
-    # Get the main stats dataframe with temporal information
-    stats_df = add_temporal_columns(report["stats"])
+    with profiling.stage("analysis"):
+        # Get the main stats dataframe with temporal information
+        stats_df = add_temporal_columns(report["stats"])
 
-    # Get model-dataset combinations
-    combos = get_model_dataset_combos(stats_df)
+        # Get model-dataset combinations
+        combos = get_model_dataset_combos(stats_df)
 
-    # Track example model-dataset combo over time (if available)
-    time_series = None
-    comparison = None
-    example_model = None
-    example_dataset = None
+        # Track example model-dataset combo over time (if available)
+        time_series = None
+        comparison = None
+        example_model = None
+        example_dataset = None
 
-    if not combos.empty:
-        example_model = combos.iloc[0]["model"]
-        example_dataset = combos.iloc[0]["scenario_class"]
-        time_series = track_model_dataset_over_time(
-            stats_df, example_model, example_dataset
-        )
-        comparison = compare_recent_runs(
-            stats_df, example_model, example_dataset, last_n_runs=3
-        )
+        if not combos.empty:
+            example_model = combos.iloc[0]["model"]
+            example_dataset = combos.iloc[0]["scenario_class"]
+            time_series = track_model_dataset_over_time(
+                stats_df, example_model, example_dataset
+            )
+            comparison = compare_recent_runs(
+                stats_df, example_model, example_dataset, last_n_runs=3
+            )
 
     # Create the final clean dataframe with all key information
     final_df = stats_df.copy()
 
+    final_df = final_df[final_df.name.isin(summarize.KEEP_METRIC_NAMES)].reset_index(
+        drop=True
+    )
+
     # Reorder columns for better readability
-    key_columns = [
-        "model",
-        "scenario_class",
-        "run_timestamp",
-        "run_date",
-        "run_id" if "run_id" in final_df.columns else "run",
-        "metric_name",
-        "split",
-    ]
+    final_df = order_summary_columns(final_df)
 
-    # Add all metric/stat columns
-    metric_columns = [
-        col
-        for col in final_df.columns
-        if col
-        in [
-            "count",
-            "sum",
-            "mean",
-            "min",
-            "max",
-            "std",
-            "variance",
-            "p25",
-            "p50",
-            "p75",
-            "p90",
-            "p95",
-            "p99",
+    # Sort by model, scenario, timestamp and metric name, like incremental runs
+    sort_columns = [col for col in SUMMARY_SORT_COLUMNS if col in final_df.columns]
+    with profiling.stage("sort"):
+        final_df = final_df.sort_values(sort_columns).reset_index(drop=True)
+
+    # Ensure output directory exists
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    # Save to CSV
+    with profiling.stage("csv_write"):
+        write_csv_atomic(final_df, output_path)
+
+    # Rebuild the store from scratch to match the CSV
+    db_path = store.db_path_for(output_path)
+    db_path.unlink(missing_ok=True)
+    with profiling.stage("db_write"):
+        store.upsert(final_df, db_path)
+
+    # Downsampled series for the dashboard's long time ranges
+    with profiling.stage("downsample"):
+        downsample.save_downsampled_series(final_df, output_path)
+
+    # Latest run vs. trailing baseline for every series
+    with profiling.stage("regression"):
+        regression_df = regression.save_regression_report(final_df, output_path)
+
+    # Provider serving performance from per-request timings
+    with profiling.stage("latency"):
+        latency_df = save_latency_tables(
+            compute_latency_stats(report["scenario_state"]), output_path
+        )
+
+    return {
+        "report": report,
+        "stats_df": stats_df,
+        "combos": combos,
+        "time_series": time_series,
+        "comparison": comparison,
+        "final_df": final_df,
+        "regression": regression_df,
+        "example_model": example_model,
+        "example_dataset": example_dataset,
+        "output_path": output_path,
+        "latency_df": latency_df,
+    }
+
+
+# Rough bytes of memory per byte of harvested JSON while a chunk is processed
+# (decoded JSON, row dicts, then DataFrames and their sorted copies)
+MEMORY_PER_JSON_BYTE = 8
+
+# Files the chunked extraction reads; their sizes decide the chunks
+CHUNK_FILES = ("stats.json", "run_spec.json", "scenario_state.json")
+
+# Order of benchmark_summary.csv rows when it is merged from sorted chunks
+SUMMARY_SORT_COLUMNS = ["model", "scenario_class", "run_timestamp", "name"]
+
+
+def _suite_bytes(suite_path: Path | archives.ArchivePath) -> int:
+    """Bytes of the CHUNK_FILES in one suite (uncompressed, for archives)."""
+    if isinstance(suite_path, archives.ArchivePath):
+        sizes = [path.size() for name in CHUNK_FILES for path in suite_path.rglob(name)]
+    else:
+        sizes = [
+            path.stat().st_size
+            for name in CHUNK_FILES
+            for path in suite_path.rglob(name)
         ]
-    ]
+    return sum(sizes)
 
-    keep_metric_names = ["perplexity", "exact_match", "f1_score", "bleu_4", "rouge_l"]
-    final_df = final_df[final_df.name.isin(keep_metric_names)].reset_index(drop=True)
 
-    # Add any remaining columns that might be useful
-    other_columns = [
-        col
-        for col in final_df.columns
-        if col not in key_columns + metric_columns + ["run_hour", "run_weekday"]
-    ]
+def plan_chunks(
+    suite_paths: Sequence[Path | archives.ArchivePath], max_memory: int
+) -> list[list[Path | archives.ArchivePath]]:
+    """
+    Group suites, in order, into chunks expected to fit in *max_memory* bytes.
 
-    # Final column order
-    final_column_order = key_columns + metric_columns + other_columns
-    final_column_order = [col for col in final_column_order if col in final_df.columns]
+    A suite larger than the budget gets a chunk of its own.
+    """
+    budget = max_memory / MEMORY_PER_JSON_BYTE
+    chunks: list[list[Path | archives.ArchivePath]] = []
+    chunk_bytes = 0.0
+    for suite_path in suite_paths:
+        size = _suite_bytes(suite_path)
+        if not chunks or chunk_bytes + size > budget:
+            chunks.append([])
+            chunk_bytes = 0.0
+        chunks[-1].append(suite_path)
+        chunk_bytes += size
+    return chunks
+
+
+def _csv_sort_key(value: Any) -> str:
+    """A value as written to CSV, so chunks sort the way they are merged."""
+    return "" if pd.isna(value) else str(value)
+
+
+def merge_sorted_csvs(
+    chunk_paths: list[Path], output_path: str | Path, sort_columns: list[str]
+) -> int:
+    """
+    K-way merge CSV files, each sorted by *sort_columns*, into *output_path*.
 
-    final_df = final_df[final_column_order]
+    Rows are streamed; only one row per chunk is in memory. The output has
+    the union of the chunks' columns in first-seen order; empty chunk files
+    (no header) are skipped.
 
-    # Sort by model, scenario, and timestamp for nice ordering
-    sort_columns = ["model", "scenario_class", "run_timestamp", "metric_name"]
-    sort_columns = [col for col in sort_columns if col in final_df.columns]
-    final_df = final_df.sort_values(sort_columns).reset_index(drop=True)
+    Returns:
+        number of rows written
+    """
+    with contextlib.ExitStack() as stack:
+        readers = []
+        for path in chunk_paths:
+            reader = csv.DictReader(stack.enter_context(open(path, newline="")))
+            if reader.fieldnames is not None:
+                readers.append(reader)
+        fieldnames = list(
+            dict.fromkeys(
+                column for reader in readers for column in reader.fieldnames or []
+            )
+        )
+        output = stack.enter_context(open(output_path, "w", newline=""))
+        writer = csv.DictWriter(output, fieldnames, restval="", lineterminator="\n")
+        writer.writeheader()
+        rows = 0
+        for row in heapq.merge(
+            *readers, key=lambda row: tuple(row.get(c, "") for c in sort_columns)
+        ):
+            writer.writerow(row)
+            rows += 1
+    return rows
+
+
+def extract_results_chunked(
+    root: str | Path = "benchmark_output/runs",
+    output_path: str | Path = "results/benchmark_summary.csv",
+    max_memory: int = 2 * 2**30,
+) -> dict[str, Any]:
+    """
+    Full extraction in chunks of suites sized to a memory budget.
 
-    # Ensure output directory exists
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    Each chunk is harvested, sorted and spilled to a temporary CSV (and
+    written to the store); the spilled chunks are then k-way merged into the
+    summary CSV. Latency tables are computed per chunk. Only the stats and
+    scenario_state tables are harvested, since only they are written out.
 
-    # Save to CSV
-    final_df.to_csv(output_path, index=False)
+    Args:
+        root: Root directory (or archive) containing benchmark runs
+        output_path: Path to save final summary CSV
+        max_memory: memory budget in bytes for one chunk
+
+    Returns:
+        dictionary containing processed data for reporting
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    suite_paths = sorted(find_new_runs(root, set()), key=lambda path: path.name)
+    chunks = plan_chunks(suite_paths, max_memory)
+    print(
+        f"Extracting {len(suite_paths)} suites in {len(chunks)} chunks "
+        f"(budget {max_memory / 2**20:.0f} MB)"
+    )
+
+    db_path = store.db_path_for(output_path)
+    db_path.unlink(missing_ok=True)
+    latency_frames = []
+    with tempfile.TemporaryDirectory(
+        prefix=".extract-", dir=output_path.parent
+    ) as spill_dir:
+        chunk_paths = []
+        for index, chunk in enumerate(chunks):
+            with profiling.stage("harvest_helm_stats_from_runs"):
+                chunk_df = harvest_helm_stats_from_runs(chunk)
+            if not chunk_df.empty:
+                chunk_df = add_temporal_columns(chunk_df)
+                chunk_df = chunk_df[chunk_df.name.isin(summarize.KEEP_METRIC_NAMES)]
+                chunk_df = order_summary_columns(chunk_df)
+                with profiling.stage("sort"):
+                    chunk_df = chunk_df.sort_values(
+                        SUMMARY_SORT_COLUMNS,
+                        key=lambda column: column.map(_csv_sort_key),
+                        kind="stable",
+                    )
+                chunk_path = Path(spill_dir) / f"chunk-{index:05d}.csv"
+                with profiling.stage("spill"):
+                    chunk_df.to_csv(chunk_path, index=False, lineterminator="\n")
+                chunk_paths.append(chunk_path)
+                with profiling.stage("db_write"):
+                    store.upsert(chunk_df, db_path)
+
+            with profiling.stage("latency"):
+                with_scenario_state = [
+                    run_path
+                    for run_path in chunk
+                    if any(run_path.rglob("scenario_state.json"))
+                ]
+                if with_scenario_state:
+                    latency_frames.append(
+                        compute_latency_stats(
+                            harvest_scenario_state(with_scenario_state)
+                        )
+                    )
+            print(
+                f"  chunk {index + 1}/{len(chunks)}: {len(chunk)} suites, "
+                f"{len(chunk_df)} rows"
+            )
+            del chunk_df
+
+        if not chunk_paths:
+            raise ValueError(
+                f"No rows found in extract_results_chunked! Along path {root}"
+            )
+        # Merge next to the chunks, then swap the finished CSV into place
+        merged_path = Path(spill_dir) / output_path.name
+        with profiling.stage("merge"):
+            rows = merge_sorted_csvs(chunk_paths, merged_path, SUMMARY_SORT_COLUMNS)
+        os.replace(merged_path, output_path)
+    print(f"Merged {len(chunk_paths)} chunks into {rows} rows -> {output_path}")
+
+    # The summary itself is small next to the harvested tables
+    with profiling.stage("csv_read"):
+        final_df = pd.read_csv(output_path)
+    with profiling.stage("downsample"):
+        downsample.save_downsampled_series(final_df, output_path)
+
+    # Latest run vs. trailing baseline for every series
+    with profiling.stage("regression"):
+        regression_df = regression.save_regression_report(final_df, output_path)
+    with profiling.stage("latency"):
+        latency_df = save_latency_tables(
+            (
+                pd.concat(latency_frames, ignore_index=True)
+                if latency_frames
+                else compute_latency_stats(pd.DataFrame())
+            ),
+            output_path,
+        )
+
+    with profiling.stage("analysis"):
+        stats_df = add_temporal_columns(final_df)
+        combos = get_model_dataset_combos(stats_df)
+        time_series = None
+        comparison = None
+        example_model = None
+        example_dataset = None
+        if not combos.empty:
+            example_model = combos.iloc[0]["model"]
+            example_dataset = combos.iloc[0]["scenario_class"]
+            time_series = track_model_dataset_over_time(
+                stats_df, example_model, example_dataset
+            )
+            comparison = compare_recent_runs(
+                stats_df, example_model, example_dataset, last_n_runs=3
+            )
 
     return {
-        "report": report,
+        "report": {},
         "stats_df": stats_df,
         "combos": combos,
         "time_series": time_series,
         "comparison": comparison,
         "final_df": final_df,
+        "regression": regression_df,
         "example_model": example_model,
         "example_dataset": example_dataset,
         "output_path": output_path,
+        "chunks": len(chunks),
+        "latency_df": latency_df,
     }
 
 
@@ -1085,6 +1605,8 @@ def report(data: dict[str, Any]) -> None:
     if report_dict:
         for name, df in report_dict.items():
             print(f"  {name}: {len(df)} rows, {len(df.columns)} columns")
+    elif data.get("chunks"):
+        print(f"  Chunked full extraction: {data['chunks']} chunks")
     else:
         print(f"  Incremental processing: {new_runs_processed} new runs processed")
 
@@ -1118,9 +1640,10 @@ def report(data: dict[str, Any]) -> None:
         if comparison and "error" not in comparison:
             print(f"  Runs compared: {comparison['runs_compared']}")
             print(f"  Time span: {comparison['time_span']['days']} days")
-            for metric, data in comparison["metrics"].items():
+            for metric, values in comparison["metrics"].items():
                 print(
-                    f"  {metric}: {data['latest_value']:.3f} (trend: {data['trend']})"
+                    f"  {metric}: {values['latest_value']:.3f} "
+                    f"(trend: {values['trend']})"
                 )
 
     print("\n" + "=" * 50)
@@ -1133,6 +1656,35 @@ def report(data: dict[str, Any]) -> None:
     print("\nFirst few rows:")
     print(final_df.head().to_string())
 
+    regression_df = data.get("regression")
+    if regression_df is not None and not regression_df.empty:
+        print("\n" + "=" * 50)
+        print("REGRESSION REPORT (latest run vs. trailing baseline)")
+        print("=" * 50)
+        anomalous = int(regression_df["anomalous"].sum())
+        print(
+            f"{len(regression_df)} series, {anomalous} with "
+            f"|z| >= {regression.Z_THRESHOLD:g} (marked *):"
+        )
+        print(regression.format_report(regression_df))
+
+    latency_df = data.get("latency_df")
+    if latency_df is not None and not latency_df.empty:
+        print("\nServing performance (mean over runs, seconds):")
+        print(
+            latency_df.groupby("model")[
+                [
+                    "request_time_p50",
+                    "request_time_p99",
+                    "tokens_per_second",
+                    "error_rate",
+                ]
+            ]
+            .mean()
+            .round(3)
+            .to_string()
+        )
+
     # Always show incremental info if available
     if new_runs_processed != "unknown":
         print("\nINCREMENTAL EXTRACTION SUMMARY:")
@@ -1145,9 +1697,62 @@ def report(data: dict[str, Any]) -> None:
             )
 
 
+def ensure_store(output_path: str | Path) -> Path:
+    """
+    Path of the SQLite store next to *output_path*, importing the summary CSV
+    into it first if the CSV exists but the store does not.
+    """
+    db_path = store.db_path_for(output_path)
+    if not db_path.exists() and Path(output_path).exists():
+        with profiling.stage("csv_read"):
+            count = store.import_csv(output_path, db_path)
+        print(f"Imported {count} rows from {output_path} into {db_path}")
+    return db_path
+
+
+def query(
+    model: Optional[str | list[str]] = None,
+    metric: Optional[str | list[str]] = None,
+    since: Optional[Any] = None,
+    until: Optional[Any] = None,
+    scenario_class: Optional[str | list[str]] = None,
+    output_path: str | Path = "results/benchmark_summary.csv",
+    run_kind: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Load summary rows for a model, metric and/or date range from the store.
+
+    Uses indexed lookups in the SQLite store next to *output_path* instead of
+    reading the whole CSV.
+
+    Args:
+        model: model name(s), e.g. 'openai/gpt-4o-mini-2024-07-18'
+        metric: metric name(s), e.g. 'exact_match'
+        since: earliest run_timestamp to include (e.g. '2025-06-01')
+        until: latest run_timestamp to include
+        scenario_class: scenario class name(s)
+        output_path: path of the summary CSV the store sits next to
+        run_kind: 'full' or 'canary' (default: both)
+
+    Returns:
+        DataFrame in the summary CSV layout
+    """
+    return store.query(
+        ensure_store(output_path),
+        model=model,
+        scenario_class=scenario_class,
+        metric=metric,
+        since=since,
+        until=until,
+        run_kind=run_kind,
+    )
+
+
 def get_existing_run_ids(csv_path: str | Path) -> set[str]:
     """
-    Get the set of run IDs already present in the existing CSV file.
+    Get the set of run IDs already present in the existing results.
+
+    Reads the SQLite store when there is one, otherwise the CSV.
 
     Args:
         csv_path: Path to existing CSV file
@@ -1155,11 +1760,16 @@ def get_existing_run_ids(csv_path: str | Path) -> set[str]:
     Returns:
         Set of run IDs that are already processed
     """
+    db_path = store.db_path_for(csv_path)
+    if db_path.exists():
+        return store.get_run_ids(db_path)
+
     if not Path(csv_path).exists():
         return set()
 
     try:
-        existing_df = pd.read_csv(csv_path)
+        with profiling.stage("csv_read"):
+            existing_df = pd.read_csv(csv_path)
         # Handle both 'run_id' and 'run' column names
         if "run_id" in existing_df.columns:
             return set(existing_df["run_id"].unique())
@@ -1172,7 +1782,57 @@ def get_existing_run_ids(csv_path: str | Path) -> set[str]:
         return set()
 
 
-def find_new_runs(root: str | Path, existing_run_ids: set[str]) -> list[Path]:
+def get_existing_scenarios(csv_path: str | Path) -> set[tuple[str, str]]:
+    """
+    (run, run_name) pairs already present in the existing results.
+
+    Reads the SQLite store when there is one, otherwise the CSV.
+    """
+    db_path = store.db_path_for(csv_path)
+    if db_path.exists():
+        return store.get_scenario_keys(db_path)
+
+    if not Path(csv_path).exists():
+        return set()
+
+    with profiling.stage("csv_read"):
+        existing_df = pd.read_csv(
+            csv_path, usecols=lambda col: col in ("run", "run_name")
+        )
+    if not {"run", "run_name"} <= set(existing_df.columns):
+        return set()
+    return set(existing_df.drop_duplicates().itertuples(index=False, name=None))
+
+
+def find_new_scenarios(
+    root: str | Path, existing_scenarios: set[tuple[str, str]]
+) -> list[Path | archives.ArchivePath]:
+    """
+    Find scenario directories whose (suite, run spec) pair is not ingested yet.
+
+    HELM names each scenario directory after its run spec, so a suite that was
+    only partly ingested (e.g. by an interrupted `extract --watch`) still has
+    its remaining scenarios picked up.
+
+    Args:
+        root: Root directory containing benchmark runs
+        existing_scenarios: (run, run_name) pairs already processed
+
+    Returns:
+        list of paths to new scenario directories
+    """
+    new_scenario_paths: list[Path | archives.ArchivePath] = []
+    for stats_path in _find_files(root, "stats.json"):
+        scenario_path = stats_path.parent
+        key = (scenario_path.parent.name, scenario_path.name)
+        if key not in existing_scenarios:
+            new_scenario_paths.append(scenario_path)
+    return list(dict.fromkeys(new_scenario_paths))
+
+
+def find_new_runs(
+    root: str | Path, existing_run_ids: set[str]
+) -> list[Path | archives.ArchivePath]:
     """
     Find run directories that are not in the existing run IDs.
 
@@ -1185,14 +1845,14 @@ def find_new_runs(root: str | Path, existing_run_ids: set[str]) -> list[Path]:
     """
     new_run_paths = []
 
-    for stats_path in Path(root).rglob("stats.json"):
+    for stats_path in _find_files(root, "stats.json"):
         run_id = stats_path.parent.parent.name  # Get suite name from path structure
         if run_id not in existing_run_ids:
             new_run_paths.append(stats_path.parent.parent)
 
     # Remove duplicates while preserving order
     seen = set()
-    unique_new_runs = []
+    unique_new_runs: list[Path | archives.ArchivePath] = []
     for path in new_run_paths:
         if path not in seen:
             seen.add(path)
@@ -1201,7 +1861,9 @@ def find_new_runs(root: str | Path, existing_run_ids: set[str]) -> list[Path]:
     return unique_new_runs
 
 
-def harvest_helm_stats_from_runs(run_paths: list[Path]) -> pd.DataFrame:
+def harvest_helm_stats_from_runs(
+    run_paths: Sequence[Path | archives.ArchivePath],
+) -> pd.DataFrame:
     """
     Extract stats from specific run paths only.
 
@@ -1213,65 +1875,54 @@ def harvest_helm_stats_from_runs(run_paths: list[Path]) -> pd.DataFrame:
     """
     rows: list[dict[str, Any]] = []
 
-    for run_path in run_paths:
-        for stats_path in run_path.rglob("stats.json"):
-            # Load stats.json
-            with stats_path.open() as f:
-                stats_list: list[dict[str, Any]] = json.load(f)
-
-            # Load corresponding run_spec.json
-            run_spec_path = stats_path.parent / "run_spec.json"
-            run_spec = {}
-            if run_spec_path.exists():
-                with run_spec_path.open() as f:
-                    run_spec = json.load(f)
-
-            # Extract metadata from run_spec
-            model = run_spec.get("adapter_spec", {}).get("model", "unknown")
-            run_name = run_spec.get("name", stats_path.parent.name)
-            scenario_class = run_spec.get("scenario_spec", {}).get(
-                "class_name", "unknown"
-            )
-            scenario_args = run_spec.get("scenario_spec", {}).get("args", {})
+    for stats_path in _find_files_in(run_paths, "stats.json"):
+        # Load stats.json
+        stats_list: list[dict[str, Any]] = _load_json(stats_path)
 
-            # Get the suite name from the path structure:
-            #  --> benchmark_output/runs/SUITE_NAME/scenario/stats.json
-            suite_name = stats_path.parent.parent.name
+        # Load corresponding run_spec.json
+        run_spec_path = stats_path.parent / "run_spec.json"
+        run_spec = {}
+        if run_spec_path.exists():
+            run_spec = _load_json(run_spec_path)
 
-            for stat_entry in stats_list:
-                # Flatten the nested name dictionary
-                name_dict = stat_entry.get("name", {})
+        # Extract metadata from run_spec
+        model = run_spec.get("adapter_spec", {}).get("model", "unknown")
+        run_name = run_spec.get("name", stats_path.parent.name)
+        scenario_class = run_spec.get("scenario_spec", {}).get("class_name", "unknown")
+        scenario_args = run_spec.get("scenario_spec", {}).get("args", {})
 
-                # Create row with base metadata + flattened name fields + other stat fields
-                row = {
-                    "model": model,
-                    "run": suite_name,  # This now contains the timestamp-based suite name
-                    "run_name": run_name,
-                    "scenario_class": scenario_class,
-                }
+        # Get the suite name from the path structure:
+        #  --> benchmark_output/runs/SUITE_NAME/scenario/stats.json
+        suite_name = stats_path.parent.parent.name
 
-                # Add scenario args as separate columns
-                for arg_key, arg_value in scenario_args.items():
-                    row[f"scenario_{arg_key}"] = arg_value
+        for stat_entry in stats_list:
+            # Flatten the nested name dictionary
+            name_dict = stat_entry.get("name", {})
 
-                # Add flattened name fields (metric_name, split, etc.)
-                row.update(name_dict)
+            # Create row with base metadata + flattened name fields + other stat fields
+            row = {
+                "model": model,
+                "run": suite_name,  # This now contains the timestamp-based suite name
+                "run_name": run_name,
+                "scenario_class": scenario_class,
+            }
 
-                # Add other statistical fields (count, sum, mean, etc.)
-                for key, value in stat_entry.items():
-                    if (
-                        key != "name"
-                    ):  # Skip the name dict since we already flattened it
-                        row[key] = value
+            # Add scenario args as separate columns
+            for arg_key, arg_value in scenario_args.items():
+                row[f"scenario_{arg_key}"] = arg_value
 
-                rows.append(row)
+            # Add flattened name fields (metric_name, split, etc.)
+            row.update(name_dict)
+
+            # Add other statistical fields (count, sum, mean, etc.)
+            for key, value in stat_entry.items():
+                if key != "name":  # Skip the name dict since we already flattened it
+                    row[key] = value
+
+            rows.append(row)
 
     if len(rows) == 0:
         # Return empty DataFrame with expected columns
         return pd.DataFrame(columns=["model", "run", "run_name", "scenario_class"])
 
-    return (
-        pd.DataFrame(rows)
-        .sort_values(["model", "run"], ascending=[True, True])
-        .reset_index(drop=True)
-    )
+    return _rows_to_frame(rows, ["model", "run"], ascending=[True, True])
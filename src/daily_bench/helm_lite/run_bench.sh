@@ -1,3 +1,6 @@
+# Sequential reference runner. `daily-bench run` uses the same settings but launches
+# one helm-run per provider in parallel (see daily_bench/orchestrator.py).
+
 # Pick any suite name of your choice
 export SUITE_NAME=results-$(date +"%Y%m%d_%H%M%S")
 # Note: HELM outputs to benchmark_output/runs/$SUITE_NAME by default
@@ -14,4 +17,10 @@ export MAX_EVAL_INSTANCES=50
 export PRIORITY=1
 
 helm-run --conf-paths $RUN_ENTRIES_CONF_PATH --num-train-trials $NUM_TRAIN_TRIALS --max-eval-instances $MAX_EVAL_INSTANCES --priority $PRIORITY --suite $SUITE_NAME --models-to-run $MODELS_TO_RUN --disable-cache
-helm-summarize --schema $SCHEMA_PATH --suite $SUITE_NAME
+# helm-summarize rebuilds HELM's full website JSON, which daily-bench never reads;
+# set HELM_SUMMARIZE=1 to run it, otherwise only the daily-bench summary is written
+if [ "${HELM_SUMMARIZE:-0}" = "1" ]; then
+    helm-summarize --schema $SCHEMA_PATH --suite $SUITE_NAME
+else
+    daily-bench summarize --suite $SUITE_NAME --runs-dir benchmark_output/runs
+fi
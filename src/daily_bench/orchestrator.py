@@ -0,0 +1,498 @@
+"""
+Run the HELM Lite benchmark as parallel `helm-run` processes.
+Each model group (one per provider or per model) gets its own `helm-run`,
+all writing into the same suite under `helm_lite/benchmark_output/runs`.
+Settings mirror `helm_lite/run_bench.sh`.
+"""
+
+import datetime
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+from daily_bench import scenario_cache, sequential, summarize
+from daily_bench.run_kinds import CANARY_SUITE_PREFIX, SUITE_PREFIX
+
+HELM_LITE_DIR = Path(__file__).parent / "helm_lite"
+
+MODELS_TO_RUN = [
+    "anthropic/claude-sonnet-4-20250514",
+    "openai/gpt-4o-mini-2024-07-18",
+    "openai/gpt-4.1-2025-04-14",
+    "google/gemini-2.5-pro",
+    "google/gemini-2.5-flash",
+]
+RUN_ENTRIES_CONF_PATH = "run_entries_lite_20240424_instruct.conf"
+SCHEMA_PATH = "schema_lite.yaml"
+NUM_TRAIN_TRIALS = 1
+MAX_EVAL_INSTANCES = 50
+PRIORITY = 1
+
+# Instances per scenario in a canary probe; HELM samples them with a fixed
+# seed, so every probe sends the same prompts
+CANARY_MAX_EVAL_INSTANCES = 10
+
+# Serializes progress lines coming from concurrent helm-run processes
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    """Print a line without interleaving it with other processes' output."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def make_suite_name(
+    now: Optional[datetime.datetime] = None, prefix: str = SUITE_PREFIX
+) -> str:
+    """Build a timestamped suite name, e.g. 'results-20250608_112220'."""
+    now = now or datetime.datetime.now()
+    return f"{prefix}-{now.strftime('%Y%m%d_%H%M%S')}"
+
+
+def get_models_to_run() -> list[str]:
+    """Return the models to benchmark, honoring a MODELS_TO_RUN env override."""
+    override = os.environ.get("MODELS_TO_RUN")
+    if override:
+        return override.split()
+    return list(MODELS_TO_RUN)
+
+
+def get_provider(model: str) -> str:
+    """Get the provider prefix of a HELM model name ('openai/gpt-4o' -> 'openai')."""
+    return model.split("/", 1)[0] if "/" in model else "unknown"
+
+
+def group_models(models: list[str], group_by: str = "provider") -> dict[str, list[str]]:
+    """
+    Split models into the groups that each get their own helm-run process.
+
+    Args:
+        models: HELM model names
+        group_by: 'provider' (one process per API provider) or 'model'
+
+    Returns:
+        dictionary mapping group label to its models, in first-seen order
+    """
+    if group_by not in ("provider", "model"):
+        raise ValueError(f"group_by must be 'provider' or 'model', got {group_by!r}")
+
+    groups: dict[str, list[str]] = {}
+    for model in models:
+        label = get_provider(model) if group_by == "provider" else model
+        groups.setdefault(label, []).append(model)
+    return groups
+
+
+def build_helm_run_command(
+    models: list[str],
+    suite_name: str,
+    conf_path: str = RUN_ENTRIES_CONF_PATH,
+    max_eval_instances: int = MAX_EVAL_INSTANCES,
+    num_train_trials: int = NUM_TRAIN_TRIALS,
+    priority: int = PRIORITY,
+    disable_cache: bool = True,
+    dry_run: bool = False,
+    local_path: Optional[Path] = None,
+) -> list[str]:
+    """Build the `helm-run` argument list for one model group."""
+    command = [
+        "helm-run",
+        "--conf-paths",
+        conf_path,
+        "--num-train-trials",
+        str(num_train_trials),
+        "--max-eval-instances",
+        str(max_eval_instances),
+        "--priority",
+        str(priority),
+        "--suite",
+        suite_name,
+        "--models-to-run",
+        *models,
+    ]
+    if disable_cache:
+        command.append("--disable-cache")
+    if dry_run:
+        command.append("--dry-run")
+    if local_path is not None:
+        command += ["--local-path", str(local_path)]
+    return command
+
+
+def run_group(
+    label: str,
+    command: list[str],
+    cwd: Path = HELM_LITE_DIR,
+    env: Optional[dict[str, str]] = None,
+) -> int:
+    """
+    Run one helm-run process, streaming its output prefixed with *label*.
+
+    Returns:
+        the process exit code
+    """
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    assert process.stdout is not None
+    for line in process.stdout:
+        log(f"[{label}] {line.rstrip()}")
+    return process.wait()
+
+
+def prepare_scenarios(
+    models: Optional[list[str]] = None,
+    conf_path: str = RUN_ENTRIES_CONF_PATH,
+    max_eval_instances: int = MAX_EVAL_INSTANCES,
+    cwd: Path = HELM_LITE_DIR,
+    force: bool = False,
+) -> Path:
+    """
+    Materialize the scenario datasets with `helm-run --dry-run` and cache them.
+
+    Does nothing if the cache for this conf and instance limit already exists
+    (unless *force*).
+
+    Returns:
+        path of the scenario cache archive
+    """
+    key = scenario_cache.cache_key(cwd / conf_path, max_eval_instances)
+    archive = scenario_cache.archive_path(key)
+    if archive.exists() and not force:
+        log(f"Scenario cache {key} already prepared: {archive}")
+        return archive
+
+    suite_name = f"prepare-{key}"
+    command = build_helm_run_command(
+        models or get_models_to_run(),
+        suite_name,
+        conf_path=conf_path,
+        max_eval_instances=max_eval_instances,
+        dry_run=True,
+    )
+    log(f"Materializing scenarios for cache {key}")
+    exit_code = run_group("prepare", command, cwd)
+    if exit_code != 0:
+        raise RuntimeError(f"helm-run --dry-run failed with exit code {exit_code}")
+
+    output_dir = cwd / "benchmark_output"
+    suite_dir = output_dir / "runs" / suite_name
+    manifest = scenario_cache.build_instance_manifest(suite_dir)
+    # The dry run's suite would otherwise be picked up by the extractor
+    shutil.rmtree(suite_dir, ignore_errors=True)
+
+    archive = scenario_cache.save(key, output_dir, manifest)
+    log(
+        f"Cached {len(manifest)} run specs ({archive.stat().st_size / 2**20:.1f} MB) "
+        f"to {archive}"
+    )
+    return archive
+
+
+def run_groups(
+    groups: dict[str, list[str]],
+    suite_name: str,
+    max_parallel: int,
+    cwd: Path = HELM_LITE_DIR,
+    env: Optional[dict[str, str]] = None,
+    **command_options,
+) -> dict[str, int]:
+    """
+    Run one helm-run per group, at most *max_parallel* at a time.
+
+    Args:
+        command_options: extra build_helm_run_command() arguments
+
+    Returns:
+        dictionary mapping group label to helm-run exit code
+    """
+    exit_codes: dict[str, int] = {}
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        futures = {}
+        for label, group in groups.items():
+            command = build_helm_run_command(group, suite_name, **command_options)
+            futures[executor.submit(run_group, label, command, cwd, env)] = label
+
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                exit_codes[label] = future.result()
+            except OSError as e:
+                log(f"[{label}] Failed to start helm-run: {e}")
+                exit_codes[label] = 1
+            elapsed = time.monotonic() - start
+            log(
+                f"[{len(exit_codes)}/{len(groups)}] {label} finished with exit code "
+                f"{exit_codes[label]} after {elapsed:.0f}s"
+            )
+    return exit_codes
+
+
+def make_suite_local_path(suite_name: str, cwd: Path = HELM_LITE_DIR) -> Path:
+    """
+    HELM local path whose request cache only lives as long as one suite.
+
+    Adaptive batches re-send earlier instances when they escalate, so the
+    cache must be on, but a cache shared across suites would replay old
+    answers. Configuration from prod_env/ (credentials, deployments) is copied.
+    """
+    local_path = cwd / "prod_env_suites" / suite_name
+    local_path.mkdir(parents=True, exist_ok=True)
+    prod_env = cwd / "prod_env"
+    if prod_env.is_dir():
+        for path in prod_env.iterdir():
+            if path.is_file():
+                shutil.copy(path, local_path / path.name)
+    return local_path
+
+
+def run_adaptive_groups(
+    models: list[str],
+    group_by: str,
+    max_parallel: int,
+    suite_name: str,
+    batch_sizes: tuple[int, ...],
+    history_path: Optional[Path],
+    cwd: Path = HELM_LITE_DIR,
+    env: Optional[dict[str, str]] = None,
+) -> dict[str, int]:
+    """
+    Run models on growing instance batches until a sequential test decides.
+
+    Every model starts at batch_sizes[0]. After each batch its run specs are
+    compared with *history_path* (see the sequential module): equivalent
+    models stop, drifting ones jump to the full set and the rest run the
+    next batch size. Decisions are written to SUITE/adaptive_decisions.json.
+
+    Returns:
+        dictionary mapping group label (suffixed with the batch size) to
+        helm-run exit code
+    """
+    # Without history nothing can stop early: every model escalates to the full set
+    history = sequential.load_history(history_path) if history_path else {}
+    local_path = make_suite_local_path(suite_name, cwd)
+    suite_dir = cwd / "benchmark_output" / "runs" / suite_name
+
+    pending = {model: batch_sizes[0] for model in models}
+    exit_codes: dict[str, int] = {}
+    decisions: dict[str, list[dict]] = {model: [] for model in models}
+    try:
+        while pending:
+            size = min(pending.values())
+            batch = [model for model, next_size in pending.items() if next_size == size]
+            log(f"Adaptive batch of {size} instances for {len(batch)} models")
+            groups = group_models(batch, group_by)
+            codes = run_groups(
+                groups,
+                suite_name,
+                max_parallel,
+                cwd,
+                env,
+                max_eval_instances=size,
+                disable_cache=False,
+                local_path=local_path,
+            )
+            exit_codes.update(
+                {f"{label}@{size}": code for label, code in codes.items()}
+            )
+
+            runs = [
+                summarize.summarize_run(stats_path.parent)
+                for stats_path in sorted(suite_dir.glob("*/stats.json"))
+            ]
+            for model in batch:
+                decision, tests = sequential.decide_model(
+                    [run for run in runs if run["model"] == model],
+                    history,
+                    batch_sizes=batch_sizes,
+                )
+                decisions[model].append(
+                    {"instances": size, "decision": decision, "tests": tests}
+                )
+                next_size = sequential.next_batch_size(decision, size, batch_sizes)
+                log(
+                    f"[adaptive] {model} after {size}: {decision}"
+                    + (f", next {next_size}" if next_size else ", done")
+                )
+                if next_size is None:
+                    del pending[model]
+                else:
+                    pending[model] = next_size
+    finally:
+        shutil.rmtree(local_path, ignore_errors=True)
+
+    if suite_dir.exists():
+        with (suite_dir / "adaptive_decisions.json").open("w") as f:
+            json.dump(decisions, f, indent=1)
+            f.write("\n")
+    final_sizes = [decisions[m][-1]["instances"] for m in models if decisions[m]]
+    log(
+        f"Adaptive suite used {sum(final_sizes)} of "
+        f"{batch_sizes[-1] * len(models)} instances per scenario across models"
+    )
+    return exit_codes
+
+
+def run_suite(
+    models: Optional[list[str]] = None,
+    group_by: str = "provider",
+    max_parallel: Optional[int] = None,
+    suite_name: Optional[str] = None,
+    max_eval_instances: int = MAX_EVAL_INSTANCES,
+    cwd: Path = HELM_LITE_DIR,
+    helm_summarize: bool = False,
+    env: Optional[dict[str, str]] = None,
+    batch_sizes: Optional[tuple[int, ...]] = None,
+    history_path: Optional[Path] = None,
+) -> dict[str, int]:
+    """
+    Run one benchmark suite with a helm-run process per model group.
+
+    All groups share a single suite name so the extractor sees one run.
+    At most *max_parallel* processes run at once (default: all groups).
+
+    Args:
+        models: models to benchmark (defaults to MODELS_TO_RUN)
+        group_by: 'provider' or 'model'
+        max_parallel: concurrency cap on helm-run processes
+        suite_name: suite to write into (defaults to a new timestamped name)
+        max_eval_instances: instances per scenario
+        cwd: directory containing the conf/schema files; benchmark_output goes here
+        helm_summarize: run HELM's full `helm-summarize` instead of the native
+            summary (daily-bench itself never reads helm-summarize output)
+        env: environment for the helm-run processes (default: inherited)
+        batch_sizes: run adaptively on these growing instance counts instead
+            of max_eval_instances (see run_adaptive_groups)
+        history_path: benchmark_summary.csv the adaptive tests compare with
+
+    Returns:
+        dictionary mapping group label to helm-run exit code
+    """
+    models = models or get_models_to_run()
+    suite_name = suite_name or make_suite_name()
+    groups = group_models(models, group_by)
+    max_parallel = max_parallel or len(groups)
+
+    if batch_sizes:
+        max_eval_instances = batch_sizes[-1]
+    # The datasets don't depend on the instance limit, so smaller runs (canary
+    # probes) restore the full run's cache
+    cache_instances = max(max_eval_instances, MAX_EVAL_INSTANCES)
+    key = scenario_cache.cache_key(cwd / RUN_ENTRIES_CONF_PATH, cache_instances)
+    manifest = scenario_cache.restore(key, cwd / "benchmark_output")
+    if manifest is None:
+        log(f"No scenario cache {key}; HELM will download the scenario datasets")
+
+    log(
+        f"Running suite {suite_name}: {len(models)} models in {len(groups)} "
+        f"{group_by} groups, up to {max_parallel} at a time"
+    )
+
+    suite_start = time.monotonic()
+    if batch_sizes:
+        exit_codes = run_adaptive_groups(
+            models,
+            group_by,
+            max_parallel,
+            suite_name,
+            batch_sizes,
+            history_path,
+            cwd,
+            env,
+        )
+    else:
+        exit_codes = run_groups(
+            groups,
+            suite_name,
+            max_parallel,
+            cwd,
+            env,
+            max_eval_instances=max_eval_instances,
+        )
+
+    # Adaptive batches and canary probes evaluate fewer instances than the
+    # cached manifest lists
+    if (
+        manifest is not None
+        and not batch_sizes
+        and max_eval_instances == cache_instances
+    ):
+        for problem in scenario_cache.check_instances(
+            cwd / "benchmark_output" / "runs" / suite_name, manifest
+        ):
+            log(f"[scenario cache] {problem}")
+
+    if any(code == 0 for code in exit_codes.values()) and not helm_summarize:
+        try:
+            summarize.summarize_suite(cwd / "benchmark_output" / "runs" / suite_name)
+            exit_codes["summarize"] = 0
+        except (OSError, ValueError) as e:
+            log(f"[summarize] Failed to summarize {suite_name}: {e}")
+            exit_codes["summarize"] = 1
+    elif any(code == 0 for code in exit_codes.values()):
+        summarize_command = [
+            "helm-summarize",
+            "--schema",
+            SCHEMA_PATH,
+            "--suite",
+            suite_name,
+        ]
+        exit_codes["helm-summarize"] = run_group("summarize", summarize_command, cwd)
+
+    failed = [label for label, code in exit_codes.items() if code != 0]
+    log(
+        f"Suite {suite_name} finished in {time.monotonic() - suite_start:.0f}s"
+        + (f"; failed: {', '.join(failed)}" if failed else "")
+    )
+    return exit_codes
+
+
+def run_canary(
+    interval_minutes: Optional[float] = None,
+    max_eval_instances: int = CANARY_MAX_EVAL_INSTANCES,
+    **suite_options,
+) -> dict[str, int]:
+    """
+    Run canary probes: small suites of the same fixed instances per model.
+
+    A probe costs max_eval_instances / MAX_EVAL_INSTANCES of a full suite, so
+    probing between the full suites raises the time resolution of every
+    series cheaply. Probes are written to canary-YYYYmmdd_HHMMSS suites, which
+    the extractor keeps as a separate series (run_kind 'canary').
+
+    Args:
+        interval_minutes: start a probe this often until interrupted
+            (default: run a single probe)
+        max_eval_instances: instances per scenario in each probe
+        suite_options: other run_suite() arguments
+
+    Returns:
+        exit codes of the last probe
+    """
+    while True:
+        start = time.monotonic()
+        exit_codes = run_suite(
+            suite_name=make_suite_name(prefix=CANARY_SUITE_PREFIX),
+            max_eval_instances=max_eval_instances,
+            **suite_options,
+        )
+        if interval_minutes is None:
+            return exit_codes
+        wait = interval_minutes * 60 - (time.monotonic() - start)
+        if wait > 0:
+            log(f"Next canary probe in {wait / 60:.1f} minutes")
+            time.sleep(wait)
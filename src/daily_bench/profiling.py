@@ -0,0 +1,201 @@
+"""
+Per-stage profiling for the extractor.
+
+Stages are opened with `stage(name)` inside the extractor and are no-ops
+unless a profiler is active, so normal extraction pays almost nothing.
+
+Usage (e.g. from the notebook):
+
+    from daily_bench import extractor, profiling
+
+    with profiling.profile(cprofile=True) as profiler:
+        extractor.extract_results(root, output_path)
+    print(profiler.summary())
+    profiler.write_report("results/extract_profile.json")
+"""
+
+import contextlib
+import cProfile
+import json
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements for one named stage."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    files_read: int = 0
+    bytes_read: int = 0
+    # How far the stage raised the process's peak RSS; 0 once an earlier
+    # stage has set a higher peak, so the stages that drove memory stand out
+    rss_growth_mb: float = 0.0
+
+
+def peak_rss_mb() -> float:
+    """Get the process's peak resident set size so far, in MB."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    divisor = 2**20 if sys.platform == "darwin" else 2**10
+    return max_rss / divisor
+
+
+class ExtractProfiler:
+    """
+    Record wall time, CPU time, files/bytes read and peak RSS growth per stage.
+
+    Stages may nest (e.g. 'json_decode' inside 'harvest_helm_stats'); file
+    reads are attributed to every open stage. Repeated stages accumulate.
+    """
+
+    def __init__(self, cprofile: bool = False):
+        self.stages: dict[str, StageStats] = {}
+        self._open_stages: list[StageStats] = []
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._start_peak = peak_rss_mb()
+        self._end_wall: Optional[float] = None
+        self._end_cpu: Optional[float] = None
+        self.total_files_read = 0
+        self.total_bytes_read = 0
+        self.cprofile = cProfile.Profile() if cprofile else None
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the enclosed block under *name*."""
+        stats = self.stages.setdefault(name, StageStats())
+        self._open_stages.append(stats)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        start_peak = peak_rss_mb()
+        try:
+            yield
+        finally:
+            stats.calls += 1
+            stats.wall_seconds += time.perf_counter() - start_wall
+            stats.cpu_seconds += time.process_time() - start_cpu
+            stats.rss_growth_mb += peak_rss_mb() - start_peak
+            self._open_stages.pop()
+
+    def record_read(self, num_bytes: int) -> None:
+        """Count one file of *num_bytes* against every open stage."""
+        self.total_files_read += 1
+        self.total_bytes_read += num_bytes
+        for stats in self._open_stages:
+            stats.files_read += 1
+            stats.bytes_read += num_bytes
+
+    def start(self) -> None:
+        """Start the overall clock (and cProfile if enabled)."""
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._start_peak = peak_rss_mb()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+
+    def stop(self) -> None:
+        """Stop the overall clock (and cProfile if enabled)."""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        self._end_wall = time.perf_counter()
+        self._end_cpu = time.process_time()
+
+    def report(self) -> dict[str, Any]:
+        """Build the machine-readable report."""
+        end_wall = self._end_wall or time.perf_counter()
+        end_cpu = self._end_cpu or time.process_time()
+        return {
+            "total": {
+                "wall_seconds": round(end_wall - self._start_wall, 6),
+                "cpu_seconds": round(end_cpu - self._start_cpu, 6),
+                "files_read": self.total_files_read,
+                "bytes_read": self.total_bytes_read,
+                "rss_growth_mb": round(peak_rss_mb() - self._start_peak, 2),
+                "peak_rss_mb": round(peak_rss_mb(), 2),
+            },
+            "stages": {
+                name: {
+                    key: round(value, 6) if isinstance(value, float) else value
+                    for key, value in asdict(stats).items()
+                }
+                for name, stats in self.stages.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """Format the report as a table sorted by wall time."""
+        report = self.report()
+        lines = [
+            f"{'stage':<32} {'calls':>6} {'wall s':>9} {'cpu s':>9} "
+            f"{'files':>7} {'MB read':>9} {'RSS +MB':>9}"
+        ]
+        for name, stats in sorted(
+            report["stages"].items(), key=lambda item: -item[1]["wall_seconds"]
+        ):
+            lines.append(
+                f"{name:<32} {stats['calls']:>6} {stats['wall_seconds']:>9.3f} "
+                f"{stats['cpu_seconds']:>9.3f} {stats['files_read']:>7} "
+                f"{stats['bytes_read'] / 2**20:>9.1f} {stats['rss_growth_mb']:>9.1f}"
+            )
+        total = report["total"]
+        lines.append(
+            f"{'TOTAL':<32} {'':>6} {total['wall_seconds']:>9.3f} "
+            f"{total['cpu_seconds']:>9.3f} {total['files_read']:>7} "
+            f"{total['bytes_read'] / 2**20:>9.1f} {total['rss_growth_mb']:>9.1f}"
+        )
+        lines.append(f"Peak RSS: {total['peak_rss_mb']:.1f} MB")
+        return "\n".join(lines)
+
+    def write_report(self, path: str | Path) -> None:
+        """Write the JSON report to *path*."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with Path(path).open("w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+
+    def dump_cprofile(self, path: str | Path) -> None:
+        """Write the cProfile stats (readable with pstats/snakeviz) to *path*."""
+        if self.cprofile is None:
+            raise ValueError("Profiler was created without cprofile=True")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.cprofile.dump_stats(str(path))
+
+
+# The profiler that stage()/record_read() report to, if any
+_active: Optional[ExtractProfiler] = None
+
+
+@contextlib.contextmanager
+def profile(cprofile: bool = False) -> Iterator[ExtractProfiler]:
+    """Activate a profiler for the enclosed extractor calls."""
+    global _active
+    previous = _active
+    profiler = ExtractProfiler(cprofile=cprofile)
+    _active = profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = previous
+
+
+def stage(name: str) -> contextlib.AbstractContextManager:
+    """Measure a block under *name* if a profiler is active."""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.stage(name)
+
+
+def record_read(num_bytes: int) -> None:
+    """Count a file read against the active profiler, if any."""
+    if _active is not None:
+        _active.record_read(num_bytes)
@@ -0,0 +1,194 @@
+"""
+Regression report over every (model, scenario, metric) series.
+
+For each series in the summary CSV, the latest run is compared with a
+trailing baseline of the REGRESSION_WINDOW runs before it. Canary probes
+(run_kind 'canary') form their own series, compared with earlier probes:
+
+- latest_value: the run's count-weighted mean over run specs and splits
+- baseline_mean / baseline_std: rolling mean and standard deviation of the
+  baseline runs
+- z_score: (latest_value - baseline_mean) / baseline_std, with the standard
+  deviation floored at MIN_STD so a perfectly flat history doesn't divide by 0
+- trend_per_day: least-squares slope of the baseline and latest runs over time
+
+All series are computed together with grouped, vectorized operations (one
+pass over the frame, no per-series loop) and ranked by |z_score|, so the
+most anomalous series come first. The table is written to
+regression_report.csv next to the summary CSV after each extract.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from daily_bench import run_kinds
+
+SERIES_COLUMNS = ["model", "scenario_class", "metric", "run_kind"]
+
+# Summaries written before canary probes only have full runs
+DEFAULT_RUN_KIND = run_kinds.RUN_KIND_FULL
+
+# Baseline runs before the latest one
+REGRESSION_WINDOW = 20
+
+# Fewer baseline runs than this and the series gets no z-score
+MIN_BASELINE_RUNS = 3
+
+# Floor on the baseline standard deviation (metric units)
+MIN_STD = 1e-3
+
+# |z_score| at or above this flags a series as anomalous
+Z_THRESHOLD = 3.0
+
+REPORT_FILE_NAME = "regression_report.csv"
+
+
+def run_values(summary_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One value per (model, scenario_class, metric, run_kind, run): the
+    count-weighted mean over run specs and splits, ignoring perturbed stats.
+    """
+    metric_col = "metric_name" if "metric_name" in summary_df.columns else "name"
+    df = summary_df
+    if "perturbation" in df.columns:
+        df = df[df["perturbation"].isna()]
+    df = df[["model", "scenario_class", metric_col, "run", "run_timestamp", "mean"]]
+    df = df.rename(columns={metric_col: "metric"})
+    df["run_kind"] = (
+        summary_df.loc[df.index, "run_kind"].fillna(DEFAULT_RUN_KIND)
+        if "run_kind" in summary_df.columns
+        else DEFAULT_RUN_KIND
+    )
+    count = (
+        pd.to_numeric(summary_df.loc[df.index, "count"], errors="coerce")
+        if "count" in summary_df.columns
+        else pd.Series(1.0, index=df.index)
+    )
+    df = df.assign(
+        run_timestamp=pd.to_datetime(df["run_timestamp"], errors="coerce"),
+        mean=pd.to_numeric(df["mean"], errors="coerce"),
+        weight=count.fillna(1.0).clip(lower=1.0),
+    ).dropna(subset=["run_timestamp", "mean"])
+    df["weighted"] = df["mean"] * df["weight"]
+
+    runs = df.groupby(SERIES_COLUMNS + ["run", "run_timestamp"], as_index=False)[
+        ["weighted", "weight"]
+    ].sum()
+    runs["value"] = runs["weighted"] / runs["weight"]
+    return runs.drop(columns=["weighted", "weight"])
+
+
+def build_regression_report(
+    summary_df: pd.DataFrame,
+    window: int = REGRESSION_WINDOW,
+    min_baseline_runs: int = MIN_BASELINE_RUNS,
+) -> pd.DataFrame:
+    """
+    Latest value vs. trailing baseline for every series, most anomalous first.
+
+    Args:
+        summary_df: rows in the benchmark_summary.csv layout
+        window: baseline runs before the latest one
+        min_baseline_runs: fewer baseline runs than this give no z-score
+
+    Returns:
+        one row per series: latest run and value, baseline mean/std/runs,
+        change, z_score, trend_per_day and anomalous, ranked by |z_score|
+    """
+    columns = SERIES_COLUMNS + [
+        "latest_run",
+        "latest_value",
+        "baseline_mean",
+        "baseline_std",
+        "baseline_runs",
+        "change",
+        "z_score",
+        "trend_per_day",
+        "anomalous",
+    ]
+    runs = run_values(summary_df)
+    if runs.empty:
+        return pd.DataFrame(columns=columns)
+
+    runs = runs.sort_values(SERIES_COLUMNS + ["run_timestamp"], kind="stable")
+    grouped = runs.groupby(SERIES_COLUMNS, sort=False)
+    # 0 for each series' latest run, 1 for the one before, ...
+    runs["position"] = grouped.cumcount(ascending=False)
+    recent = runs[runs["position"] <= window]
+
+    latest = recent[recent["position"] == 0].set_index(SERIES_COLUMNS)
+    baseline = (
+        recent[recent["position"] > 0]
+        .groupby(SERIES_COLUMNS)["value"]
+        .agg(["mean", "std", "count"])
+    )
+
+    # Least-squares slope over baseline + latest, from grouped sums
+    days = (
+        recent["run_timestamp"]
+        - recent.groupby(SERIES_COLUMNS)["run_timestamp"].transform("min")
+    ).dt.total_seconds() / 86400
+    sums = (
+        recent.assign(x=days, xy=days * recent["value"], xx=days**2)
+        .groupby(SERIES_COLUMNS)[["x", "value", "xy", "xx"]]
+        .sum()
+    )
+    n = recent.groupby(SERIES_COLUMNS).size()
+    denominator = n * sums["xx"] - sums["x"] ** 2
+    slope = (n * sums["xy"] - sums["x"] * sums["value"]) / denominator.where(
+        denominator > 0
+    )
+
+    report = pd.DataFrame(
+        {
+            "latest_run": latest["run"],
+            "latest_value": latest["value"],
+            "baseline_mean": baseline["mean"],
+            "baseline_std": baseline["std"],
+            "baseline_runs": baseline["count"],
+        },
+        index=latest.index,
+    )
+    report["baseline_runs"] = report["baseline_runs"].fillna(0).astype(int)
+    report["change"] = report["latest_value"] - report["baseline_mean"]
+    z_score = report["change"] / report["baseline_std"].clip(lower=MIN_STD)
+    report["z_score"] = z_score.where(report["baseline_runs"] >= min_baseline_runs)
+    report["trend_per_day"] = slope
+    report["anomalous"] = report["z_score"].abs() >= Z_THRESHOLD
+
+    report = report.reset_index()
+    report = report.assign(_rank=report["z_score"].abs()).sort_values(
+        ["_rank"] + SERIES_COLUMNS,
+        ascending=[False] + [True] * len(SERIES_COLUMNS),
+        na_position="last",
+    )
+    return report.drop(columns="_rank")[columns].round(6).reset_index(drop=True)
+
+
+def save_regression_report(
+    summary_df: pd.DataFrame, output_path: str | Path
+) -> pd.DataFrame:
+    """
+    Write regression_report.csv next to *output_path*.
+
+    Returns:
+        the report written
+    """
+    report = build_regression_report(summary_df)
+    report_path = Path(output_path).with_name(REPORT_FILE_NAME)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report.to_csv(report_path, index=False, lineterminator="\n")
+    return report
+
+
+def format_report(report: pd.DataFrame, top: int = 15) -> str:
+    """The *top* most anomalous series as a table for the console."""
+    shown = report.head(top).copy()
+    shown["scenario_class"] = shown["scenario_class"].str.rsplit(".", n=1).str[-1]
+    shown["anomalous"] = np.where(shown["anomalous"], "*", "")
+    return shown[
+        SERIES_COLUMNS
+        + ["latest_value", "baseline_mean", "z_score", "trend_per_day", "anomalous"]
+    ].to_string(index=False)
@@ -0,0 +1,328 @@
+"""
+Local stand-in for the OpenAI and Anthropic APIs that replays recorded runs.
+
+The server answers the endpoints HELM's clients call:
+
+    POST /v1/chat/completions   (OpenAI chat completions)
+    POST /v1/messages           (Anthropic messages)
+    GET  /stats                 (request counters, for load tests)
+
+with completions taken from scenario_state.json files of earlier runs.
+Requests are matched to recordings by model and prompt. Unmatched prompts
+cycle through the model's recorded completions, or any recording if the model
+was never recorded, so every request gets an answer.
+
+Latency, errors and capacity are configurable. Each response waits the
+request_time recorded with its completion (scaled), or a lognormal sample
+when a median is given. A fraction of requests fail with a 429 or 500 in
+the provider's error format. At most max_concurrency requests are served at
+once; the rest queue, as on a saturated provider.
+
+`daily-bench run --replay` starts the server and points HELM at it through
+OPENAI_BASE_URL / ANTHROPIC_BASE_URL. Only the standard library is used.
+"""
+
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+from daily_bench import archives
+
+# Providers whose SDKs honor a base URL override; other models are skipped
+REPLAY_PROVIDERS = ("openai", "anthropic")
+
+DEFAULT_HOST = "127.0.0.1"
+
+
+@dataclass
+class Recording:
+    """One recorded completion."""
+
+    text: str
+    request_time: float
+
+
+def _prompt_key(model: str, prompt: str) -> str:
+    """Recording lookup key; the model's provider prefix is dropped."""
+    model = model.split("/", 1)[-1]
+    return hashlib.sha256(f"{model}\0{prompt.strip()}".encode()).hexdigest()
+
+
+def load_recordings(
+    root: str | Path,
+) -> tuple[dict[str, Recording], dict[str, list[Recording]]]:
+    """
+    Read every successful completion from scenario_state.json files under
+    *root*, including suites compacted into SUITE.zip archives.
+
+    Returns:
+        recordings keyed by _prompt_key(), and recordings per model name
+        (without provider prefix) for prompts that don't match exactly
+    """
+    by_prompt: dict[str, Recording] = {}
+    by_model: dict[str, list[Recording]] = {}
+    files, suite_archives = archives.walk_run_root(root, "scenario_state.json")
+    state_paths: list[Path | archives.ArchivePath] = [
+        *sorted(files),
+        *archives.find_files(suite_archives, "scenario_state.json"),
+    ]
+    for state_path in state_paths:
+        scenario_state = json.loads(state_path.read_bytes())
+        for request_state in scenario_state.get("request_states", []):
+            request = request_state.get("request", {})
+            result = request_state.get("result", {})
+            completions = result.get("completions") or []
+            if not result.get("success") or not completions:
+                continue
+            recording = Recording(
+                text=completions[0].get("text", ""),
+                request_time=float(result.get("request_time") or 0.0),
+            )
+            model = request.get("model", "")
+            by_prompt[_prompt_key(model, request.get("prompt", ""))] = recording
+            by_model.setdefault(model.split("/", 1)[-1], []).append(recording)
+    return by_prompt, by_model
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """HTTP server holding the recordings and the fault/latency settings."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        recordings_root: str | Path,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        latency_scale: float = 1.0,
+        latency_median: Optional[float] = None,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        max_concurrency: int = 16,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            recordings_root: directory searched for scenario_state.json files
+            host, port: address to bind (port 0 picks a free port)
+            latency_scale: multiplier on recorded request times (0 = no delay)
+            latency_median: if set, sample latency from a lognormal with this
+                median in seconds instead of replaying recorded times
+            latency_sigma: lognormal shape parameter
+            error_rate: fraction of requests answered with a 429 or 500
+            max_concurrency: requests served at once; the rest wait
+            seed: random seed for latency and error sampling
+        """
+        self.by_prompt, self.by_model = load_recordings(recordings_root)
+        if not self.by_prompt:
+            raise ValueError(f"No recorded completions found under {recordings_root}")
+        self._all_recordings = list(self.by_prompt.values())
+        self._cycles = {
+            model: itertools.cycle(recordings)
+            for model, recordings in self.by_model.items()
+        }
+        self._fallback = itertools.cycle(self._all_recordings)
+
+        self.latency_scale = latency_scale
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "exact": 0, "fallback": 0, "errors": 0}
+        super().__init__((host, port), ReplayHandler)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. http://127.0.0.1:8765."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def completion_for(self, model: str, prompt: str) -> Recording:
+        """Recorded completion for *prompt*, falling back to the model's others."""
+        with self.lock:
+            self.stats["requests"] += 1
+            recording = self.by_prompt.get(_prompt_key(model, prompt))
+            if recording is not None:
+                self.stats["exact"] += 1
+                return recording
+            self.stats["fallback"] += 1
+            cycle = self._cycles.get(model.split("/", 1)[-1], self._fallback)
+            return next(cycle)
+
+    def sample_latency(self, recording: Recording) -> float:
+        """Seconds to wait before answering with *recording*."""
+        with self.lock:
+            if self.latency_median is not None:
+                return self.latency_median * self.rng.lognormvariate(
+                    0, self.latency_sigma
+                )
+            return recording.request_time * self.latency_scale
+
+    def sample_error(self) -> Optional[int]:
+        """HTTP status of an injected failure, or None to answer normally."""
+        with self.lock:
+            if self.rng.random() >= self.error_rate:
+                return None
+            self.stats["errors"] += 1
+            return self.rng.choice([429, 500])
+
+    def start_background(self) -> threading.Thread:
+        """Serve from a daemon thread; call shutdown() to stop."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+def _chat_prompt(messages: list[dict[str, Any]]) -> str:
+    """The prompt HELM sent: the text of the last user message."""
+    for message in reversed(messages):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = "".join(
+                part.get("text", "") for part in content if isinstance(part, dict)
+            )
+        return content
+    return ""
+
+
+def _usage(prompt: str, text: str) -> tuple[int, int]:
+    """Whitespace token counts; close enough for HELM's token accounting."""
+    return len(prompt.split()), len(text.split())
+
+
+def openai_response(model: str, prompt: str, text: str) -> dict[str, Any]:
+    """OpenAI chat.completion body answering *prompt* with *text*."""
+    prompt_tokens, completion_tokens = _usage(prompt, text)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "logprobs": None,
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def anthropic_response(model: str, prompt: str, text: str) -> dict[str, Any]:
+    """Anthropic message body answering *prompt* with *text*."""
+    input_tokens, output_tokens = _usage(prompt, text)
+    return {
+        "id": f"msg_{uuid.uuid4().hex}",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+    }
+
+
+def error_response(path: str, status: int) -> dict[str, Any]:
+    """Error body in the shape of the provider that owns *path*."""
+    message = "Rate limit exceeded" if status == 429 else "Internal server error"
+    if path.endswith("/messages"):
+        kind = "rate_limit_error" if status == 429 else "api_error"
+        return {"type": "error", "error": {"type": kind, "message": message}}
+    kind = "rate_limit_exceeded" if status == 429 else "server_error"
+    return {"error": {"message": message, "type": kind, "code": kind}}
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Request handler for ReplayServer."""
+
+    server: ReplayServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # One line per request would drown out helm-run's own progress output
+        pass
+
+    def _send_json(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            with self.server.lock:
+                self._send_json(200, dict(self.server.stats))
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_POST(self) -> None:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path not in ("/v1/chat/completions", "/v1/messages"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, error_response(path, 400))
+            return
+
+        model = body.get("model", "")
+        prompt = _chat_prompt(body.get("messages", []))
+        with self.server.slots:
+            recording = self.server.completion_for(model, prompt)
+            time.sleep(self.server.sample_latency(recording))
+            status = self.server.sample_error()
+            if status is not None:
+                self._send_json(status, error_response(path, status))
+            elif path == "/v1/messages":
+                self._send_json(200, anthropic_response(model, prompt, recording.text))
+            else:
+                self._send_json(200, openai_response(model, prompt, recording.text))
+
+
+def replay_env(url: str) -> dict[str, str]:
+    """
+    Environment that points the OpenAI and Anthropic SDKs used by HELM at *url*.
+
+    The API keys are replaced with placeholders, so nothing can reach a live
+    provider with real credentials.
+    """
+    return {
+        "OPENAI_BASE_URL": f"{url}/v1",
+        "OPENAI_API_KEY": "replay",
+        "ANTHROPIC_BASE_URL": url,
+        "ANTHROPIC_API_KEY": "replay",
+    }
+
+
+def replayable_models(models: list[str]) -> tuple[list[str], list[str]]:
+    """Split models into those the replay server can answer and the rest."""
+    kept = [m for m in models if m.split("/", 1)[0] in REPLAY_PROVIDERS]
+    skipped = [m for m in models if m not in kept]
+    return kept, skipped
@@ -0,0 +1,371 @@
+"""
+Recompute reference-based metrics locally from stored completions.
+
+HELM's stats.json is the only source of exact_match, f1_score, etc., so a new
+metric or a normalization fix would otherwise mean re-running helm-run
+against the APIs. Every scenario_state.json already holds the completion and
+the references for each request, so this module rescores them offline:
+
+- exact_match: prediction and a correct reference are equal after strip()
+- quasi_exact_match: equal after HELM's normalize_text (lowercase, no
+  punctuation or articles, collapsed whitespace)
+- f1_score: F1 of the normalized token *sets*, as HELM computes it
+- rouge_l: ROUGE-L F-measure on rouge_score's tokens (lowercased
+  alphanumeric runs, Porter-stemmed when nltk is installed)
+
+As in HELM, the prediction is the first completion (mapped through the
+request's output_mapping for multiple-choice prompts), each instance scores
+its best correct reference, and perturbed instances are skipped. Every
+(prediction, reference) pair across all runs is scored at once: the string
+metrics with pandas string methods and set operations on exploded tokens,
+ROUGE-L with a longest-common-subsequence recurrence vectorized over a batch
+of pairs (one numpy row update per reference token).
+"""
+
+import string
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from daily_bench import archives, extractor, profiling
+
+METRICS = ["exact_match", "quasi_exact_match", "f1_score", "rouge_l"]
+
+RESCORED_FILE_NAME = "rescored_metrics.csv"
+
+# Rescored and HELM means closer than this agree
+MATCH_TOLERANCE = 1e-6
+
+# (prediction, reference) pairs per ROUGE-L batch; bounds the DP rows in memory
+ROUGE_BATCH_SIZE = 4096
+
+# Tokens this short are not stemmed (rouge_score's rule)
+MIN_STEM_LENGTH = 4
+
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+ARTICLES_RE = r"\b(a|an|the)\b"
+
+NON_ALPHANUMERIC_RE = r"[^a-z0-9]+"
+
+
+def harvest_completions(
+    root: str | Path | archives.ArchivePath = "benchmark_output/runs",
+) -> pd.DataFrame:
+    """
+    One row per (request, correct reference) from every scenario_state.json.
+
+    Returns:
+        DataFrame with run, run_name, model, scenario_class, split,
+        instance_id, train_trial_index, prediction and reference columns
+    """
+    rows: list[dict[str, Any]] = []
+
+    for scenario_state_path in extractor._find_files(root, "scenario_state.json"):
+        scenario_state = extractor._load_json(scenario_state_path)
+
+        run_spec_path = scenario_state_path.parent / "run_spec.json"
+        run_spec = {}
+        if run_spec_path.exists():
+            run_spec = extractor._load_json(run_spec_path)
+        run_name = run_spec.get("name", scenario_state_path.parent.name)
+        scenario_class = run_spec.get("scenario_spec", {}).get("class_name", "unknown")
+        model = run_spec.get("adapter_spec", {}).get("model", "unknown")
+        # Path is benchmark_output/runs/SUITE_NAME/scenario/scenario_state.json
+        suite_name = scenario_state_path.parent.parent.name
+
+        for request_state in scenario_state.get("request_states", []):
+            instance = request_state.get("instance", {})
+            if instance.get("perturbation"):
+                continue
+            completions = request_state.get("result", {}).get("completions") or []
+            prediction = completions[0].get("text", "").strip() if completions else ""
+            output_mapping = request_state.get("output_mapping")
+            if output_mapping is not None:
+                prediction = output_mapping.get(prediction) or ""
+
+            for reference in instance.get("references", []):
+                if "correct" not in reference.get("tags", []):
+                    continue
+                rows.append(
+                    {
+                        "run": suite_name,
+                        "run_name": run_name,
+                        "model": model,
+                        "scenario_class": scenario_class,
+                        "split": instance.get("split", ""),
+                        "instance_id": instance.get("id", ""),
+                        "train_trial_index": request_state.get("train_trial_index", 0),
+                        "prediction": prediction,
+                        "reference": reference.get("output", {}).get("text", ""),
+                    }
+                )
+
+    if not rows:
+        raise ValueError(f"No completions with correct references found under {root}")
+    return extractor._rows_to_frame(rows, ["run", "run_name", "instance_id"])
+
+
+def normalize_text(texts: pd.Series) -> pd.Series:
+    """HELM's normalize_text over a Series: lowercase, strip punctuation and articles."""
+    return (
+        texts.str.lower()
+        .str.translate(PUNCTUATION_TABLE)
+        .str.replace(ARTICLES_RE, " ", regex=True)
+        .str.split()
+        .str.join(" ")
+    )
+
+
+def _token_sets(texts: pd.Series) -> pd.DataFrame:
+    """Distinct (pair, token) rows of whitespace-separated *texts*."""
+    tokens = texts.str.split().explode().dropna()
+    tokens = pd.DataFrame({"pair": tokens.index, "token": tokens.to_numpy()})
+    return tokens.drop_duplicates()
+
+
+def _f_measure(
+    overlap: pd.Series, predicted: pd.Series, actual: pd.Series
+) -> pd.Series:
+    """2PR / (P + R), 0 where nothing overlaps or either side is empty."""
+    precision = overlap / predicted.where(predicted > 0)
+    recall = overlap / actual.where(actual > 0)
+    f1 = 2 * precision * recall / (precision + recall)
+    return f1.where(overlap > 0, 0.0).fillna(0.0)
+
+
+def token_f1(references: pd.Series, predictions: pd.Series) -> pd.Series:
+    """HELM's f1_score: F1 of normalized token sets, per pair."""
+    reference_tokens = _token_sets(normalize_text(references))
+    prediction_tokens = _token_sets(normalize_text(predictions))
+    overlap = (
+        reference_tokens.merge(prediction_tokens, on=["pair", "token"])
+        .groupby("pair")
+        .size()
+    )
+    index = references.index
+    return _f_measure(
+        overlap.reindex(index, fill_value=0),
+        prediction_tokens.groupby("pair").size().reindex(index, fill_value=0),
+        reference_tokens.groupby("pair").size().reindex(index, fill_value=0),
+    )
+
+
+def _stemmer() -> Optional[Callable[[str], str]]:
+    """Porter stemmer as rouge_score uses it, or None without nltk."""
+    try:
+        from nltk.stem import porter
+    except ImportError:
+        return None
+    return porter.PorterStemmer().stem
+
+
+def _rouge_tokens(texts: pd.Series, stem: Optional[Callable[[str], str]]) -> pd.Series:
+    """rouge_score's tokens of *texts*, one row per token indexed by text."""
+    tokens = texts.str.lower().str.replace(NON_ALPHANUMERIC_RE, " ", regex=True)
+    tokens = tokens.str.split().explode().dropna()
+    if stem is not None:
+        # Stem each distinct token once
+        stems = {
+            token: stem(token) if len(token) >= MIN_STEM_LENGTH else token
+            for token in pd.unique(tokens)
+        }
+        tokens = tokens.map(stems)
+    return tokens
+
+
+def _split_by_text(
+    codes: np.ndarray, tokens: pd.Series, index: pd.Index
+) -> tuple[list[np.ndarray], np.ndarray]:
+    """Token id arrays (and their lengths) per entry of *index*."""
+    lengths = tokens.index.value_counts().reindex(index, fill_value=0).to_numpy()
+    return np.split(codes, np.cumsum(lengths)[:-1]), lengths
+
+
+def longest_common_subsequence(
+    references: list[np.ndarray], predictions: list[np.ndarray]
+) -> np.ndarray:
+    """
+    LCS length of each (reference, prediction) pair of token id arrays.
+
+    Row i of the DP table is max(previous row, previous row shifted by one
+    plus 1 where reference token i matches) followed by a running maximum
+    along the prediction, so each reference token is one vectorized update
+    over every pair in the batch.
+    """
+    count = len(references)
+    reference_length = max((len(tokens) for tokens in references), default=0)
+    prediction_length = max((len(tokens) for tokens in predictions), default=0)
+    # Padding ids never match: -1 in references, -2 in predictions
+    reference_ids = np.full((count, reference_length), -1, dtype=np.int64)
+    prediction_ids = np.full((count, prediction_length), -2, dtype=np.int64)
+    for row, (reference, prediction) in enumerate(zip(references, predictions)):
+        reference_ids[row, : len(reference)] = reference
+        prediction_ids[row, : len(prediction)] = prediction
+
+    table = np.zeros((count, prediction_length + 1), dtype=np.int32)
+    for i in range(reference_length):
+        matches = prediction_ids == reference_ids[:, i : i + 1]
+        candidate = table.copy()
+        candidate[:, 1:] = np.maximum(
+            table[:, 1:], np.where(matches, table[:, :-1] + 1, 0)
+        )
+        table = np.maximum.accumulate(candidate, axis=1)
+    return table[:, -1]
+
+
+def rouge_l(references: pd.Series, predictions: pd.Series) -> pd.Series:
+    """ROUGE-L F-measure per pair, as rouge_score's RougeScorer(['rougeL'])."""
+    stem = _stemmer()
+    reference_tokens = _rouge_tokens(references, stem)
+    prediction_tokens = _rouge_tokens(predictions, stem)
+    # One integer vocabulary for both sides; explode keeps each text contiguous
+    codes, _ = pd.factorize(pd.concat([reference_tokens, prediction_tokens]))
+    index = references.index
+    reference_ids, reference_lengths = _split_by_text(
+        codes[: len(reference_tokens)], reference_tokens, index
+    )
+    prediction_ids, prediction_lengths = _split_by_text(
+        codes[len(reference_tokens) :], prediction_tokens, index
+    )
+
+    # Batch pairs of similar length together to keep padding small
+    lcs = np.zeros(len(index), dtype=np.int64)
+    order = np.lexsort((prediction_lengths, reference_lengths))
+    for start in range(0, len(order), ROUGE_BATCH_SIZE):
+        batch = order[start : start + ROUGE_BATCH_SIZE]
+        lcs[batch] = longest_common_subsequence(
+            [reference_ids[i] for i in batch], [prediction_ids[i] for i in batch]
+        )
+    return _f_measure(
+        pd.Series(lcs, index=index),
+        pd.Series(prediction_lengths, index=index),
+        pd.Series(reference_lengths, index=index),
+    )
+
+
+def score_pairs(pairs: pd.DataFrame, metrics: list[str] = METRICS) -> pd.DataFrame:
+    """Add a column per metric to (prediction, reference) *pairs*."""
+    pairs = pairs.reset_index(drop=True)
+    predictions = pairs["prediction"].fillna("").astype(str)
+    references = pairs["reference"].fillna("").astype(str)
+    scores = {}
+    # As in HELM, an empty prediction exactly matches an empty reference
+    if "exact_match" in metrics:
+        scores["exact_match"] = (
+            predictions.str.strip() == references.str.strip()
+        ).astype(float)
+    if "quasi_exact_match" in metrics:
+        scores["quasi_exact_match"] = (
+            normalize_text(predictions) == normalize_text(references)
+        ).astype(float)
+    if "f1_score" in metrics:
+        scores["f1_score"] = token_f1(references, predictions)
+    if "rouge_l" in metrics:
+        scores["rouge_l"] = rouge_l(references, predictions)
+    return pairs.assign(**scores)
+
+
+def aggregate_scores(
+    scored: pd.DataFrame, metrics: list[str] = METRICS
+) -> pd.DataFrame:
+    """
+    Per-run metric table in the benchmark_summary.csv layout.
+
+    Each request keeps its best correct reference; requests are then averaged
+    per (suite, run spec, split), as in stats.json.
+    """
+    request_columns = ["run", "run_name", "model", "scenario_class", "split"]
+    per_request = scored.groupby(
+        request_columns + ["instance_id", "train_trial_index"], sort=False
+    )[metrics].max()
+    per_request = per_request.melt(
+        var_name="name", value_name="value", ignore_index=False
+    ).reset_index()
+    table = (
+        per_request.groupby(request_columns + ["name"], sort=False)["value"]
+        .agg(count="count", sum="sum", min="min", max="max", mean="mean")
+        .reset_index()
+    )
+    table = extractor.add_temporal_columns(table).drop(
+        columns=["run_hour", "run_weekday"]
+    )
+    table = table[
+        ["model", "scenario_class", "run_timestamp", "run_date", "run", "run_name"]
+        + ["split", "name", "count", "sum", "min", "max", "mean"]
+    ]
+    return table.sort_values(
+        ["model", "scenario_class", "run_timestamp", "name"], kind="stable"
+    ).reset_index(drop=True)
+
+
+def compare_with_helm(rescored: pd.DataFrame, summary_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agreement between rescored means and HELM's stats.json means.
+
+    Returns:
+        one row per metric HELM reported: rows compared, rows within
+        MATCH_TOLERANCE and the largest absolute difference
+    """
+    keys = ["run", "run_name", "split", "name"]
+    helm = summary_df
+    if "perturbation" in helm.columns:
+        helm = helm[helm["perturbation"].isna()]
+    helm = helm[helm["name"].isin(rescored["name"].unique())]
+    joined = rescored[keys + ["mean"]].merge(
+        helm[keys + ["mean"]], on=keys, suffixes=("", "_helm")
+    )
+    difference = (joined["mean"] - pd.to_numeric(joined["mean_helm"])).abs()
+    return (
+        joined.assign(difference=difference, matched=difference <= MATCH_TOLERANCE)
+        .groupby("name")
+        .agg(
+            compared=("difference", "size"),
+            matched=("matched", "sum"),
+            max_difference=("difference", "max"),
+        )
+        .reset_index()
+    )
+
+
+def rescore_runs(
+    root: str | Path = "benchmark_output/runs",
+    output_path: str | Path = "results/benchmark_summary.csv",
+    metrics: list[str] = METRICS,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Rescore every stored completion under *root* without any API calls.
+
+    Args:
+        root: run root (directory, archive, or compacted suites)
+        output_path: summary CSV; rescored_metrics.csv is written next to it
+            and compared against it when it exists
+        metrics: subset of METRICS to compute
+
+    Returns:
+        (rescored metric table, agreement with HELM per metric)
+    """
+    with profiling.stage("harvest_completions"):
+        pairs = harvest_completions(root)
+    print(
+        f"Scoring {len(pairs)} (completion, reference) pairs from "
+        f"{pairs['run'].nunique()} suites"
+    )
+    if "rouge_l" in metrics and _stemmer() is None:
+        print("Warning: nltk is not installed; rouge_l is computed without stemming")
+    with profiling.stage("score"):
+        scored = score_pairs(pairs, metrics)
+        rescored = aggregate_scores(scored, metrics)
+
+    output_path = Path(output_path)
+    rescored_path = output_path.with_name(RESCORED_FILE_NAME)
+    rescored_path.parent.mkdir(parents=True, exist_ok=True)
+    rescored.to_csv(rescored_path, index=False, lineterminator="\n")
+    print(f"Wrote {len(rescored)} rescored metric rows to {rescored_path}")
+
+    agreement = pd.DataFrame(columns=["name", "compared", "matched", "max_difference"])
+    if output_path.exists():
+        agreement = compare_with_helm(rescored, pd.read_csv(output_path))
+    return rescored, agreement
@@ -0,0 +1,14 @@
+"""
+Suite name prefixes and the run kinds they mark.
+
+Suites are named PREFIX-YYYYmmdd_HHMMSS. Full suites use SUITE_PREFIX and
+canary probes use CANARY_SUITE_PREFIX, so the extractor can tell them apart
+from the suite name alone. This module has no imports, so the orchestrator
+and the extractor can both use it without depending on each other.
+"""
+
+SUITE_PREFIX = "results"
+CANARY_SUITE_PREFIX = "canary"
+
+RUN_KIND_FULL = "full"
+RUN_KIND_CANARY = "canary"
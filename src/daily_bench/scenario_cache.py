@@ -0,0 +1,145 @@
+"""
+Cache of materialized HELM scenario data, so suites don't re-download it.
+
+HELM downloads and unpacks each scenario's dataset into
+benchmark_output/scenarios/ before sending a single request. `daily-bench
+prepare` runs `helm-run --dry-run` once (no model requests), archives the
+scenarios directory to scenario_cache/<key>.tar.gz and records which
+instances and prompts each run spec evaluated in <key>.manifest.json.
+
+The key covers the run entries conf file and MAX_EVAL_INSTANCES, the inputs
+that decide the instance set. `daily-bench run` restores the archive when
+benchmark_output/scenarios is missing and afterwards checks the suite's
+instances and prompts against the manifest. Running HELM is left to
+orchestrator.prepare_scenarios(); this module only handles the cache.
+"""
+
+import hashlib
+import json
+import os
+import tarfile
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "DAILY_BENCH_SCENARIO_CACHE",
+        Path(__file__).parent / "helm_lite" / "scenario_cache",
+    )
+)
+
+KEY_LENGTH = 16
+
+
+def cache_key(conf_path: str | Path, max_eval_instances: int) -> str:
+    """Hash of the conf file contents and the instance limit."""
+    digest = hashlib.sha256(Path(conf_path).read_bytes())
+    digest.update(f"\nmax_eval_instances={max_eval_instances}".encode())
+    return digest.hexdigest()[:KEY_LENGTH]
+
+
+def archive_path(key: str, cache_dir: Path = CACHE_DIR) -> Path:
+    """Archive of benchmark_output/scenarios for *key*."""
+    return cache_dir / f"{key}.tar.gz"
+
+
+def manifest_path(key: str, cache_dir: Path = CACHE_DIR) -> Path:
+    """Instance manifest written alongside the archive for *key*."""
+    return cache_dir / f"{key}.manifest.json"
+
+
+def build_instance_manifest(suite_dir: Path) -> dict[str, dict[str, Any]]:
+    """
+    Instance ids and a prompt digest for every run spec in *suite_dir*.
+
+    Returns:
+        {run spec directory name: {"instances": ["split:id", ...],
+        "prompt_sha256": hex digest of all prompts in order}}
+    """
+    manifest = {}
+    for state_path in sorted(suite_dir.glob("*/scenario_state.json")):
+        with state_path.open() as f:
+            scenario_state = json.load(f)
+        instances = []
+        prompts = hashlib.sha256()
+        for request_state in scenario_state.get("request_states", []):
+            instance = request_state.get("instance", {})
+            instances.append(f"{instance.get('split', '')}:{instance.get('id', '')}")
+            prompts.update(request_state.get("request", {}).get("prompt", "").encode())
+            prompts.update(b"\0")
+        manifest[state_path.parent.name] = {
+            "instances": instances,
+            "prompt_sha256": prompts.hexdigest(),
+        }
+    return manifest
+
+
+def save(
+    key: str,
+    output_dir: Path,
+    manifest: dict[str, dict[str, Any]],
+    cache_dir: Path = CACHE_DIR,
+) -> Path:
+    """
+    Archive output_dir/scenarios and write the instance manifest for *key*.
+
+    Returns:
+        path of the archive
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    archive = archive_path(key, cache_dir)
+    partial = archive.with_name(archive.name + ".partial")
+    with tarfile.open(partial, "w:gz") as tar:
+        tar.add(output_dir / "scenarios", arcname="scenarios")
+    partial.replace(archive)
+    with manifest_path(key, cache_dir).open("w") as f:
+        json.dump(manifest, f, indent=1)
+        f.write("\n")
+    return archive
+
+
+def restore(
+    key: str, output_dir: Path, cache_dir: Path = CACHE_DIR
+) -> Optional[dict[str, dict[str, Any]]]:
+    """
+    Unpack the cached scenarios into *output_dir* if they are missing there.
+
+    Returns:
+        the instance manifest, or None if nothing is cached for *key*
+    """
+    archive = archive_path(key, cache_dir)
+    if not archive.exists():
+        return None
+
+    scenarios_dir = output_dir / "scenarios"
+    if not scenarios_dir.exists() or not any(scenarios_dir.iterdir()):
+        with tarfile.open(archive, "r:gz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(scenarios_dir.parent, filter="data")
+            else:
+                tar.extractall(scenarios_dir.parent)
+        print(f"Restored scenario cache {key} into {scenarios_dir}")
+
+    with manifest_path(key, cache_dir).open() as f:
+        return json.load(f)
+
+
+def check_instances(suite_dir: Path, manifest: dict[str, dict[str, Any]]) -> list[str]:
+    """
+    Compare a suite's instances and prompts with the cached manifest.
+
+    Only run specs present in both are compared (models may differ).
+
+    Returns:
+        list of human-readable mismatches (empty if none)
+    """
+    problems = []
+    for run_name, observed in build_instance_manifest(suite_dir).items():
+        expected = manifest.get(run_name)
+        if expected is None:
+            continue
+        if observed["instances"] != expected["instances"]:
+            problems.append(f"{run_name}: instance set differs from the cache")
+        elif observed["prompt_sha256"] != expected["prompt_sha256"]:
+            problems.append(f"{run_name}: prompts differ from the cache")
+    return problems
@@ -0,0 +1,249 @@
+"""
+Coverage-aware choice of the next run time.
+
+The dashboard's daily and weekly views average each model's runs by hour of
+day and by hour of week. A uniformly random start time leaves some of the
+168 hour-of-week buckets sampled many times and others empty for weeks.
+Instead, `daily-bench schedule` reads benchmark_summary.csv and, for every
+hour the next run could start in, adds up how much one more run would
+shrink the uncertainty of each model's bucket mean:
+
+- a bucket mean over n runs with variance s^2 has uncertainty
+  s^2 / (n + PRIOR_RUNS); one more run removes
+  s^2 / (n + PRIOR_RUNS) - s^2 / (n + 1 + PRIOR_RUNS)
+- s^2 is the bucket's sample variance of run means, shrunk towards the
+  model's overall variance with PRIOR_RUNS pseudo-runs, so a bucket with one
+  or two runs is neither trusted nor ignored
+- the gain of an hour is summed over models for its hour-of-week bucket
+  and, weighted by DAILY_WEIGHT, its hour-of-day bucket
+
+The hour with the largest gain wins (ties are broken at random, so with no
+history this is the old uniform jitter), and the run starts at a random
+minute inside it. Run times are taken from the suite names, so they are in
+the runner's clock, as `now` is. Only the standard library is used.
+"""
+
+import csv
+import datetime
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import pvariance, variance
+from typing import Optional
+
+# Run-level metric the uncertainty is measured on
+SCHEDULE_METRIC = "exact_match"
+
+# Longest delay the workflow can sleep: 6-hour window minus ~30 minutes of run
+MAX_DELAY_SECONDS = 19800
+
+# Pseudo-runs at the model's overall mean and variance added to every bucket
+PRIOR_RUNS = 1
+
+# Weight of the hour-of-day (daily view) gain relative to the hour-of-week gain
+DAILY_WEIGHT = 1.0
+
+# Floor on variances, so a model with identical runs still spreads its runs out
+MIN_VARIANCE = 1e-4
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass
+class Slot:
+    """One hour the next run could start in."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+    gain: float
+    week_runs: int
+    day_runs: int
+
+
+@dataclass
+class Schedule:
+    """The chosen start time and the slots it was chosen from."""
+
+    run_at: datetime.datetime
+    delay_seconds: int
+    slot: Slot
+    slots: list[Slot]
+
+
+def hour_of_week(timestamp: datetime.datetime) -> int:
+    """0 for Monday 00:00-00:59 ... 167 for Sunday 23:00-23:59."""
+    return timestamp.weekday() * 24 + timestamp.hour
+
+
+def load_run_values(
+    csv_path: str | Path,
+    metric: str = SCHEDULE_METRIC,
+    models: Optional[list[str]] = None,
+) -> dict[str, list[tuple[datetime.datetime, float]]]:
+    """
+    Per model, (run start, run value) of every full run in the summary CSV.
+
+    A run's value is the count-weighted mean of *metric* over its scenarios;
+    perturbed stats and canary probes are skipped.
+    """
+    if not Path(csv_path).exists():
+        return {}
+    sums: dict[tuple[str, str], list[float]] = {}
+    timestamps: dict[tuple[str, str], datetime.datetime] = {}
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            if (row.get("name") or row.get("metric_name")) != metric:
+                continue
+            # Canary probes are a separate series with fewer instances per run
+            if row.get("perturbation") or (row.get("run_kind") or "full") != "full":
+                continue
+            if models is not None and row["model"] not in models:
+                continue
+            try:
+                mean = float(row["mean"])
+                count = float(row.get("count") or 1)
+                timestamp = datetime.datetime.strptime(
+                    row["run_timestamp"], TIMESTAMP_FORMAT
+                )
+            except (KeyError, ValueError):
+                continue
+            key = (row["model"], row["run"])
+            totals = sums.setdefault(key, [0.0, 0.0])
+            totals[0] += mean * max(count, 1.0)
+            totals[1] += max(count, 1.0)
+            timestamps[key] = timestamp
+
+    runs: dict[str, list[tuple[datetime.datetime, float]]] = defaultdict(list)
+    for (model, run), (weighted, weight) in sums.items():
+        runs[model].append((timestamps[(model, run)], weighted / weight))
+    return dict(runs)
+
+
+def bucket_gains(
+    values_by_bucket: dict[int, list[float]], prior_variance: float
+) -> dict[int, float]:
+    """Uncertainty removed by one more run in each bucket that has runs."""
+    gains = {}
+    for bucket, values in values_by_bucket.items():
+        n = len(values)
+        sample_variance = variance(values) if n > 1 else prior_variance
+        shrunk = (PRIOR_RUNS * prior_variance + (n - 1) * sample_variance) / (
+            PRIOR_RUNS + n - 1
+        )
+        gains[bucket] = shrunk / (n + PRIOR_RUNS) - shrunk / (n + 1 + PRIOR_RUNS)
+    return gains
+
+
+def empty_bucket_gain(prior_variance: float) -> float:
+    """Uncertainty removed by the first run in a bucket."""
+    return prior_variance / PRIOR_RUNS - prior_variance / (1 + PRIOR_RUNS)
+
+
+def candidate_slots(
+    now: datetime.datetime, max_delay: float
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """The hours (clipped to [now, now + max_delay]) the run could start in."""
+    latest = now + datetime.timedelta(seconds=max_delay)
+    slots = []
+    start = now
+    while start < latest:
+        hour_end = start.replace(minute=0, second=0, microsecond=0)
+        hour_end += datetime.timedelta(hours=1)
+        end = min(hour_end, latest)
+        slots.append((start, end))
+        start = end
+    return slots or [(now, now)]
+
+
+def choose_run_time(
+    runs: dict[str, list[tuple[datetime.datetime, float]]],
+    now: Optional[datetime.datetime] = None,
+    max_delay: float = MAX_DELAY_SECONDS,
+    rng: Optional[random.Random] = None,
+) -> Schedule:
+    """
+    Pick the start time within *max_delay* seconds of *now* whose hour most
+    reduces the uncertainty of the models' hour-of-week and hour-of-day means.
+
+    Args:
+        runs: load_run_values() output
+        now: current time on the runner's clock (default: now)
+        max_delay: latest start, in seconds from *now*
+        rng: source of the tie-break and of the minute within the hour
+    """
+    now = now or datetime.datetime.now()
+    rng = rng or random.Random()
+
+    week_gains: dict[str, dict[int, float]] = {}
+    day_gains: dict[str, dict[int, float]] = {}
+    week_runs: dict[int, set[datetime.datetime]] = defaultdict(set)
+    day_runs: dict[int, set[datetime.datetime]] = defaultdict(set)
+    prior_variances: dict[str, float] = {}
+    for model, points in runs.items():
+        values = [value for _, value in points]
+        prior = max(pvariance(values) if len(values) > 1 else 0.0, MIN_VARIANCE)
+        prior_variances[model] = prior
+        by_week: dict[int, list[float]] = defaultdict(list)
+        by_day: dict[int, list[float]] = defaultdict(list)
+        for timestamp, value in points:
+            by_week[hour_of_week(timestamp)].append(value)
+            by_day[timestamp.hour].append(value)
+            week_runs[hour_of_week(timestamp)].add(timestamp)
+            day_runs[timestamp.hour].add(timestamp)
+        week_gains[model] = bucket_gains(by_week, prior)
+        day_gains[model] = bucket_gains(by_day, prior)
+
+    slots = []
+    for start, end in candidate_slots(now, max_delay):
+        week, day = hour_of_week(start), start.hour
+        gain = 0.0
+        for model, prior in prior_variances.items():
+            empty = empty_bucket_gain(prior)
+            gain += week_gains[model].get(week, empty)
+            gain += DAILY_WEIGHT * day_gains[model].get(day, empty)
+        slots.append(Slot(start, end, gain, len(week_runs[week]), len(day_runs[day])))
+
+    best_gain = max(slot.gain for slot in slots)
+    slot = rng.choice([s for s in slots if s.gain >= best_gain * (1 - 1e-9)])
+    run_at = slot.start + datetime.timedelta(
+        seconds=rng.uniform(0, (slot.end - slot.start).total_seconds())
+    )
+    return Schedule(
+        run_at=run_at,
+        delay_seconds=round((run_at - now).total_seconds()),
+        slot=slot,
+        slots=slots,
+    )
+
+
+def schedule_next_run(
+    csv_path: str | Path,
+    max_delay: float = MAX_DELAY_SECONDS,
+    metric: str = SCHEDULE_METRIC,
+    models: Optional[list[str]] = None,
+    seed: Optional[int] = None,
+) -> Schedule:
+    """choose_run_time() on the runs in the summary CSV at *csv_path*."""
+    return choose_run_time(
+        load_run_values(csv_path, metric, models),
+        max_delay=max_delay,
+        rng=random.Random(seed),
+    )
+
+
+def format_schedule(schedule: Schedule, top: int = 5) -> str:
+    """The chosen time and the best candidate hours, for the workflow log."""
+    lines = [
+        f"Next run at {schedule.run_at:%a %H:%M} "
+        f"(in {schedule.delay_seconds / 3600:.2f}h)",
+        "Best hours (gain, runs in hour-of-week bucket, runs in hour-of-day bucket):",
+    ]
+    ranked = sorted(schedule.slots, key=lambda slot: slot.gain, reverse=True)
+    for slot in ranked[:top]:
+        marker = "*" if slot is schedule.slot else " "
+        lines.append(
+            f" {marker} {slot.start:%a %H}:00  {slot.gain:.6f}  "
+            f"{slot.week_runs:4d}  {slot.day_runs:4d}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,256 @@
+"""
+Sequential tests that decide whether a partial run already matches history.
+
+An adaptive suite evaluates each model on a growing number of instances
+(e.g. 20, then 35, then 50). After each batch, every tracked metric of every
+run spec is compared with that run spec's history in benchmark_summary.csv
+(keyed by run spec name, so e.g. natural_qa's open-book and closed-book modes,
+which share a scenario class, are separate series):
+
+- drift: a two-sided z-test rejects "same mean as history", so the model is
+  escalated straight to the full instance set
+- equivalent: a TOST equivalence test shows the mean is within a margin of
+  the historical mean, so the model stops early
+- continue: neither test is conclusive yet, so the next batch is run
+
+The standard error of a batch mean combines instance-level variance (HELM's
+per-run stddev; p(1-p) if missing) over the batch size with the run-to-run
+variance of historical means beyond their own sampling noise. The drift
+test's significance level is split evenly across the planned looks
+(Bonferroni). The equivalence margin defaults to the smallest change the
+full instance set detects with DETECTION_POWER, so stopping early only gives
+up changes a full run would likely miss anyway. Only the standard library is
+used.
+"""
+
+import csv
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import NormalDist, fmean, pvariance
+from typing import Any, Optional
+
+# Bounded [0, 1] metrics the decision is based on
+SEQUENTIAL_METRICS = ("exact_match", "f1_score")
+
+DEFAULT_BATCH_SIZES = (20, 35, 50)
+
+ALPHA = 0.05
+
+# Power of the full instance set that defines the default equivalence margin
+DETECTION_POWER = 0.9
+
+# Fewer historical runs than this and the model always runs the full set
+MIN_HISTORY_RUNS = 5
+
+# Only the most recent runs describe the current baseline
+HISTORY_WINDOW = 60
+
+# (run_name, metric, split); HELM's run spec name includes the model and args
+SeriesKey = tuple[str, str, str]
+
+EQUIVALENT = "equivalent"
+DRIFT = "drift"
+CONTINUE = "continue"
+
+
+@dataclass
+class History:
+    """Historical distribution of one (run spec, metric, split) series."""
+
+    mean: float
+    between_run_variance: float
+    instance_stddev: float
+    num_runs: int
+
+
+def load_history(
+    csv_path: str | Path, window: int = HISTORY_WINDOW
+) -> dict[SeriesKey, History]:
+    """
+    Historical distributions keyed by (run_name, metric, split).
+
+    Args:
+        csv_path: benchmark_summary.csv
+        window: number of most recent runs kept per series
+    """
+    series: dict[SeriesKey, list[tuple[str, float, float]]] = {}
+    counts_by_key: dict[SeriesKey, list[float]] = {}
+    if not Path(csv_path).exists():
+        return {}
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            metric = row.get("name") or row.get("metric_name")
+            if metric not in SEQUENTIAL_METRICS or row.get("perturbation"):
+                continue
+            # Canary probes evaluate fewer instances than the runs being tested
+            if row.get("run_kind", "full") not in ("", "full"):
+                continue
+            try:
+                mean = float(row["mean"])
+            except (KeyError, ValueError):
+                continue
+            try:
+                stddev = float(row.get("stddev") or "nan")
+            except ValueError:
+                stddev = math.nan
+            key = (row["run_name"], metric, row.get("split", ""))
+            series.setdefault(key, []).append(
+                (row.get("run_timestamp") or row.get("run", ""), mean, stddev)
+            )
+            try:
+                counts_by_key.setdefault(key, []).append(float(row.get("count") or 0))
+            except ValueError:
+                pass
+
+    history = {}
+    for key, points in series.items():
+        points = sorted(points)[-window:]
+        means = [mean for _, mean, _ in points]
+        stddevs = [s for _, _, s in points if not math.isnan(s)]
+        overall = fmean(means)
+        instance_stddev = (
+            fmean(stddevs) if stddevs else math.sqrt(overall * (1 - overall))
+        )
+        counts = [c for c in counts_by_key.get(key, []) if c > 0]
+        # Run means already vary by instance_stddev^2 / count from sampling alone
+        sampling_variance = instance_stddev**2 / fmean(counts) if counts else 0.0
+        history[key] = History(
+            mean=overall,
+            between_run_variance=(
+                max(pvariance(means) - sampling_variance, 0.0)
+                if len(means) > 1
+                else 0.0
+            ),
+            instance_stddev=instance_stddev,
+            num_runs=len(means),
+        )
+    return history
+
+
+def standard_error(history: History, count: int) -> float:
+    """Standard error of a *count*-instance run mean under *history*."""
+    return math.sqrt(
+        history.instance_stddev**2 / max(count, 1) + history.between_run_variance
+    )
+
+
+def detectable_change(history: History, full_count: int, alpha: float = ALPHA) -> float:
+    """Smallest change a *full_count*-instance run detects with DETECTION_POWER."""
+    normal = NormalDist()
+    z = normal.inv_cdf(1 - alpha / 2) + normal.inv_cdf(DETECTION_POWER)
+    return z * standard_error(history, full_count)
+
+
+def compare_batch(
+    batch_mean: float,
+    count: int,
+    history: History,
+    full_count: int,
+    margin: Optional[float] = None,
+    alpha: float = ALPHA,
+    num_looks: int = 1,
+) -> tuple[str, float]:
+    """
+    Compare one batch mean with its history.
+
+    Args:
+        batch_mean, count: the batch's mean and number of instances
+        history: the series' historical distribution
+        full_count: instances in a full run
+        margin: equivalence margin (default: detectable_change())
+        alpha: significance level of each test
+        num_looks: planned batches, for the drift test's Bonferroni correction
+
+    Returns:
+        (EQUIVALENT | DRIFT | CONTINUE, z-score)
+    """
+    if margin is None:
+        margin = detectable_change(history, full_count, alpha)
+    error = standard_error(history, count)
+    difference = batch_mean - history.mean
+    if error == 0:
+        return (EQUIVALENT if abs(difference) < margin else DRIFT), 0.0
+
+    z = difference / error
+    normal = NormalDist()
+    if abs(z) > normal.inv_cdf(1 - alpha / (2 * num_looks)):
+        return DRIFT, z
+    # TOST: both one-sided tests against +/- margin reject at alpha
+    if abs(difference) + normal.inv_cdf(1 - alpha) * error < margin:
+        return EQUIVALENT, z
+    return CONTINUE, z
+
+
+def decide_model(
+    runs: list[dict[str, Any]],
+    history: dict[SeriesKey, History],
+    batch_sizes: tuple[int, ...] = DEFAULT_BATCH_SIZES,
+    margin: Optional[float] = None,
+    alpha: float = ALPHA,
+) -> tuple[str, list[dict[str, Any]]]:
+    """
+    Decide what to do with one model from its runs in the latest batch.
+
+    Args:
+        runs: summarize.summarize_run() output for the model's run specs
+        history: load_history() output
+        batch_sizes: planned batch sizes; the last is the full run
+        margin: equivalence margin on the metric scale (default: per series,
+            the change a full run detects)
+        alpha: significance level
+
+    Returns:
+        the model's decision (any drift wins, then any inconclusive series)
+        and the per-series tests behind it
+    """
+    tests = []
+    for run in runs:
+        for metric in SEQUENTIAL_METRICS:
+            for split, stat in run["stats"].get(metric, {}).items():
+                if stat.get("mean") is None or not stat.get("count"):
+                    continue
+                key = (run["run_name"], metric, split)
+                series = history.get(key)
+                if series is None or series.num_runs < MIN_HISTORY_RUNS:
+                    decision, z = DRIFT, math.nan
+                else:
+                    decision, z = compare_batch(
+                        stat["mean"],
+                        stat["count"],
+                        series,
+                        full_count=batch_sizes[-1],
+                        margin=margin,
+                        alpha=alpha,
+                        num_looks=len(batch_sizes),
+                    )
+                tests.append(
+                    {
+                        "run_name": run["run_name"],
+                        "metric": metric,
+                        "split": split,
+                        "count": stat["count"],
+                        "mean": stat["mean"],
+                        "historical_mean": series.mean if series else None,
+                        "z": None if math.isnan(z) else round(z, 3),
+                        "decision": decision,
+                    }
+                )
+
+    decisions = {test["decision"] for test in tests}
+    if not tests or DRIFT in decisions:
+        return DRIFT, tests
+    if CONTINUE in decisions:
+        return CONTINUE, tests
+    return EQUIVALENT, tests
+
+
+def next_batch_size(
+    decision: str, current: int, batch_sizes: tuple[int, ...]
+) -> Optional[int]:
+    """Instances for the model's next batch, or None if it is finished."""
+    if decision == EQUIVALENT or current >= batch_sizes[-1]:
+        return None
+    if decision == DRIFT:
+        return batch_sizes[-1]
+    return next(size for size in batch_sizes if size > current)
@@ -0,0 +1,263 @@
+"""
+Sharded extraction: map over run roots into partial summaries, then merge.
+
+The map step, extract_shard(), harvests the suites under one or more run
+roots (e.g. downloaded `benchmark-results` artifacts, or another host's
+benchmark_output/runs) into a partial summary CSV in the
+benchmark_summary.csv layout. Suites can be split into shards by a stable
+hash of the suite name, so `--shard 0/4` ... `--shard 3/4` run on different
+machines and together cover every suite exactly once.
+
+The reduce step, merge_partials(), concatenates the existing summary and the
+partials, deduplicates stat rows on their identity (suite, run spec, metric,
+split and perturbation) and reports rows whose values disagree between
+sources. On a conflict, the source listed last wins, so partials override
+the existing summary. The merged summary is written like a full extraction:
+CSV, results store, downsampled series and regression report.
+"""
+
+import zlib
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from daily_bench import (
+    archives,
+    downsample,
+    extractor,
+    profiling,
+    regression,
+    store,
+    summarize,
+)
+
+# Columns that identify a stat row; two rows with the same values describe
+# the same measurement
+ROW_IDENTITY = ["run", "run_name", "name", "split", "sub_split", "perturbation"]
+
+# Stat values compared between duplicate rows
+VALUE_COLUMNS = [
+    "count",
+    "sum",
+    "sum_squared",
+    "min",
+    "max",
+    "mean",
+    "variance",
+    "stddev",
+]
+
+# Values equal to this many decimals are not a conflict (CSV round-trips)
+CONFLICT_DECIMALS = 9
+
+SORT_COLUMNS = ["model", "scenario_class", "run_timestamp", "name"]
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse 'I/N' into (index, count), e.g. '0/4' -> (0, 4)."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like I/N (e.g. 0/4), got {spec!r}") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard index must be in [0, {count}), got {spec!r}")
+    return index, count
+
+
+def shard_of(suite_name: str, num_shards: int) -> int:
+    """Stable shard of a suite; the same on every machine and Python version."""
+    return zlib.crc32(suite_name.encode()) % num_shards
+
+
+def find_shard_suites(
+    roots: list[Path], shard_index: int = 0, num_shards: int = 1
+) -> list[Path | archives.ArchivePath]:
+    """Suite directories under *roots* that belong to the given shard."""
+    suites: list[Path | archives.ArchivePath] = []
+    for root in roots:
+        for suite_path in extractor.find_new_runs(root, existing_run_ids=set()):
+            if shard_of(suite_path.name, num_shards) == shard_index:
+                suites.append(suite_path)
+    return suites
+
+
+def extract_shard(
+    roots: list[Path],
+    partial_path: str | Path,
+    shard_index: int = 0,
+    num_shards: int = 1,
+) -> pd.DataFrame:
+    """
+    Harvest one shard of the suites under *roots* into a partial summary CSV.
+
+    Args:
+        roots: run roots, each containing SUITE/RUN_SPEC/stats.json
+        partial_path: CSV to write (a .gz suffix compresses it)
+        shard_index, num_shards: which of the suites to harvest
+
+    Returns:
+        the partial summary written
+    """
+    suites = find_shard_suites(roots, shard_index, num_shards)
+    print(
+        f"Shard {shard_index}/{num_shards}: {len(suites)} suites under "
+        f"{', '.join(str(root) for root in roots)}"
+    )
+    with profiling.stage("harvest_helm_stats_from_runs"):
+        partial = extractor.harvest_helm_stats_from_runs(suites)
+    if not partial.empty:
+        partial = extractor.add_temporal_columns(partial).drop(
+            columns=["run_hour", "run_weekday"]
+        )
+        partial = partial[partial.name.isin(summarize.KEEP_METRIC_NAMES)]
+        partial, conflicts = deduplicate(partial)
+        report_conflicts(conflicts)
+        partial = sort_summary(partial)
+
+    partial_path = Path(partial_path)
+    partial_path.parent.mkdir(parents=True, exist_ok=True)
+    with profiling.stage("csv_write"):
+        partial.to_csv(partial_path, index=False, lineterminator="\n")
+    print(f"Wrote {len(partial)} rows to {partial_path}")
+    return partial
+
+
+def sort_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort summary rows the way benchmark_summary.csv is sorted."""
+    sort_columns = [column for column in SORT_COLUMNS if column in df.columns]
+    with profiling.stage("sort"):
+        return df.sort_values(sort_columns, kind="stable").reset_index(drop=True)
+
+
+def deduplicate(
+    df: pd.DataFrame, source_column: Optional[str] = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Drop duplicate stat rows, keeping the last, and find the conflicting ones.
+
+    Args:
+        df: summary rows, possibly from several sources
+        source_column: column naming each row's source, listed in conflicts
+
+    Returns:
+        (deduplicated rows, one row per conflicting identity with the columns
+        that differ and the sources involved)
+    """
+    identity = [column for column in ROW_IDENTITY if column in df.columns]
+    values = [column for column in VALUE_COLUMNS if column in df.columns]
+    duplicated = df.duplicated(identity, keep=False)
+    if not duplicated.any():
+        return df, pd.DataFrame(columns=identity + ["columns", "sources"])
+
+    # Rows without a perturbation (or sub_split) have NaN there; those must
+    # still group together, and NaN == NaN when comparing values
+    candidates = df[duplicated]
+    keys = candidates[identity].astype(object).fillna("").astype(str)
+    groups = keys.groupby(identity, sort=False, dropna=False).ngroup()
+    # Floats that agree to CONFLICT_DECIMALS are the same value
+    rounded = (
+        candidates[values]
+        .apply(pd.to_numeric, errors="coerce")
+        .round(CONFLICT_DECIMALS)
+    )
+    distinct = rounded.groupby(groups).nunique(dropna=False)
+    differing = distinct[(distinct > 1).any(axis=1)]
+
+    first_rows = candidates[~groups.duplicated()].set_index(
+        groups[~groups.duplicated()]
+    )
+    conflicts = first_rows.loc[differing.index, identity].reset_index(drop=True)
+    conflicts["columns"] = [
+        " ".join(counts[counts > 1].index) for _, counts in differing.iterrows()
+    ]
+    conflicts["sources"] = ""
+    if source_column:
+        sources = (
+            candidates[source_column]
+            .astype(str)
+            .groupby(groups)
+            .agg(lambda names: " ".join(sorted(set(names))))
+        )
+        conflicts["sources"] = sources.loc[differing.index].to_numpy()
+    return df.drop_duplicates(identity, keep="last"), conflicts
+
+
+def report_conflicts(conflicts: pd.DataFrame, limit: int = 20) -> None:
+    """Print conflicting stat rows, at most *limit* of them."""
+    if conflicts.empty:
+        return
+    print(f"Warning: {len(conflicts)} stat rows differ between sources (last wins):")
+    print(conflicts.head(limit).to_string(index=False))
+    if len(conflicts) > limit:
+        print(f"  ... and {len(conflicts) - limit} more")
+
+
+def merge_partials(
+    partial_paths: list[Path],
+    output_path: str | Path = "results/benchmark_summary.csv",
+    include_existing: bool = True,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Merge partial summaries into the summary CSV and rebuild its store.
+
+    Args:
+        partial_paths: partial summaries from extract_shard(), lowest
+            precedence first
+        output_path: summary CSV to write
+        include_existing: merge into the existing summary instead of
+            replacing it
+
+    Returns:
+        (merged summary, conflicts); conflicts are also written to
+        merge_conflicts.csv next to *output_path* when there are any
+    """
+    output_path = Path(output_path)
+    sources = list(partial_paths)
+    if include_existing and output_path.exists():
+        sources.insert(0, output_path)
+
+    frames = []
+    with profiling.stage("csv_read"):
+        for source in sources:
+            frame = pd.read_csv(source)
+            if frame.empty:
+                continue
+            frames.append(frame.assign(_source=source.name))
+            print(f"Read {len(frame)} rows from {source}")
+    if not frames:
+        raise ValueError("Nothing to merge: all partial summaries are empty")
+
+    with profiling.stage("merge"):
+        # Keep the existing column order and append columns only partials have
+        columns = list(dict.fromkeys(c for frame in frames for c in frame.columns))
+        combined = pd.concat(frames, ignore_index=True)[columns]
+        merged, conflicts = deduplicate(combined, source_column="_source")
+        # Summaries written before canary probes have no run_kind
+        merged = extractor.add_run_kind(merged.drop(columns="_source"))
+        merged = sort_summary(merged)
+    report_conflicts(conflicts)
+
+    conflicts_path = output_path.with_name("merge_conflicts.csv")
+    if conflicts.empty:
+        conflicts_path.unlink(missing_ok=True)
+    else:
+        conflicts.to_csv(conflicts_path, index=False, lineterminator="\n")
+        print(f"Conflicts written to {conflicts_path}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with profiling.stage("csv_write"):
+        extractor.write_csv_atomic(merged, output_path, lineterminator="\n")
+    db_path = store.db_path_for(output_path)
+    db_path.unlink(missing_ok=True)
+    with profiling.stage("db_write"):
+        store.upsert(merged, db_path)
+    with profiling.stage("downsample"):
+        downsample.save_downsampled_series(merged, output_path)
+    with profiling.stage("regression"):
+        regression.save_regression_report(merged, output_path)
+    print(
+        f"Merged {len(combined)} rows from {len(frames)} sources into "
+        f"{len(merged)} rows ({merged['run'].nunique()} suites) -> {output_path}"
+    )
+    return merged, conflicts
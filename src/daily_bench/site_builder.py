@@ -0,0 +1,345 @@
+"""
+Build the dashboard into a static, cache-friendly site bundle.
+
+Every file except index.html is minified (text), renamed to include a hash of
+its content (e.g. script.3f9a1c2b7d.js) and precompressed to .gz (and .br
+when the `brotli` package is installed). References between files are
+rewritten to the hashed names, so everything but the small index.html can
+be served with `Cache-Control: immutable`.
+
+Only the standard library is used, so CI can run it without installing HELM:
+
+    PYTHONPATH=src python -m daily_bench.site_builder --output site
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Callable, Optional
+
+# Dashboard sources, in dependency order: each file may only reference
+# files listed before it (index.html references everything)
+CODE_FILES = ["columnar.js", "csv-worker.js", "script.js", "style.css"]
+
+# Data files the dashboard fetches; looked up in the dashboard directory,
+# then the results directory
+DATA_FILES = [
+    "benchmark_summary.csv",
+    "latency_summary.csv",
+    "latency_by_hour.csv",
+    "timeseries_lttb.json",
+]
+
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".csv", ".json", ".svg"}
+
+HASH_LENGTH = 10
+
+# Characters after which a '/' starts a regex literal rather than a division
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+
+
+def content_hash(data: bytes) -> str:
+    """Short SHA-256 hex digest used in bundle file names."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    """Insert the content hash before the suffix: app.js -> app.<hash>.js."""
+    path = Path(name)
+    return f"{path.stem}.{content_hash(data)}{path.suffix}"
+
+
+def minify_js(source: str) -> str:
+    """
+    Strip comments, indentation, repeated spaces and blank lines from JavaScript.
+
+    Deliberately conservative: line breaks are kept so automatic semicolon
+    insertion behaves exactly as before, and string, template and regex
+    literals are copied verbatim.
+    """
+    out: list[str] = []
+    i = 0
+    n = len(source)
+    in_template = False
+    # Brace depth inside each open ${...} template substitution
+    substitutions: list[int] = []
+    last = ""  # last non-whitespace character emitted as code
+
+    def copy_quoted(start: int, quote: str) -> int:
+        j = start + 1
+        while j < n and source[j] != quote and source[j] != "\n":
+            j += 2 if source[j] == "\\" else 1
+        out.append(source[start : j + 1])
+        return j + 1
+
+    def copy_regex(start: int) -> int:
+        j = start + 1
+        in_class = False
+        while j < n and source[j] != "\n":
+            char = source[j]
+            if char == "\\":
+                j += 2
+                continue
+            if char == "[":
+                in_class = True
+            elif char == "]":
+                in_class = False
+            elif char == "/" and not in_class:
+                j += 1
+                break
+            j += 1
+        while j < n and source[j].isalpha():
+            j += 1
+        out.append(source[start:j])
+        return j
+
+    while i < n:
+        char = source[i]
+
+        if in_template:
+            if char == "\\":
+                out.append(source[i : i + 2])
+                i += 2
+            elif char == "`":
+                out.append(char)
+                in_template = False
+                last = char
+                i += 1
+            elif source.startswith("${", i):
+                out.append("${")
+                substitutions.append(0)
+                in_template = False
+                last = "{"
+                i += 2
+            else:
+                out.append(char)
+                i += 1
+            continue
+
+        if char == "\n":
+            while out and out[-1] == " ":
+                out.pop()
+            if out and out[-1] != "\n":
+                out.append("\n")
+            i += 1
+            while i < n and source[i] in " \t\r":
+                i += 1
+            continue
+        if char in " \t\r":
+            if out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            i += 1
+            continue
+        if source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        if source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            continue
+
+        if char in "'\"":
+            i = copy_quoted(i, char)
+        elif char == "`":
+            out.append(char)
+            in_template = True
+            i += 1
+        elif char == "/" and (
+            not last
+            or last in _REGEX_PRECEDERS
+            or re.search(r"\b(return|typeof)\s*$", "".join(out[-16:]))
+        ):
+            i = copy_regex(i)
+        elif char == "}" and substitutions and substitutions[-1] == 0:
+            # End of a ${...} substitution: back inside the template literal
+            substitutions.pop()
+            out.append(char)
+            in_template = True
+            i += 1
+        else:
+            if substitutions and char == "{":
+                substitutions[-1] += 1
+            elif substitutions and char == "}":
+                substitutions[-1] -= 1
+            out.append(char)
+            i += 1
+        last = source[i - 1]
+
+    return "".join(out).strip() + "\n"
+
+
+def minify_css(source: str) -> str:
+    """Strip comments and collapse whitespace in a stylesheet."""
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.DOTALL)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};,])\s*", r"\1", source)
+    source = re.sub(r":\s+", ":", source)
+    source = source.replace(";}", "}")
+    return source.strip() + "\n"
+
+
+def minify_html(source: str) -> str:
+    """Strip comments, indentation and blank lines from HTML."""
+    source = re.sub(r"<!--.*?-->", "", source, flags=re.DOTALL)
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(line for line in lines if line) + "\n"
+
+
+MINIFIERS: dict[str, Callable[[str], str]] = {
+    ".js": minify_js,
+    ".css": minify_css,
+    ".html": minify_html,
+}
+
+
+def rewrite_references(text: str, mapping: dict[str, str]) -> str:
+    """
+    Point quoted references ('name', "./name", url(name)) at hashed names.
+
+    Only whole quoted strings are rewritten, so prose and log messages that
+    mention a file name are left alone.
+    """
+    for name, hashed in mapping.items():
+        pattern = re.escape(name)
+        text = re.sub(
+            rf"""(["'`(])((?:\./)?){pattern}(["'`)])""",
+            rf"\g<1>{hashed}\g<3>",
+            text,
+        )
+    return text
+
+
+def _html_local_references(html: str, source_dir: Path) -> dict[str, Path]:
+    """Map src/href values of index.html that point at local files to paths."""
+    references = {}
+    for value in re.findall(r"""(?:src|href)=["']([^"'#?]+)["']""", html):
+        if re.match(r"^[a-z]+:|^//", value):
+            continue
+        path = (source_dir / value).resolve()
+        if path.is_file():
+            references[value] = path
+    return references
+
+
+def _compress(path: Path) -> list[Path]:
+    """Write path.gz (and path.br if brotli is available) beside *path*."""
+    data = path.read_bytes()
+    written = [path.with_name(path.name + ".gz")]
+    # mtime=0 keeps the output byte-for-byte reproducible
+    written[0].write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    try:
+        import brotli
+    except ImportError:
+        return written
+    brotli_path = path.with_name(path.name + ".br")
+    brotli_path.write_bytes(brotli.compress(data, quality=11))
+    written.append(brotli_path)
+    return written
+
+
+def build_site(
+    source_dir: str | Path = "dashboard",
+    output_dir: str | Path = "site",
+    results_dir: str | Path = "results",
+) -> dict[str, str]:
+    """
+    Build the hashed, minified and precompressed dashboard bundle.
+
+    Args:
+        source_dir: dashboard directory containing index.html
+        output_dir: directory to write the bundle to (replaced if it exists)
+        results_dir: fallback location for data files missing from source_dir
+
+    Returns:
+        manifest mapping original file names to their hashed names
+    """
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir)
+    results_dir = Path(results_dir)
+
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+
+    manifest: dict[str, str] = {}
+
+    def emit(name: str, data: bytes) -> str:
+        hashed = hashed_name(name, data)
+        (output_dir / hashed).write_bytes(data)
+        manifest[name] = hashed
+        return hashed
+
+    # Data files and images first: they reference nothing
+    for name in DATA_FILES:
+        path = next(
+            (p for p in [source_dir / name, results_dir / name] if p.exists()), None
+        )
+        if path is None:
+            print(f"  {name}: not found, skipping")
+            continue
+        emit(name, path.read_bytes())
+
+    html = (source_dir / "index.html").read_text()
+    html_references = _html_local_references(html, source_dir)
+    html_mapping = {}
+    for value, path in html_references.items():
+        if path.name not in CODE_FILES:
+            html_mapping[value] = emit(path.name, path.read_bytes())
+
+    # Code, in dependency order, with references rewritten before hashing
+    for name in CODE_FILES:
+        text = rewrite_references((source_dir / name).read_text(), manifest)
+        text = MINIFIERS[Path(name).suffix](text)
+        emit(name, text.encode())
+    html_mapping.update(
+        {
+            value: manifest[path.name]
+            for value, path in html_references.items()
+            if path.name in CODE_FILES
+        }
+    )
+
+    html = minify_html(rewrite_references(html, html_mapping))
+    (output_dir / "index.html").write_text(html)
+
+    with (output_dir / "manifest.json").open("w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    compressed = 0
+    for path in sorted(output_dir.iterdir()):
+        if path.suffix in COMPRESSIBLE_SUFFIXES:
+            compressed += len(_compress(path))
+
+    total_source = sum(
+        (source_dir / name).stat().st_size for name in CODE_FILES + ["index.html"]
+    )
+    total_built = (
+        sum((output_dir / manifest[name]).stat().st_size for name in CODE_FILES)
+        + (output_dir / "index.html").stat().st_size
+    )
+    print(
+        f"Built {len(manifest) + 1} files into {output_dir} "
+        f"({compressed} precompressed); code {total_source / 1024:.1f} KB -> "
+        f"{total_built / 1024:.1f} KB minified"
+    )
+    return manifest
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command-line entry point for running without the full package installed."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--source", default="dashboard", help="Dashboard directory")
+    parser.add_argument("--output", default="site", help="Bundle output directory")
+    parser.add_argument("--results", default="results", help="Results directory")
+    args = parser.parse_args(argv)
+    build_site(args.source, args.output, args.results)
+
+
+if __name__ == "__main__":
+    main()
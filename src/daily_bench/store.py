@@ -0,0 +1,458 @@
+"""
+SQLite store of the benchmark summary, written alongside benchmark_summary.csv.
+
+The summary CSV repeats every run, run spec and scenario argument on each
+stat row. The store keeps them once, in a star schema:
+
+    runs       one row per suite: run, run_timestamp, run_date, run_kind
+               ('full' or 'canary')
+    scenarios  one row per run spec: run_name, model, scenario_class and the
+               scenario args as sorted JSON (keyed by run_name + args)
+    metrics    one row per (name, split, other stat name fields as JSON)
+    facts      (run_id, scenario_id, metric_id) -> count, sum, mean, ...
+    wide_columns  the wide layout's column order, and which columns are integers
+
+A stat row is identified by (run, run_name, name, split), so ingesting a suite
+twice updates its facts instead of duplicating them. query() joins the tables
+back into the wide CSV layout, filtering through indexes on scenarios
+(model, scenario_class), metrics (name) and runs (run_timestamp); the
+`wide_stats` view does the same join for ad-hoc SQL.
+
+Fact columns are added with ALTER TABLE when a new stat field appears.
+query() puts the columns back in the order and integer dtypes they were
+written with, so a summary rebuilt from the store matches the extracted one.
+Timestamps are stored as 'YYYY-MM-DD HH:MM:SS' text, which sorts and compares
+chronologically.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import pandas as pd
+
+from daily_bench import run_kinds
+
+RUN_COLUMNS = ["run", "run_timestamp", "run_date", "run_kind"]
+SCENARIO_COLUMNS = ["run_name", "model", "scenario_class"]
+SCENARIO_ARG_PREFIX = "scenario_"
+METRIC_COLUMNS = ["name", "split"]
+
+# Wide columns that are never fact values
+DIMENSION_COLUMNS = set(RUN_COLUMNS + SCENARIO_COLUMNS + METRIC_COLUMNS)
+
+# Rows without a run_kind (summaries written before canary probes) are full runs
+DEFAULT_RUN_KIND = run_kinds.RUN_KIND_FULL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    run TEXT NOT NULL UNIQUE,
+    run_timestamp TEXT,
+    run_date TEXT,
+    run_kind TEXT NOT NULL DEFAULT 'full'
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    scenario_id INTEGER PRIMARY KEY,
+    run_name TEXT NOT NULL,
+    args TEXT NOT NULL DEFAULT '{}',
+    model TEXT,
+    scenario_class TEXT,
+    UNIQUE (run_name, args)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    metric_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    split TEXT NOT NULL DEFAULT '',
+    attributes TEXT NOT NULL DEFAULT '{}',
+    UNIQUE (name, split, attributes)
+);
+CREATE TABLE IF NOT EXISTS facts (
+    run_id INTEGER NOT NULL REFERENCES runs,
+    scenario_id INTEGER NOT NULL REFERENCES scenarios,
+    metric_id INTEGER NOT NULL REFERENCES metrics,
+    PRIMARY KEY (run_id, scenario_id, metric_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS wide_columns (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    is_integer INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (run_timestamp);
+CREATE INDEX IF NOT EXISTS idx_scenarios_series ON scenarios (model, scenario_class);
+CREATE INDEX IF NOT EXISTS idx_metrics_name ON metrics (name);
+CREATE INDEX IF NOT EXISTS idx_facts_series ON facts (scenario_id, metric_id);
+CREATE VIEW IF NOT EXISTS wide_stats AS
+    SELECT r.run, r.run_timestamp, r.run_date, r.run_kind,
+           s.run_name, s.model, s.scenario_class, s.args,
+           m.name, m.split, m.attributes, f.*
+    FROM facts f
+    JOIN runs r USING (run_id)
+    JOIN scenarios s USING (scenario_id)
+    JOIN metrics m USING (metric_id);
+"""
+
+
+def db_path_for(output_path: str | Path) -> Path:
+    """Store path next to a summary CSV: results/benchmark_summary.db."""
+    return Path(output_path).with_suffix(".db")
+
+
+def connect(db_path: str | Path) -> sqlite3.Connection:
+    """Open the store, creating the schema if needed."""
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+
+    # Stores written before canary probes have no run_kind; all their runs are full
+    run_columns = {row[1] for row in connection.execute("PRAGMA table_info(runs)")}
+    if "run_kind" not in run_columns:
+        connection.execute(
+            "ALTER TABLE runs ADD COLUMN run_kind TEXT NOT NULL "
+            f"DEFAULT '{DEFAULT_RUN_KIND}'"
+        )
+        connection.execute("DROP VIEW wide_stats")
+        connection.executescript(SCHEMA)
+
+    # Stores written before the star schema kept the wide rows in one table
+    legacy = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats'"
+    ).fetchone()
+    if legacy:
+        wide = pd.read_sql_query("SELECT * FROM stats", connection)
+        connection.execute("DROP TABLE stats")
+        connection.commit()
+        upsert(wide, db_path)
+    return connection
+
+
+def fact_columns(connection: sqlite3.Connection) -> list[str]:
+    """Stat value columns of the facts table, in order."""
+    return [
+        row[1]
+        for row in connection.execute("PRAGMA table_info(facts)")
+        if row[1] not in ("run_id", "scenario_id", "metric_id")
+    ]
+
+
+def _sql_value(value: Any) -> Any:
+    """Convert a DataFrame cell to something sqlite3 stores faithfully."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    if not isinstance(value, (int, float, str, bytes)):
+        return str(value)
+    return value
+
+
+def _json_column(df: pd.DataFrame, columns: list[str], prefix: str = "") -> list[str]:
+    """Sorted JSON object of the non-null *columns* of each row."""
+    if not columns:
+        return ["{}"] * len(df)
+    objects = []
+    for values in df[columns].itertuples(index=False, name=None):
+        fields = {}
+        for column, value in zip(columns, values):
+            value = _sql_value(value)
+            if value is not None:
+                fields[column[len(prefix) :]] = value
+        objects.append(json.dumps(fields, sort_keys=True))
+    return objects
+
+
+def _dimension_ids(
+    connection: sqlite3.Connection,
+    table: str,
+    id_column: str,
+    rows: pd.DataFrame,
+    key_columns: list[str],
+) -> pd.Series:
+    """
+    Upsert the distinct *rows* into a dimension table and return each row's id.
+
+    Columns of *rows* outside *key_columns* are refreshed on existing rows.
+    """
+    rows = rows.apply(lambda column: column.map(_sql_value)).astype(object)
+    distinct = rows.drop_duplicates(subset=key_columns, keep="last")
+    columns = list(rows.columns)
+    others = [c for c in columns if c not in key_columns]
+    conflict = "DO NOTHING"
+    if others:
+        conflict = "DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in others)
+    connection.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT ({', '.join(key_columns)}) {conflict}",
+        distinct.itertuples(index=False, name=None),
+    )
+
+    ids = pd.read_sql_query(
+        f"SELECT {id_column}, {', '.join(key_columns)} FROM {table}", connection
+    )
+    merged = rows[key_columns].merge(ids.astype(object), on=key_columns, how="left")
+    return pd.Series(merged[id_column].to_numpy(), index=rows.index)
+
+
+def merge_column_order(existing: list[str], incoming: list[str]) -> list[str]:
+    """
+    *existing* columns with those only in *incoming* inserted right after the
+    nearest column before them in *incoming* (e.g. a new scenario arg lands
+    after run_name, where a full extraction puts it).
+    """
+    order = list(existing)
+    for index, column in enumerate(incoming):
+        if column in order:
+            continue
+        placed = [c for c in incoming[:index] if c in order]
+        order.insert(order.index(placed[-1]) + 1 if placed else 0, column)
+    return order
+
+
+def _record_layout(connection: sqlite3.Connection, df: pd.DataFrame) -> None:
+    """
+    Merge *df*'s column order and integer columns into wide_columns.
+
+    A column stops counting as integer once it arrives with non-integer values.
+    """
+    rows = connection.execute(
+        "SELECT name, is_integer FROM wide_columns ORDER BY position"
+    ).fetchall()
+    known = [name for name, _ in rows]
+    integer = {name for name, is_integer in rows if is_integer}
+    for column in df.columns:
+        if not pd.api.types.is_integer_dtype(df[column]):
+            if column not in known or df[column].notna().any():
+                integer.discard(column)
+        elif column not in known:
+            integer.add(column)
+    order = merge_column_order(known, list(df.columns))
+
+    connection.execute("DELETE FROM wide_columns")
+    connection.executemany(
+        "INSERT INTO wide_columns (name, position, is_integer) VALUES (?, ?, ?)",
+        [(name, position, int(name in integer)) for position, name in enumerate(order)],
+    )
+
+
+def upsert(df: pd.DataFrame, db_path: str | Path) -> int:
+    """
+    Insert or replace summary rows given in the wide CSV layout.
+
+    Returns:
+        number of fact rows written
+    """
+    if df.empty:
+        return 0
+    layout = df
+    df = df.copy()
+    for column in DIMENSION_COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+    df["split"] = df["split"].fillna("")
+    df["run_kind"] = df["run_kind"].fillna(DEFAULT_RUN_KIND)
+
+    arg_columns = [
+        c
+        for c in df.columns
+        if c.startswith(SCENARIO_ARG_PREFIX) and c not in DIMENSION_COLUMNS
+    ]
+    value_columns = [
+        c
+        for c in df.columns
+        if c not in DIMENSION_COLUMNS
+        and c not in arg_columns
+        and pd.api.types.is_numeric_dtype(df[c])
+    ]
+    attribute_columns = [
+        c
+        for c in df.columns
+        if c not in DIMENSION_COLUMNS and c not in arg_columns + value_columns
+    ]
+    df["args"] = _json_column(df, arg_columns, SCENARIO_ARG_PREFIX)
+    df["attributes"] = _json_column(df, attribute_columns)
+
+    with connect(db_path) as connection:
+        _record_layout(connection, layout)
+        existing = set(fact_columns(connection))
+        for column in value_columns:
+            if column not in existing:
+                connection.execute(f'ALTER TABLE facts ADD COLUMN "{column}" REAL')
+
+        facts = pd.DataFrame(
+            {
+                "run_id": _dimension_ids(
+                    connection, "runs", "run_id", df[RUN_COLUMNS], ["run"]
+                ),
+                "scenario_id": _dimension_ids(
+                    connection,
+                    "scenarios",
+                    "scenario_id",
+                    df[["run_name", "args", "model", "scenario_class"]],
+                    ["run_name", "args"],
+                ),
+                "metric_id": _dimension_ids(
+                    connection,
+                    "metrics",
+                    "metric_id",
+                    df[["name", "split", "attributes"]],
+                    ["name", "split", "attributes"],
+                ),
+            }
+        )
+        facts[value_columns] = df[value_columns]
+        facts = facts.drop_duplicates(
+            subset=["run_id", "scenario_id", "metric_id"], keep="last"
+        )
+
+        columns = list(facts.columns)
+        quoted = ", ".join(f'"{c}"' for c in columns)
+        updates = ", ".join(f'"{c}" = excluded."{c}"' for c in value_columns)
+        connection.executemany(
+            f"INSERT INTO facts ({quoted}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            "ON CONFLICT (run_id, scenario_id, metric_id) "
+            + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING"),
+            (
+                [_sql_value(value) for value in row]
+                for row in facts.itertuples(index=False, name=None)
+            ),
+        )
+    connection.close()
+    return len(facts)
+
+
+def import_csv(csv_path: str | Path, db_path: str | Path) -> int:
+    """Load an existing summary CSV into the store (one-time migration)."""
+    return upsert(pd.read_csv(csv_path), db_path)
+
+
+def get_run_ids(db_path: str | Path) -> set[str]:
+    """Suites already in the store."""
+    if not Path(db_path).exists():
+        return set()
+    with connect(db_path) as connection:
+        run_ids = {row[0] for row in connection.execute("SELECT run FROM runs")}
+    connection.close()
+    return run_ids
+
+
+def get_scenario_keys(db_path: str | Path) -> set[tuple[str, str]]:
+    """(run, run_name) pairs already in the store."""
+    if not Path(db_path).exists():
+        return set()
+    with connect(db_path) as connection:
+        keys = set(
+            connection.execute(
+                "SELECT DISTINCT r.run, s.run_name FROM facts "
+                "JOIN runs r USING (run_id) JOIN scenarios s USING (scenario_id)"
+            )
+        )
+    connection.close()
+    return keys
+
+
+def _expand_json(df: pd.DataFrame, column: str, prefix: str = "") -> pd.DataFrame:
+    """Replace a JSON object column with one column per key."""
+    expanded = pd.DataFrame(
+        [json.loads(value) for value in df[column]], index=df.index
+    ).add_prefix(prefix)
+    return pd.concat([df.drop(columns=column), expanded], axis=1)
+
+
+def query(
+    db_path: str | Path,
+    model: Optional[str | Iterable[str]] = None,
+    scenario_class: Optional[str | Iterable[str]] = None,
+    metric: Optional[str | Iterable[str]] = None,
+    since: Optional[Any] = None,
+    until: Optional[Any] = None,
+    run_kind: Optional[str | Iterable[str]] = None,
+) -> pd.DataFrame:
+    """
+    Rebuild the wide summary frame, optionally filtered through the indexes.
+
+    Args:
+        db_path: store written by the extractor
+        model, scenario_class, metric: value or values to keep (metric matches
+            the 'name' column)
+        since, until: inclusive run_timestamp bounds (anything pd.Timestamp accepts)
+        run_kind: 'full' and/or 'canary'
+
+    Returns:
+        matching rows in the summary CSV layout, ordered by model,
+        scenario_class, run_timestamp and name
+    """
+    if not Path(db_path).exists():
+        raise FileNotFoundError(
+            f"No results store at {db_path}; run `daily-bench extract`"
+        )
+    clauses = []
+    params: list[Any] = []
+    for column, wanted in [
+        ("s.model", model),
+        ("s.scenario_class", scenario_class),
+        ("m.name", metric),
+        ("r.run_kind", run_kind),
+    ]:
+        if wanted is None:
+            continue
+        values = [wanted] if isinstance(wanted, str) else list(wanted)
+        clauses.append(f'{column} IN ({", ".join("?" for _ in values)})')
+        params.extend(values)
+    if since is not None:
+        clauses.append("r.run_timestamp >= ?")
+        params.append(_sql_value(pd.Timestamp(since)))
+    if until is not None:
+        clauses.append("r.run_timestamp <= ?")
+        params.append(_sql_value(pd.Timestamp(until)))
+
+    with connect(db_path) as connection:
+        selected_facts = "".join(f', f."{c}"' for c in fact_columns(connection))
+        sql = (
+            "SELECT s.model, s.scenario_class, r.run_timestamp, r.run_date, r.run, "
+            "r.run_kind, "
+            f"m.split{selected_facts}, s.run_name, s.args, m.name, m.attributes "
+            "FROM facts f "
+            "JOIN runs r USING (run_id) "
+            "JOIN scenarios s USING (scenario_id) "
+            "JOIN metrics m USING (metric_id)"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY s.model, s.scenario_class, r.run_timestamp, m.name"
+        df = pd.read_sql_query(sql, connection, params=params)
+        layout = connection.execute(
+            "SELECT name, is_integer FROM wide_columns ORDER BY position"
+        ).fetchall()
+    connection.close()
+
+    df = _expand_json(df, "args", SCENARIO_ARG_PREFIX)
+    df = _expand_json(df, "attributes")
+    if not layout:
+        # Stores written before wide_columns: scenario args go where the CSV
+        # has them, right after run_name
+        args = [
+            c
+            for c in df.columns
+            if c.startswith(SCENARIO_ARG_PREFIX) and c not in DIMENSION_COLUMNS
+        ]
+        rest = [c for c in df.columns if c not in args]
+        position = rest.index("run_name") + 1
+        return df[rest[:position] + args + rest[position:]]
+
+    order = [name for name, _ in layout if name in df.columns]
+    df = df[order + [c for c in df.columns if c not in order]]
+    # Fact columns are REAL; restore the columns that were written as integers
+    for name, is_integer in layout:
+        if is_integer and name in df.columns and df[name].notna().all():
+            df[name] = df[name].astype("int64")
+    return df
+
+
+def wide_frame(db_path: str | Path) -> pd.DataFrame:
+    """The whole store in the summary CSV layout (query() without filters)."""
+    return query(db_path)
@@ -0,0 +1,144 @@
+"""
+Summarize a HELM suite without `helm-summarize`.
+
+helm-summarize rebuilds HELM's whole website JSON (groups, tables, per-run
+pages) for a suite, none of which daily-bench reads. This module reads only
+each run's stats.json and run_spec.json and writes the aggregates daily-bench
+tracks to SUITE/daily_bench_summary.json:
+
+    {
+        "suite": "results-20250608_112220",
+        "metrics": ["exact_match", ...],
+        "runs": [{"run_name", "model", "scenario_class", "scenario_args",
+                  "max_eval_instances", "stats": {metric: {split: {count, mean,
+                  ...}}}}],
+        "models": {model: {scenario_class: {metric: mean}}},
+    }
+
+Only the standard library is used, so it is cheap to run after every suite.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+# Metrics kept in the summary CSV and the suite summary
+KEEP_METRIC_NAMES = ["perplexity", "exact_match", "f1_score", "bleu_4", "rouge_l"]
+
+SUMMARY_FILE_NAME = "daily_bench_summary.json"
+
+# Stat fields copied into the summary (the rest of stats.json is per-metric noise)
+STAT_FIELDS = ["count", "sum", "mean", "min", "max", "stddev", "variance"]
+
+
+def summarize_run(scenario_dir: Path) -> dict[str, Any]:
+    """
+    Summarize one run spec directory from its stats.json and run_spec.json.
+
+    Perturbed stats (robustness/fairness variants) are skipped; they are not
+    part of what daily-bench tracks.
+    """
+    with (scenario_dir / "stats.json").open() as f:
+        stats_list = json.load(f)
+    run_spec_path = scenario_dir / "run_spec.json"
+    run_spec = {}
+    if run_spec_path.exists():
+        with run_spec_path.open() as f:
+            run_spec = json.load(f)
+
+    adapter_spec = run_spec.get("adapter_spec", {})
+    scenario_spec = run_spec.get("scenario_spec", {})
+
+    stats: dict[str, dict[str, dict[str, Any]]] = {}
+    for stat_entry in stats_list:
+        name = stat_entry.get("name", {})
+        metric = name.get("name")
+        if metric not in KEEP_METRIC_NAMES or name.get("perturbation"):
+            continue
+        split = name.get("split", "unknown")
+        stats.setdefault(metric, {})[split] = {
+            field: stat_entry[field] for field in STAT_FIELDS if field in stat_entry
+        }
+
+    return {
+        "run_name": run_spec.get("name", scenario_dir.name),
+        "model": adapter_spec.get("model", "unknown"),
+        "scenario_class": scenario_spec.get("class_name", "unknown"),
+        "scenario_args": scenario_spec.get("args", {}),
+        "max_eval_instances": adapter_spec.get("max_eval_instances"),
+        "stats": stats,
+    }
+
+
+def aggregate_models(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Average each metric's mean per (model, scenario class) across run specs
+    and splits, count-weighted: the model x scenario table helm-summarize
+    would show.
+    """
+    totals: dict[tuple[str, str, str], list[float]] = {}
+    for run in runs:
+        for metric, splits in run["stats"].items():
+            for stat in splits.values():
+                if stat.get("mean") is None or not stat.get("count"):
+                    continue
+                key = (run["model"], run["scenario_class"], metric)
+                total = totals.setdefault(key, [0.0, 0.0])
+                total[0] += stat["mean"] * stat["count"]
+                total[1] += stat["count"]
+
+    models: dict[str, Any] = {}
+    for (model, scenario_class, metric), (weighted, count) in sorted(totals.items()):
+        models.setdefault(model, {}).setdefault(scenario_class, {})[metric] = round(
+            weighted / count, 6
+        )
+    return models
+
+
+def summarize_suite(suite_dir: str | Path) -> Path:
+    """
+    Write SUITE/daily_bench_summary.json for every run with a stats.json.
+
+    Args:
+        suite_dir: benchmark_output/runs/SUITE directory
+
+    Returns:
+        path of the summary written
+    """
+    suite_dir = Path(suite_dir)
+    if not suite_dir.is_dir():
+        raise FileNotFoundError(f"Suite directory not found: {suite_dir}")
+
+    start = time.monotonic()
+    runs = [
+        summarize_run(stats_path.parent)
+        for stats_path in sorted(suite_dir.glob("*/stats.json"))
+    ]
+    summary = {
+        "suite": suite_dir.name,
+        "metrics": KEEP_METRIC_NAMES,
+        "runs": runs,
+        "models": aggregate_models(runs),
+    }
+
+    summary_path = suite_dir / SUMMARY_FILE_NAME
+    with summary_path.open("w") as f:
+        json.dump(summary, f, indent=1)
+        f.write("\n")
+    print(
+        f"Summarized {len(runs)} runs of {suite_dir.name} in "
+        f"{time.monotonic() - start:.2f}s -> {summary_path}"
+    )
+    return summary_path
+
+
+def print_summary(summary_path: str | Path) -> None:
+    """Print the model x scenario table of a suite summary."""
+    with Path(summary_path).open() as f:
+        summary = json.load(f)
+    for model, scenarios in summary["models"].items():
+        print(model)
+        for scenario_class, metrics in scenarios.items():
+            values = ", ".join(f"{m}={v:.3f}" for m, v in metrics.items())
+            print(f"  {scenario_class.rsplit('.', 1)[-1]:<32} {values}")
@@ -0,0 +1,342 @@
+"""
+Generate synthetic HELM-shaped `benchmark_output/runs` trees.
+Lets the extractor be exercised and benchmarked without paid API runs.
+
+Layout written under *root*:
+    SUITE_NAME/RUN_SPEC_NAME/{stats,run_spec,per_instance_stats,instances,scenario,scenario_state}.json
+"""
+
+import datetime
+import json
+import random
+from pathlib import Path
+from typing import Any, Optional, TypedDict
+
+from daily_bench.orchestrator import MODELS_TO_RUN
+
+
+class Scale(TypedDict):
+    """Size of a synthetic history (generate_benchmark_output() keywords)."""
+
+    num_models: int
+    num_scenarios: int
+    days: int
+    runs_per_day: int
+    num_instances: int
+
+
+# (run spec prefix, scenario class, scenario args) for the entries in
+# run_entries_lite_20240424_instruct.conf
+SCENARIOS: list[tuple[str, str, dict[str, Any]]] = [
+    (
+        "narrative_qa",
+        "helm.benchmark.scenarios.narrativeqa_scenario.NarrativeQAScenario",
+        {},
+    ),
+    (
+        "natural_qa:mode=openbook_longans",
+        "helm.benchmark.scenarios.natural_qa_scenario.NaturalQAScenario",
+        {"mode": "openbook_longans"},
+    ),
+    (
+        "natural_qa:mode=closedbook",
+        "helm.benchmark.scenarios.natural_qa_scenario.NaturalQAScenario",
+        {"mode": "closedbook"},
+    ),
+    (
+        "commonsense:dataset=openbookqa,method=multiple_choice_joint",
+        "helm.benchmark.scenarios.commonsense_scenario.OpenBookQA",
+        {},
+    ),
+]
+
+# Metric names HELM writes to stats.json for these scenarios
+STAT_NAMES = [
+    "exact_match",
+    "quasi_exact_match",
+    "prefix_exact_match",
+    "quasi_prefix_exact_match",
+    "f1_score",
+    "rouge_l",
+    "bleu_1",
+    "bleu_4",
+    "num_prompt_tokens",
+    "num_output_tokens",
+    "num_completion_tokens",
+    "inference_runtime",
+    "batch_size",
+    "max_prob",
+    "logprob",
+    "num_perplexity_tokens",
+    "num_bytes",
+    "finish_reason_length",
+    "finish_reason_stop",
+    "num_train_instances",
+]
+
+# Per-instance stats are a subset of the run-level ones
+PER_INSTANCE_STAT_NAMES = STAT_NAMES[:12]
+
+WORDS = (
+    "the model answer question story river city light paper reason small large "
+    "people history water green quickly because between nothing during return"
+).split()
+
+RUN_HOURS = [0, 6, 12, 18]
+
+
+def _text(rng: random.Random, num_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(num_words))
+
+
+def _stat(name: str, split: str, values: list[float]) -> dict[str, Any]:
+    """Build a HELM Stat entry from raw values."""
+    count = len(values)
+    total = sum(values)
+    mean = total / count
+    variance = sum((v - mean) ** 2 for v in values) / count
+    return {
+        "name": {"name": name, "split": split},
+        "count": count,
+        "sum": total,
+        "sum_squared": sum(v * v for v in values),
+        "min": min(values),
+        "max": max(values),
+        "mean": mean,
+        "variance": variance,
+        "stddev": variance**0.5,
+    }
+
+
+def _run_spec_name(prefix: str, model: str) -> str:
+    separator = "," if ":" in prefix else ":"
+    return f"{prefix}{separator}model={model.replace('/', '_')}"
+
+
+def write_scenario_run(
+    run_dir: Path,
+    model: str,
+    scenario: tuple[str, str, dict[str, Any]],
+    run_timestamp: datetime.datetime,
+    rng: random.Random,
+    num_instances: int = 50,
+    prompt_words: int = 400,
+    model_skill: float = 0.7,
+) -> None:
+    """Write every JSON file HELM produces for one run spec directory."""
+    prefix, class_name, args = scenario
+    run_dir.mkdir(parents=True, exist_ok=True)
+    run_name = run_dir.name
+    scenario_name = prefix.split(":")[0]
+
+    instances = []
+    request_states = []
+    per_instance_stats = []
+    correct: list[float] = []
+    for i in range(num_instances):
+        instance_id = f"id{i}"
+        reference = _text(rng, rng.randint(1, 6))
+        is_correct = rng.random() < model_skill
+        completion_text = reference if is_correct else _text(rng, rng.randint(1, 8))
+        correct.append(float(is_correct))
+
+        instance: dict[str, Any] = {
+            "input": {"text": _text(rng, prompt_words)},
+            "references": [{"output": {"text": reference}, "tags": ["correct"]}],
+            "split": "test",
+            "id": instance_id,
+        }
+        instances.append(instance)
+
+        num_tokens = len(completion_text.split())
+        request_states.append(
+            {
+                "instance": instance,
+                "train_trial_index": 0,
+                "output_mapping": None,
+                "request": {
+                    "model_deployment": model,
+                    "model": model,
+                    "embedding": False,
+                    "prompt": instance["input"]["text"],
+                    "temperature": 0.0,
+                    "num_completions": 1,
+                    "top_k_per_token": 1,
+                    "max_tokens": 100,
+                    "stop_sequences": ["\n"],
+                    "echo_prompt": False,
+                    "top_p": 1,
+                    "presence_penalty": 0,
+                    "frequency_penalty": 0,
+                },
+                "result": {
+                    "success": rng.random() > 0.01,
+                    "embedding": [],
+                    "completions": [
+                        {
+                            "text": completion_text,
+                            "logprob": 0.0,
+                            "tokens": [
+                                {"text": token, "logprob": 0.0}
+                                for token in completion_text.split()
+                            ],
+                        }
+                    ],
+                    "cached": False,
+                    "request_time": round(rng.lognormvariate(0, 0.5), 4),
+                    "request_datetime": int(run_timestamp.timestamp()) + i,
+                },
+                "num_train_instances": 5,
+                "prompt_truncated": False,
+                "num_conditioning_tokens": 0,
+            }
+        )
+
+        per_instance_stats.append(
+            {
+                "instance_id": instance_id,
+                "train_trial_index": 0,
+                "stats": [
+                    _stat(
+                        name,
+                        "test",
+                        [
+                            (
+                                float(is_correct)
+                                if "match" in name or name in ("f1_score", "rouge_l")
+                                else float(num_tokens)
+                            )
+                        ],
+                    )
+                    for name in PER_INSTANCE_STAT_NAMES
+                ],
+            }
+        )
+
+    stats = [_stat(name, "test", correct) for name in STAT_NAMES[:8]]
+    stats += [
+        _stat(name, "test", [rng.random() * 100 for _ in range(num_instances)])
+        for name in STAT_NAMES[8:]
+    ]
+
+    adapter_spec = {
+        "method": "generation",
+        "global_prefix": "",
+        "instructions": "Answer the question.",
+        "input_prefix": "Passage: ",
+        "input_suffix": "\n",
+        "output_prefix": "Answer: ",
+        "output_suffix": "\n",
+        "instance_prefix": "\n",
+        "max_train_instances": 5,
+        "max_eval_instances": num_instances,
+        "num_outputs": 1,
+        "num_train_trials": 1,
+        "num_trials": 1,
+        "model_deployment": model,
+        "model": model,
+        "temperature": 0.0,
+        "max_tokens": 100,
+        "stop_sequences": ["\n"],
+    }
+    run_spec = {
+        "name": run_name,
+        "scenario_spec": {"class_name": class_name, "args": args},
+        "adapter_spec": adapter_spec,
+        "metric_specs": [
+            {"class_name": "helm.benchmark.metrics.basic_metrics.BasicGenerationMetric"}
+        ],
+        "data_augmenter_spec": {"perturbation_specs": []},
+        "groups": [scenario_name],
+    }
+    scenario_json = {
+        "name": scenario_name,
+        "description": f"Synthetic {scenario_name} scenario",
+        "tags": ["question_answering"],
+        "definition_path": f"helm/benchmark/scenarios/{scenario_name}_scenario.py",
+    }
+
+    files = {
+        "stats.json": stats,
+        "run_spec.json": run_spec,
+        "per_instance_stats.json": per_instance_stats,
+        "instances.json": instances,
+        "scenario.json": scenario_json,
+        "scenario_state.json": {
+            "adapter_spec": adapter_spec,
+            "request_states": request_states,
+        },
+    }
+    for file_name, content in files.items():
+        # HELM pretty-prints its output files
+        with (run_dir / file_name).open("w") as f:
+            json.dump(content, f, indent=2)
+
+
+def generate_benchmark_output(
+    root: str | Path = "benchmark_output/runs",
+    num_models: int = 5,
+    num_scenarios: int = 4,
+    days: int = 7,
+    runs_per_day: int = 4,
+    num_instances: int = 50,
+    prompt_words: int = 400,
+    start_date: Optional[datetime.date] = None,
+    seed: int = 0,
+) -> list[Path]:
+    """
+    Write a synthetic history of benchmark suites under *root*.
+
+    Scale is num_models x num_scenarios run directories per suite, with
+    runs_per_day suites per day for *days* days (e.g. 5 x 4 x 365 x 4).
+
+    Args:
+        root: runs directory to write into
+        num_models: number of models (cycles through MODELS_TO_RUN names)
+        num_scenarios: number of scenarios (up to the 4 in the lite conf)
+        days: number of days of history
+        runs_per_day: suites per day (spread over the day like the 4x daily cron)
+        num_instances: evaluation instances per run
+        prompt_words: words per prompt, controls scenario_state.json size
+        start_date: first day of history (default: *days* days ago)
+        seed: random seed for reproducible output
+
+    Returns:
+        list of suite directories written
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    start_date = start_date or (datetime.date.today() - datetime.timedelta(days=days))
+
+    models = [
+        MODELS_TO_RUN[i % len(MODELS_TO_RUN)]
+        + ("" if i < len(MODELS_TO_RUN) else f"-{i}")
+        for i in range(num_models)
+    ]
+    skills = {model: rng.uniform(0.5, 0.9) for model in models}
+    scenarios = SCENARIOS[:num_scenarios]
+
+    suite_dirs = []
+    for day in range(days):
+        date = start_date + datetime.timedelta(days=day)
+        for run_index in range(runs_per_day):
+            hour = RUN_HOURS[run_index % len(RUN_HOURS)] + rng.randint(0, 5)
+            run_timestamp = datetime.datetime.combine(
+                date, datetime.time(hour % 24, rng.randint(0, 59), rng.randint(0, 59))
+            )
+            suite_dir = root / f"results-{run_timestamp.strftime('%Y%m%d_%H%M%S')}"
+            for model in models:
+                for scenario in scenarios:
+                    write_scenario_run(
+                        suite_dir / _run_spec_name(scenario[0], model),
+                        model,
+                        scenario,
+                        run_timestamp,
+                        rng,
+                        num_instances=num_instances,
+                        prompt_words=prompt_words,
+                        model_skill=skills[model],
+                    )
+            suite_dirs.append(suite_dir)
+
+    return suite_dirs
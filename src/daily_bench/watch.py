@@ -0,0 +1,151 @@
+"""
+Extract scenario runs as soon as HELM finishes writing them.
+
+HELM writes each run spec to benchmark_output/runs/SUITE/RUN_SPEC/. A
+scenario directory counts as complete once stats.json and run_spec.json both
+exist and none of its JSON files have changed for a settle period, which
+debounces partially written files. Completed directories are appended to the
+summary CSV with extractor.extract_results_incremental(run_paths=...).
+
+Polling is used rather than inotify so the watcher behaves the same on
+Linux, macOS and network filesystems; each poll only lists suites whose
+directory changed since they were last fully ingested.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from daily_bench import extractor
+
+POLL_INTERVAL_SECONDS = 2.0
+SETTLE_SECONDS = 3.0
+
+# Files that must exist before a scenario directory can be complete
+REQUIRED_FILES = ("stats.json", "run_spec.json")
+
+Signature = tuple[tuple[str, int, int], ...]
+
+
+def scenario_signature(scenario_dir: Path) -> Optional[Signature]:
+    """
+    Name, mtime and size of every JSON file in *scenario_dir*.
+
+    Returns None until all REQUIRED_FILES exist.
+    """
+    try:
+        entries = [
+            (path.name, stat.st_mtime_ns, stat.st_size)
+            for path in scenario_dir.iterdir()
+            if path.suffix == ".json"
+            for stat in [path.stat()]
+        ]
+    except FileNotFoundError:
+        return None
+    names = {name for name, _, _ in entries}
+    if not all(name in names for name in REQUIRED_FILES):
+        return None
+    return tuple(sorted(entries))
+
+
+class ScenarioWatcher:
+    """Poll a runs directory and extract scenario directories once they settle."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        output_path: str | Path,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        settle_seconds: float = SETTLE_SECONDS,
+        on_extract: Optional[Callable[[list[Path]], None]] = None,
+    ):
+        self.root = Path(root)
+        self.output_path = Path(output_path)
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.on_extract = on_extract
+
+        # HELM names each scenario directory after its run spec, so the CSV's
+        # (run, run_name) pairs identify directories that are already ingested
+        self._known = extractor.get_existing_scenarios(self.output_path)
+        self._done: set[Path] = set()
+        self._pending: dict[Path, tuple[Signature, float]] = {}
+        # Suites whose scenarios are all done, with the directory mtime then
+        self._finished_suites: dict[Path, int] = {}
+
+    def poll_once(self, now: Optional[float] = None) -> list[Path]:
+        """Return scenario directories that are complete and not yet extracted."""
+        now = time.monotonic() if now is None else now
+        if not self.root.exists():
+            return []
+
+        ready = []
+        for suite_dir in sorted(self.root.iterdir()):
+            if not suite_dir.is_dir():
+                continue
+            suite_mtime = suite_dir.stat().st_mtime_ns
+            if self._finished_suites.get(suite_dir) == suite_mtime:
+                continue
+
+            finished = True
+            for scenario_dir in sorted(suite_dir.iterdir()):
+                if not scenario_dir.is_dir() or scenario_dir in self._done:
+                    continue
+                if (suite_dir.name, scenario_dir.name) in self._known:
+                    self._done.add(scenario_dir)
+                    continue
+
+                finished = False
+                signature = scenario_signature(scenario_dir)
+                if signature is None:
+                    self._pending.pop(scenario_dir, None)
+                    continue
+
+                previous = self._pending.get(scenario_dir)
+                if previous is None or previous[0] != signature:
+                    # New or still being written: restart the settle timer
+                    self._pending[scenario_dir] = (signature, now)
+                elif now - previous[1] >= self.settle_seconds:
+                    ready.append(scenario_dir)
+
+            if finished:
+                self._finished_suites[suite_dir] = suite_mtime
+
+        return ready
+
+    def extract(self, scenario_dirs: list[Path]) -> bool:
+        """Append *scenario_dirs* to the summary CSV; False if they must be retried."""
+        try:
+            extractor.extract_results_incremental(
+                self.root, self.output_path, run_paths=scenario_dirs
+            )
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # A file changed after it looked settled; wait for it to settle again
+            print(f"Watch: could not read a scenario yet ({e}); retrying")
+            for scenario_dir in scenario_dirs:
+                self._pending.pop(scenario_dir, None)
+            return False
+
+        for scenario_dir in scenario_dirs:
+            self._done.add(scenario_dir)
+            self._pending.pop(scenario_dir, None)
+        if self.on_extract is not None:
+            self.on_extract(scenario_dirs)
+        return True
+
+    def run_forever(self) -> None:
+        """Poll and extract until interrupted."""
+        print(
+            f"Watching {self.root} for completed scenarios "
+            f"(poll {self.poll_interval}s, settle {self.settle_seconds}s); "
+            "Ctrl-C to stop"
+        )
+        while True:
+            ready = self.poll_once()
+            if ready:
+                names = ", ".join(f"{d.parent.name}/{d.name}" for d in ready)
+                print(f"Watch: extracting {len(ready)} scenario(s): {names}")
+                if self.extract(ready):
+                    print(f"Watch: {self.output_path} updated")
+            time.sleep(self.poll_interval)
@@ -0,0 +1,15 @@
+"""Cold-start budget for the CLI's fast paths (`daily-bench bench --startup-only`)."""
+
+import pytest
+
+from daily_bench import benchmarks
+
+
+@pytest.mark.parametrize(
+    "args", benchmarks.STARTUP_COMMANDS, ids=lambda args: " ".join(args)
+)
+def test_cli_startup_within_budget(args: list[str]) -> None:
+    startup = benchmarks.measure_cli_startup(list(args))
+
+    assert startup["heavy_modules"] == []
+    assert startup["import_ms"] <= benchmarks.STARTUP_BUDGET_MS
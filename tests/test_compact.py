@@ -0,0 +1,60 @@
+"""Compacting finished suites into SUITE.zip archives (daily_bench.compact)."""
+
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+
+from daily_bench import compact, extractor, synthetic
+
+
+@pytest.fixture
+def runs_root(tmp_path: Path) -> Path:
+    root = tmp_path / "benchmark_output" / "runs"
+    synthetic.generate_benchmark_output(
+        root,
+        num_models=1,
+        num_scenarios=2,
+        days=1,
+        num_instances=5,
+        prompt_words=5,
+        start_date=datetime.date(2025, 6, 1),
+    )
+    # helm-summarize adds a groups/ directory next to the run specs
+    for suite_dir in root.iterdir():
+        groups_dir = suite_dir / "groups"
+        (groups_dir / "latex").mkdir(parents=True)
+        (groups_dir / "core_scenarios.json").write_text(json.dumps([{"title": "x"}]))
+        (groups_dir / "latex" / "core_scenarios_accuracy.tex").write_text("\\table")
+    return root
+
+
+def test_summarized_suite_is_finished(runs_root: Path) -> None:
+    suite_dir = next(runs_root.iterdir())
+
+    assert compact.is_finished(suite_dir, min_age=0)
+    assert not compact.is_finished(suite_dir, min_age=3600)
+
+
+def test_suite_with_a_running_run_spec_is_not_finished(runs_root: Path) -> None:
+    suite_dir = next(runs_root.iterdir())
+    next(suite_dir.glob("*/stats.json")).unlink()
+
+    assert not compact.is_finished(suite_dir, min_age=0)
+
+
+def test_compacted_suites_extract_the_same(runs_root: Path, tmp_path: Path) -> None:
+    before_path = tmp_path / "before" / "benchmark_summary.csv"
+    after_path = tmp_path / "after" / "benchmark_summary.csv"
+    extractor.extract_results(runs_root, before_path)
+    suites = sorted(path.name for path in runs_root.iterdir())
+
+    compacted = compact.compact_runs(runs_root, min_age=0)
+
+    assert sorted(path.name for path in compacted) == suites
+    assert sorted(path.name for path in runs_root.iterdir()) == [
+        suite + ".zip" for suite in suites
+    ]
+    extractor.extract_results(runs_root, after_path)
+    assert after_path.read_text() == before_path.read_text()
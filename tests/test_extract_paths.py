@@ -0,0 +1,70 @@
+"""Full, incremental and store-rebuilt summaries agree (daily_bench.extractor)."""
+
+import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from daily_bench import extractor, store, synthetic
+
+
+@pytest.fixture(scope="module")
+def runs_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("benchmark_output") / "runs"
+    synthetic.generate_benchmark_output(
+        root,
+        num_models=2,
+        num_scenarios=3,
+        days=2,
+        num_instances=5,
+        prompt_words=5,
+        start_date=datetime.date(2025, 6, 1),
+    )
+    return root
+
+
+def test_full_and_incremental_extract_write_the_same_csv(
+    runs_root: Path, tmp_path: Path
+) -> None:
+    full_path = tmp_path / "full" / "benchmark_summary.csv"
+    incremental_path = tmp_path / "incremental" / "benchmark_summary.csv"
+
+    extractor.extract_results(runs_root, full_path)
+    extractor.extract_results_incremental(runs_root, incremental_path)
+
+    assert incremental_path.read_text() == full_path.read_text()
+
+
+def test_store_rebuilds_the_extracted_layout(runs_root: Path, tmp_path: Path) -> None:
+    output_path = tmp_path / "benchmark_summary.csv"
+    extractor.extract_results(runs_root, output_path)
+
+    written = pd.read_csv(output_path)
+    rebuilt = store.wide_frame(store.db_path_for(output_path))
+
+    assert list(rebuilt.columns) == list(written.columns)
+    assert rebuilt["count"].dtype == written["count"].dtype == "int64"
+    key = ["run", "run_name", "name", "split"]
+    pd.testing.assert_frame_equal(
+        rebuilt.sort_values(key).reset_index(drop=True),
+        written.sort_values(key).reset_index(drop=True),
+    )
+
+
+def test_partly_ingested_suite_is_completed(runs_root: Path, tmp_path: Path) -> None:
+    output_path = tmp_path / "benchmark_summary.csv"
+    first_suite = sorted(runs_root.iterdir())[0]
+    extractor.extract_results_incremental(
+        runs_root, output_path, run_paths=sorted(first_suite.iterdir())[:1]
+    )
+
+    extractor.extract_results_incremental(runs_root, output_path)
+
+    full_path = tmp_path / "full" / "benchmark_summary.csv"
+    extractor.extract_results(runs_root, full_path)
+    key = ["run", "run_name", "name", "split"]
+    pd.testing.assert_frame_equal(
+        pd.read_csv(output_path).sort_values(key).reset_index(drop=True),
+        pd.read_csv(full_path).sort_values(key).reset_index(drop=True),
+    )
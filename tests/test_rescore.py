@@ -0,0 +1,57 @@
+"""Rescoring stored completions offline (daily_bench.rescore)."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from daily_bench import extractor, rescore
+
+# One suite in HELM's on-disk layout: a natural_qa run (with a perturbed
+# request and robustness stats) and a multiple-choice mmlu run
+RUNS_ROOT = Path(__file__).parent / "fixtures" / "helm_runs"
+
+COMPARED_METRICS = ["exact_match", "f1_score", "quasi_exact_match"]
+
+
+def test_rescored_means_agree_with_helm() -> None:
+    pairs = rescore.harvest_completions(RUNS_ROOT)
+    rescored = rescore.aggregate_scores(rescore.score_pairs(pairs))
+
+    agreement = rescore.compare_with_helm(
+        rescored, extractor.harvest_helm_stats(RUNS_ROOT)
+    )
+
+    # natural_qa reports all three metrics; mmlu exact and quasi-exact match
+    assert agreement["name"].tolist() == COMPARED_METRICS
+    assert agreement["compared"].tolist() == [2, 1, 2]
+    assert (agreement["matched"] == agreement["compared"]).all()
+    assert (agreement["max_difference"] <= rescore.MATCH_TOLERANCE).all()
+
+
+def test_perturbed_requests_are_skipped() -> None:
+    pairs = rescore.harvest_completions(RUNS_ROOT)
+
+    natural_qa = pairs[pairs["run_name"].str.startswith("natural_qa")]
+    assert sorted(natural_qa["instance_id"].unique()) == ["id1", "id2", "id3", "id4"]
+    assert "Lyon" not in natural_qa["prediction"].tolist()
+
+
+@pytest.mark.parametrize(
+    "prediction, reference, exact_match, quasi_exact_match",
+    [
+        ("", "", 1.0, 1.0),
+        ("", "Paris", 0.0, 0.0),
+        (" Paris ", "Paris", 1.0, 1.0),
+        ("The Paris.", "paris", 0.0, 1.0),
+    ],
+)
+def test_exact_match_follows_helm(
+    prediction: str, reference: str, exact_match: float, quasi_exact_match: float
+) -> None:
+    pairs = pd.DataFrame({"prediction": [prediction], "reference": [reference]})
+
+    scored = rescore.score_pairs(pairs, ["exact_match", "quasi_exact_match"])
+
+    assert scored.loc[0, "exact_match"] == exact_match
+    assert scored.loc[0, "quasi_exact_match"] == quasi_exact_match
@@ -0,0 +1,185 @@
+"""Adaptive-run decisions against history (daily_bench.sequential)."""
+
+import csv
+import math
+from pathlib import Path
+from statistics import NormalDist
+
+import pytest
+
+from daily_bench import sequential
+
+MODEL = "openai/gpt-4o-mini-2024-07-18"
+CLASS_NAME = "helm.benchmark.scenarios.natural_qa_scenario.NaturalQAScenario"
+
+# Both natural_qa entries of the conf share a scenario class
+OPENBOOK = "natural_qa:mode=openbook_longans,model=openai_gpt-4o-mini-2024-07-18"
+CLOSEDBOOK = "natural_qa:mode=closedbook,model=openai_gpt-4o-mini-2024-07-18"
+HISTORICAL_MEANS = {OPENBOOK: 0.72, CLOSEDBOOK: 0.32}
+
+# Standard error 0.5 / sqrt(100) = 0.05 for a 100-instance batch
+FLAT_HISTORY = sequential.History(
+    mean=0.5, between_run_variance=0.0, instance_stddev=0.5, num_runs=20
+)
+COUNT = 100
+ERROR = 0.05
+DRIFT_Z = NormalDist().inv_cdf(1 - sequential.ALPHA / 2)
+TOST_Z = NormalDist().inv_cdf(1 - sequential.ALPHA)
+
+
+def write_history(csv_path: Path, num_runs: int = 20) -> None:
+    columns = ["run", "run_timestamp", "run_kind", "run_name", "model"]
+    columns += ["scenario_class", "name", "split", "count", "mean", "stddev"]
+    with csv_path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, columns)
+        writer.writeheader()
+        for i in range(num_runs):
+            for run_name, level in HISTORICAL_MEANS.items():
+                mean = level + (0.02 if i % 2 else -0.02)
+                writer.writerow(
+                    {
+                        "run": f"results-202506{i + 1:02d}_120000",
+                        "run_timestamp": f"2025-06-{i + 1:02d} 12:00:00",
+                        "run_kind": "full",
+                        "run_name": run_name,
+                        "model": MODEL,
+                        "scenario_class": CLASS_NAME,
+                        "name": "exact_match",
+                        "split": "test",
+                        "count": 50,
+                        "mean": mean,
+                        "stddev": math.sqrt(mean * (1 - mean)),
+                    }
+                )
+
+
+def batch(means: dict[str, float], count: int = 50) -> list[dict]:
+    return [
+        {
+            "run_name": run_name,
+            "model": MODEL,
+            "scenario_class": CLASS_NAME,
+            "stats": {"exact_match": {"test": {"mean": mean, "count": count}}},
+        }
+        for run_name, mean in means.items()
+    ]
+
+
+def test_history_is_kept_per_run_spec(tmp_path: Path) -> None:
+    csv_path = tmp_path / "benchmark_summary.csv"
+    write_history(csv_path)
+
+    history = sequential.load_history(csv_path)
+
+    assert set(history) == {
+        (OPENBOOK, "exact_match", "test"),
+        (CLOSEDBOOK, "exact_match", "test"),
+    }
+    for run_name, level in HISTORICAL_MEANS.items():
+        series = history[(run_name, "exact_match", "test")]
+        assert series.num_runs == 20
+        assert math.isclose(series.mean, level)
+
+
+def test_drift_in_one_natural_qa_mode_is_detected(tmp_path: Path) -> None:
+    csv_path = tmp_path / "benchmark_summary.csv"
+    write_history(csv_path)
+    history = sequential.load_history(csv_path)
+
+    # Closed-book accuracy jumps by 0.2: within the spread of the two modes
+    # pooled together, but far outside closed-book's own history
+    decision, tests = sequential.decide_model(
+        batch({OPENBOOK: 0.72, CLOSEDBOOK: 0.52}), history
+    )
+
+    assert decision == sequential.DRIFT
+    by_run = {test["run_name"]: test for test in tests}
+    assert by_run[CLOSEDBOOK]["decision"] == sequential.DRIFT
+    assert math.isclose(by_run[CLOSEDBOOK]["historical_mean"], 0.32)
+
+
+def test_both_modes_at_their_history_stop_early(tmp_path: Path) -> None:
+    csv_path = tmp_path / "benchmark_summary.csv"
+    write_history(csv_path)
+    history = sequential.load_history(csv_path)
+
+    decision, tests = sequential.decide_model(batch(HISTORICAL_MEANS), history)
+
+    assert decision == sequential.EQUIVALENT
+    assert {test["decision"] for test in tests} == {sequential.EQUIVALENT}
+
+
+def compare(difference: float, margin: float = 0.2, **kwargs) -> tuple[str, float]:
+    return sequential.compare_batch(
+        0.5 + difference, COUNT, FLAT_HISTORY, full_count=COUNT, margin=margin, **kwargs
+    )
+
+
+@pytest.mark.parametrize("sign", [1, -1])
+def test_drift_boundary(sign: int) -> None:
+    above = DRIFT_Z * ERROR + 1e-6
+    below = DRIFT_Z * ERROR - 1e-6
+
+    assert compare(sign * above)[0] == sequential.DRIFT
+    assert compare(sign * below)[0] != sequential.DRIFT
+    decision, z = compare(sign * above)
+    assert math.isclose(z, sign * above / ERROR)
+
+
+def test_drift_threshold_is_split_across_looks() -> None:
+    difference = DRIFT_Z * ERROR + 1e-3
+
+    assert compare(difference)[0] == sequential.DRIFT
+    assert compare(difference, margin=0.1, num_looks=3)[0] == sequential.CONTINUE
+
+
+@pytest.mark.parametrize("sign", [1, -1])
+def test_equivalence_boundary(sign: int) -> None:
+    difference = sign * 0.01
+    # TOST needs |difference| + z_(1-alpha) * error strictly below the margin
+    threshold = 0.01 + TOST_Z * ERROR
+
+    assert compare(difference, margin=threshold + 1e-6)[0] == sequential.EQUIVALENT
+    assert compare(difference, margin=threshold - 1e-6)[0] == sequential.CONTINUE
+
+
+def test_default_margin_is_the_full_run_detectable_change() -> None:
+    margin = sequential.detectable_change(FLAT_HISTORY, COUNT)
+
+    assert compare(0.0, margin=None)[0] == sequential.EQUIVALENT
+    # A smaller batch has too much noise to show equivalence at the same margin
+    decision, _ = sequential.compare_batch(
+        0.5, 20, FLAT_HISTORY, full_count=COUNT, margin=margin
+    )
+    assert decision == sequential.CONTINUE
+
+
+def test_zero_error_compares_the_difference_with_the_margin() -> None:
+    exact = sequential.History(
+        mean=1.0, between_run_variance=0.0, instance_stddev=0.0, num_runs=20
+    )
+
+    assert sequential.compare_batch(0.99, 50, exact, 50, margin=0.02) == (
+        sequential.EQUIVALENT,
+        0.0,
+    )
+    assert sequential.compare_batch(0.9, 50, exact, 50, margin=0.02) == (
+        sequential.DRIFT,
+        0.0,
+    )
+
+
+@pytest.mark.parametrize(
+    "decision, current, expected",
+    [
+        (sequential.CONTINUE, 20, 35),
+        (sequential.CONTINUE, 35, 50),
+        (sequential.CONTINUE, 25, 35),
+        (sequential.CONTINUE, 50, None),
+        (sequential.DRIFT, 20, 50),
+        (sequential.DRIFT, 50, None),
+        (sequential.EQUIVALENT, 20, None),
+    ],
+)
+def test_next_batch_size(decision: str, current: int, expected: int | None) -> None:
+    assert sequential.next_batch_size(decision, current, (20, 35, 50)) == expected
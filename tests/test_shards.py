@@ -0,0 +1,102 @@
+"""Deduplicating and merging partial summaries (daily_bench.shards)."""
+
+import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from daily_bench import shards, synthetic
+
+KEY = ["run", "run_name", "name", "split"]
+
+
+@pytest.fixture(scope="module")
+def partial_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("benchmark_output") / "runs"
+    synthetic.generate_benchmark_output(
+        root,
+        num_models=2,
+        num_scenarios=2,
+        days=1,
+        num_instances=5,
+        prompt_words=5,
+        start_date=datetime.date(2025, 6, 1),
+    )
+    path = root.parent / "partial.csv"
+    shards.extract_shard([root], path)
+    return path
+
+
+def stat_rows(means: list[float], perturbation: object = float("nan")) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "run": "results-20250601_120000",
+            "run_name": "mmlu:subject=anatomy,model=openai_gpt-4o-mini-2024-07-18",
+            "name": "exact_match",
+            "split": "test",
+            "sub_split": float("nan"),
+            "perturbation": perturbation,
+            "count": 50,
+            "mean": means,
+            "_source": [f"source{i}" for i in range(len(means))],
+        }
+    )
+
+
+def test_equal_rows_without_perturbation_are_deduplicated() -> None:
+    # The second copy went through a CSV round-trip
+    merged, conflicts = shards.deduplicate(stat_rows([0.1 + 0.2, 0.3]), "_source")
+
+    assert len(merged) == 1
+    assert conflicts.empty
+
+
+@pytest.mark.parametrize("perturbation", [float("nan"), "robustness"])
+def test_differing_rows_are_reported_and_the_last_wins(perturbation: object) -> None:
+    merged, conflicts = shards.deduplicate(
+        stat_rows([0.3, 0.4], perturbation), "_source"
+    )
+
+    assert merged["mean"].tolist() == [0.4]
+    assert len(conflicts) == 1
+    assert conflicts.loc[0, "columns"] == "mean"
+    assert conflicts.loc[0, "sources"] == "source0 source1"
+
+
+def test_missing_value_conflicts_with_a_value() -> None:
+    merged, conflicts = shards.deduplicate(stat_rows([0.3, float("nan")]), "_source")
+
+    assert len(merged) == 1
+    assert conflicts.loc[0, "columns"] == "mean"
+
+
+def test_merge_prefers_the_last_partial_and_writes_conflicts(
+    partial_path: Path, tmp_path: Path
+) -> None:
+    # Summaries with perturbed runs have a perturbation column, empty for the
+    # unperturbed rows
+    partial = pd.read_csv(partial_path).assign(perturbation=float("nan"))
+    base_path = tmp_path / "partial.csv"
+    partial.to_csv(base_path, index=False)
+    changed = partial.copy()
+    changed.loc[0, "mean"] += 0.25
+    changed_path = tmp_path / "changed.csv"
+    changed.to_csv(changed_path, index=False)
+    output_path = tmp_path / "benchmark_summary.csv"
+
+    merged, conflicts = shards.merge_partials([base_path, changed_path], output_path)
+
+    assert len(merged) == len(partial)
+    assert len(conflicts) == 1
+    assert conflicts.loc[0, "sources"] == "changed.csv partial.csv"
+    written = pd.read_csv(output_path).set_index(KEY)
+    assert written.loc[tuple(changed.loc[0, KEY]), "mean"] == pytest.approx(
+        changed.loc[0, "mean"]
+    )
+    reported = pd.read_csv(output_path.with_name("merge_conflicts.csv"))
+    assert reported[KEY].values.tolist() == [changed.loc[0, KEY].tolist()]
+
+    # Merging again without the conflicting partial removes the stale report
+    shards.merge_partials([base_path], output_path, include_existing=False)
+    assert not output_path.with_name("merge_conflicts.csv").exists()